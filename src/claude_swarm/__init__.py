@@ -9,12 +9,36 @@ __version__ = "1.0.0"
 __author__ = "Claude Code Swarm Project"
 __email__ = "noreply@anthropic.com"
 
-from .core.coordinator import SwarmCoordinator
-from .core.planner import TaskPlanner
-from .core.distributor import TaskDistributor
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .core.coordinator import SwarmCoordinator
+    from .core.planner import TaskPlanner
+    from .core.distributor import TaskDistributor
 
 __all__ = [
     "SwarmCoordinator",
     "TaskPlanner", 
     "TaskDistributor",
-]
\ No newline at end of file
+]
+
+# Public names resolved on first access (PEP 562), so importing the package
+# (e.g. for __version__ or the CLI) does not load git, pydantic and friends.
+_LAZY_EXPORTS = {
+    "SwarmCoordinator": ".core.coordinator",
+    "TaskPlanner": ".core.planner",
+    "TaskDistributor": ".core.distributor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
@@ -4,30 +4,34 @@ Claude Swarm Coordinator CLI
 Main command-line interface for the Claude Swarm Coordinator.
 """
 
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
 from . import __version__
-from .core.coordinator import SwarmCoordinator
-from .core.planner import TaskPlanner
-from .core.distributor import TaskDistributor
-from .evaluation.dashboard import SwarmDashboard
-from .merge.strategies import SmartMerger
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Rich and the core/merge/dashboard modules are imported inside the commands
+# that use them, so `--version`, `--help` and shelling out stay fast.
+
+
+@functools.lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
 
 
 def print_version(ctx, param, value):
     """Print version and exit."""
     if not value or ctx.resilient_parsing:
         return
-    console.print(f"Claude Swarm Coordinator v{__version__}")
+    click.echo(f"Claude Swarm Coordinator v{__version__}")
     ctx.exit()
 
 
@@ -75,6 +79,10 @@ def cli(ctx: click.Context, verbose: bool) -> None:
 @click.pass_context
 def init(ctx: click.Context, project_name: str, agents: int, description: Optional[str]) -> None:
     """Initialize a new swarm project."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -123,6 +131,11 @@ def init(ctx: click.Context, project_name: str, agents: int, description: Option
 @click.pass_context
 def plan(ctx: click.Context, input_file: Path, project: Optional[str]) -> None:
     """Create task breakdown from requirements."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    from .core.planner import TaskPlanner
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -175,6 +188,10 @@ def plan(ctx: click.Context, input_file: Path, project: Optional[str]) -> None:
 @click.pass_context
 def launch(ctx: click.Context, mode: str, project: Optional[str]) -> None:
     """Launch the agent swarm."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -226,6 +243,10 @@ def launch(ctx: click.Context, mode: str, project: Optional[str]) -> None:
 @click.pass_context
 def status(ctx: click.Context, dashboard: bool, project: Optional[str]) -> None:
     """Show swarm status and progress."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -240,6 +261,7 @@ def status(ctx: click.Context, dashboard: bool, project: Optional[str]) -> None:
                 sys.exit(1)
         
         if dashboard:
+            from .evaluation.dashboard import SwarmDashboard
             dashboard_obj = SwarmDashboard(project)
             dashboard_obj.run()
         else:
@@ -282,6 +304,11 @@ def status(ctx: click.Context, dashboard: bool, project: Optional[str]) -> None:
 @click.pass_context
 def merge(ctx: click.Context, strategy: str, project: Optional[str]) -> None:
     """Merge completed agent work."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    from .merge.strategies import SmartMerger
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -341,6 +368,10 @@ def merge(ctx: click.Context, strategy: str, project: Optional[str]) -> None:
 @click.pass_context
 def cleanup(ctx: click.Context, force: bool, project: Optional[str]) -> None:
     """Clean up worktrees and project data."""
+    from rich.panel import Panel
+    from .core.coordinator import SwarmCoordinator
+    console = _console()
+    
     verbose = ctx.obj.get("verbose", False)
     
     try:
@@ -382,6 +413,7 @@ def cleanup(ctx: click.Context, force: bool, project: Optional[str]) -> None:
 def docs() -> None:
     """Open documentation in browser."""
     import webbrowser
+    console = _console()
     webbrowser.open("https://claude-swarm-coordinator.readthedocs.io")
     console.print("📖 Opening documentation in browser...")
 
@@ -390,7 +422,9 @@ def docs() -> None:
 @click.argument("project_name", required=False)
 def example(project_name: Optional[str]) -> None:
     """Show example project or list available examples."""
+    from rich.panel import Panel
     from .utils.examples import ExampleManager
+    console = _console()
     
     manager = ExampleManager()
     
@@ -422,10 +456,11 @@ def main() -> None:
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n👋 Goodbye!")
+        _console().print("\n👋 Goodbye!")
         sys.exit(0)
     except Exception as e:
-        console.print(Panel(
+        from rich.panel import Panel
+        _console().print(Panel(
             f"❌ Unexpected error: {e}",
             title="Fatal Error",
             border_style="red"
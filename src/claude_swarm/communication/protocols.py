@@ -4,21 +4,116 @@ Communication Protocols for Claude Swarm
 Manages inter-agent communication through file-based protocols.
 """
 
-import json
+import asyncio
+import functools
+import os
+import sqlite3
+import threading
 import time
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple, Type, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, model_validator
 
-from ..utils.helpers import setup_logging
+from ..utils.helpers import dumps_json, dumps_json_line, loads_json, setup_logging, write_files
 
 logger = setup_logging(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
-class Blocker(BaseModel):
+# Loads of this many files or more are spread over the I/O pool
+_PARALLEL_LOAD_THRESHOLD = 16
+_LOAD_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 4),
+    thread_name_prefix="swarm-load"
+)
+
+# Parsed coordination files keyed by path: {path: (st_mtime_ns, st_size, model)},
+# least recently used first and capped at _ENTITY_CACHE_SIZE entries. Shared by
+# all coordinators in the process so unchanged files are never re-read; the lock
+# covers loads running on _LOAD_POOL.
+_ENTITY_CACHE_SIZE = 4096
+_ENTITY_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_ENTITY_CACHE_LOCK = threading.Lock()
+
+
+# File name of an entity in each indexed channel, formatted with its key field
+_ENTITY_FILES = {'blockers': "{}.json", 'shared': "SHARED-{}.json"}
+
+
+def _cache_get(path: str) -> Optional[Tuple[int, int, Any]]:
+    """Look up a cached coordination file, marking it recently used."""
+    with _ENTITY_CACHE_LOCK:
+        cached = _ENTITY_CACHE.get(path)
+        if cached is not None:
+            _ENTITY_CACHE.move_to_end(path)
+        return cached
+
+
+def _cache_put(path: str, mtime_ns: int, size: int, value: Any) -> None:
+    """Cache a parsed coordination file, evicting the least recently used."""
+    with _ENTITY_CACHE_LOCK:
+        _ENTITY_CACHE[path] = (mtime_ns, size, value)
+        _ENTITY_CACHE.move_to_end(path)
+        if len(_ENTITY_CACHE) > _ENTITY_CACHE_SIZE:
+            _ENTITY_CACHE.popitem(last=False)
+
+
+def _copy(entity: ModelT) -> ModelT:
+    """Return a copy of a cached model that callers are free to mutate."""
+    # Deep, since list fields such as SharedResource.used_by would be shared
+    return entity.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: Type[ModelT]) -> TypeAdapter[List[ModelT]]:
+    """Return the module-wide validator for a list of ``model`` records."""
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+def _from_ns(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a ``time.time_ns()`` timestamp to an aware UTC datetime."""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+
+
+class TimestampedModel(BaseModel):
+    """
+    Base model for coordination records with integer timestamps.
+    
+    Timestamps are stored as ``time.time_ns()`` integers in ``*_at_ns`` fields.
+    Files written before the switch carry ISO datetimes under the old
+    ``*_at`` names and are converted on load.
+    """
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _convert_datetime_fields(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        
+        for name in ('created_at', 'resolved_at', 'read_at'):
+            if name not in data or f"{name}_ns" not in cls.model_fields:
+                continue
+            
+            value = data.pop(name)
+            if value is None or f"{name}_ns" in data:
+                continue
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            data[f"{name}_ns"] = int(value.timestamp() * 1e9)
+        
+        return data
+
+
+class Blocker(TimestampedModel):
     """Blocker notification model."""
     
     id: str
@@ -28,12 +123,20 @@ class Blocker(BaseModel):
     description: str
     impact: str
     status: str = "open"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    resolved_at: Optional[datetime] = None
+    created_at_ns: int = Field(default_factory=time.time_ns)
+    resolved_at_ns: Optional[int] = None
     resolution: Optional[str] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
+    
+    @property
+    def resolved_at(self) -> Optional[datetime]:
+        return _from_ns(self.resolved_at_ns)
 
 
-class SharedResource(BaseModel):
+class SharedResource(TimestampedModel):
     """Shared resource model."""
     
     id: str
@@ -42,11 +145,15 @@ class SharedResource(BaseModel):
     file_path: str
     description: str
     usage_example: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at_ns: int = Field(default_factory=time.time_ns)
     used_by: List[str] = Field(default_factory=list)
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
 
 
-class Message(BaseModel):
+class Message(TimestampedModel):
     """Inter-agent message model."""
     
     id: str
@@ -56,8 +163,16 @@ class Message(BaseModel):
     body: str
     priority: str = "normal"
     status: str = "unread"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    read_at: Optional[datetime] = None
+    created_at_ns: int = Field(default_factory=time.time_ns)
+    read_at_ns: Optional[int] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at_ns / 1e9, tz=timezone.utc)
+    
+    @property
+    def read_at(self) -> Optional[datetime]:
+        return _from_ns(self.read_at_ns)
 
 
 class CommunicationCoordinator:
@@ -68,25 +183,472 @@ class CommunicationCoordinator:
     messages, and progress reporting between agents.
     """
     
-    def __init__(self, project_name: str, repo_root: Path):
+    # Coordination directories already created by this process
+    _created_dirs: Set[Path] = set()
+    _created_dirs_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        project_name: str,
+        repo_root: Path,
+        write_markdown: Optional[bool] = None
+    ):
         """
         Initialize the communication coordinator.
         
         Args:
             project_name: Name of the project
             repo_root: Root path of the git repository
+            write_markdown: Also write a markdown copy of each blocker and shared
+                resource (defaults to the CLAUDE_SWARM_WRITE_MD environment variable)
         """
         self.project_name = project_name
         self.repo_root = Path(repo_root)
         self.coord_dir = self.repo_root / ".swarm-coordination" / project_name
         
+        if write_markdown is None:
+            write_markdown = os.environ.get("CLAUDE_SWARM_WRITE_MD", "0") == "1"
+        self._write_markdown = write_markdown
+        
+        # Channel directory mtimes as of the last check for unindexed files
+        self._reconciled: Dict[str, int] = {}
+        
+        # Per-thread connections to the sqlite index of the messages channel
+        self._message_conns = threading.local()
+        
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
         """Ensure all coordination directories exist."""
-        dirs = ['blockers', 'shared', 'dependencies', 'reports', 'messages']
-        for dir_name in dirs:
-            (self.coord_dir / dir_name).mkdir(parents=True, exist_ok=True)
+        # A single stat still catches a coordination directory removed by cleanup
+        message_db = self.coord_dir / 'messages.db'
+        if self.coord_dir in self._created_dirs and message_db.exists():
+            return
+        
+        with self._created_dirs_lock:
+            dirs = ['blockers', 'shared', 'dependencies', 'reports', 'messages']
+            for dir_name in dirs:
+                (self.coord_dir / dir_name).mkdir(parents=True, exist_ok=True)
+            
+            conn = sqlite3.connect(str(message_db), timeout=30)
+            try:
+                conn.executescript(
+                    "CREATE TABLE IF NOT EXISTS messages ("
+                    " id TEXT PRIMARY KEY, to_agent TEXT NOT NULL, status TEXT NOT NULL,"
+                    " created_at_ns INTEGER NOT NULL, read_at_ns INTEGER, file TEXT NOT NULL);"
+                    "CREATE INDEX IF NOT EXISTS idx_to_status"
+                    " ON messages(to_agent, status, created_at_ns);"
+                )
+            finally:
+                conn.close()
+            self._created_dirs.add(self.coord_dir)
+    
+    def invalidate(self, path: Path) -> None:
+        """
+        Drop a coordination file from the read cache.
+        
+        Args:
+            path: Path of the file that was written or removed
+        """
+        with _ENTITY_CACHE_LOCK:
+            _ENTITY_CACHE.pop(str(path), None)
+    
+    def _append_index(
+        self,
+        channel: str,
+        record: Dict[str, Any],
+        file_name: str = "index.ndjson"
+    ) -> None:
+        """
+        Append a record to a channel's ``index.ndjson``.
+        
+        The index is the read path for a channel: ``create`` records hold a
+        full entity, ``update`` records hold the fields changed since and
+        ``delete`` records drop an entity that was archived.
+        Writes use ``O_APPEND`` so concurrent agents never interleave lines.
+        
+        Args:
+            channel: Channel directory name ('blockers', 'shared' or 'messages')
+            record: Record to append
+            file_name: Log file to append to (e.g. the blocker archive or message deltas)
+        """
+        index_file = self.coord_dir / channel / file_name
+        fd = os.open(index_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, dumps_json_line(record))
+        finally:
+            os.close(fd)
+        self.invalidate(index_file)
+    
+    def _seed_index(self, channel: str, prefix: str, model: Type[BaseModel]) -> None:
+        """Build a channel index from existing entity files if it does not exist yet."""
+        if (self.coord_dir / channel / "index.ndjson").exists():
+            return
+        
+        entities = self._scan_entities(self.coord_dir / channel, prefix, model, channel)
+        for entity in entities:
+            self._append_index(channel, {'op': 'create', **entity.model_dump(mode="json")})
+        
+        if not entities:
+            (self.coord_dir / channel / "index.ndjson").touch()
+    
+    def _load_index(
+        self,
+        channel: str,
+        model: Type[ModelT],
+        key: str,
+        file_name: str = "index.ndjson"
+    ) -> Optional[List[ModelT]]:
+        """
+        Fold a channel index into its current entities.
+        
+        Args:
+            channel: Channel directory name
+            model: Model class of the channel's entities
+            key: Record field identifying an entity
+            file_name: Log file to fold
+            
+        Returns:
+            Current entities, or None if the channel has no index
+        """
+        folded = self._fold_index(channel, model, key, file_name)
+        if folded is None:
+            return None
+        return [_copy(entity) for entity in folded[0]]
+    
+    def _fold_index(
+        self,
+        channel: str,
+        model: Type[ModelT],
+        key: str,
+        file_name: str = "index.ndjson"
+    ) -> Optional[Tuple[List[ModelT], Set[str]]]:
+        """
+        Fold a channel index through the mtime/size cache.
+        
+        The returned models are the cached ones; callers must copy them
+        before handing them out.
+        
+        Returns:
+            (current entities, keys of deleted entities), or None if the
+            channel has no index
+        """
+        index_file = self.coord_dir / channel / file_name
+        
+        try:
+            stat = index_file.stat()
+        except FileNotFoundError:
+            return None
+        
+        path = str(index_file)
+        cached = _cache_get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        records: Dict[str, Dict[str, Any]] = {}
+        deleted: Set[str] = set()
+        for line in index_file.read_bytes().splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = loads_json(line)
+            except ValueError as e:
+                logger.error(f"Skipping malformed record in {index_file}: {e}")
+                continue
+            
+            op = record.pop('op', 'create')
+            if op == 'update':
+                if record.get(key) in records:
+                    records[record[key]].update(record)
+            elif op == 'delete':
+                records.pop(record.get(key), None)
+                deleted.add(record.get(key))
+            else:
+                records[record[key]] = record
+                deleted.discard(record[key])
+        
+        # Validate the whole index in one pydantic-core call; only fall back to
+        # per-record validation (to skip the bad ones) if that fails
+        try:
+            entities = _list_adapter(model).validate_python(list(records.values()))
+        except ValidationError:
+            entities = []
+            for record in records.values():
+                try:
+                    entities.append(model.model_validate(record))
+                except Exception as e:
+                    logger.error(f"Failed to load {channel} record {record.get(key)}: {e}")
+        
+        _cache_put(path, stat.st_mtime_ns, stat.st_size, (entities, deleted))
+        return entities, deleted
+    
+    def _load_channel(
+        self,
+        channel: str,
+        prefix: str,
+        model: Type[ModelT],
+        key: str
+    ) -> List[ModelT]:
+        """
+        Load a channel from its index, scanning entity files if it has none.
+        
+        Entity files can arrive without an index record, e.g. pulled through
+        git or written by older clients. Whenever the channel directory
+        changed since the last check, files whose key is not in the index are
+        loaded and appended to it as ``create`` records.
+        """
+        folded = self._fold_index(channel, model, key)
+        if folded is None:
+            return self._scan_entities(self.coord_dir / channel, prefix, model, channel)
+        
+        entities, deleted = folded
+        known = {getattr(entity, key) for entity in entities} | deleted
+        return [_copy(entity) for entity in entities] + self._index_new_files(
+            channel, prefix, model, known
+        )
+    
+    def _index_new_files(
+        self,
+        channel: str,
+        prefix: str,
+        model: Type[ModelT],
+        known: Set[str]
+    ) -> List[ModelT]:
+        """
+        Add entity files missing from a channel index to it.
+        
+        The directory is only listed when its mtime changed since the last
+        check, so reads of an unchanged channel cost one stat.
+        
+        Args:
+            channel: Channel directory name
+            prefix: Filename prefix of the entity files
+            model: Model class to validate the files against
+            known: Keys of the entities the index already holds or deleted
+            
+        Returns:
+            Entities loaded from the unindexed files
+        """
+        directory = self.coord_dir / channel
+        try:
+            dir_mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        
+        if self._reconciled.get(channel) == dir_mtime_ns:
+            return []
+        
+        file_format = _ENTITY_FILES[channel]
+        indexed = {file_format.format(name) for name in known}
+        with os.scandir(directory) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.json')
+                and entry.name not in indexed
+            ]
+        
+        found = self.load_many(paths, model, channel)
+        for entity in found:
+            self._append_index(channel, {'op': 'create', **entity.model_dump(mode="json")})
+        
+        # A file still being written fails to load; look again on the next read
+        if len(found) == len(paths):
+            self._reconciled[channel] = dir_mtime_ns
+        return found
+    
+    def _scan_entities(
+        self,
+        directory: Path,
+        prefix: str,
+        model: Type[ModelT],
+        label: str
+    ) -> List[ModelT]:
+        """
+        Load every ``{prefix}*.json`` file in a directory.
+        
+        Files are validated straight from bytes by pydantic-core, without an
+        intermediate dict. Files whose mtime and size are unchanged since the
+        last scan are served from the cache without being opened at all.
+        
+        Args:
+            directory: Directory to scan
+            prefix: Filename prefix of the entity files
+            model: Model class to validate the files against
+            label: Entity name used in error messages
+            
+        Returns:
+            List of loaded models (unsorted)
+        """
+        if not directory.exists():
+            return []
+        
+        with os.scandir(directory) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.json')
+            ]
+        
+        return self.load_many(paths, model, label)
+    
+    def load_many(self, paths: List[str], model: Type[ModelT], label: str) -> List[ModelT]:
+        """
+        Load several entity files, in parallel for large batches.
+        
+        Reads and pydantic-core validation of big directories are spread over a
+        shared thread pool; small batches are loaded inline. Files that fail to
+        load are logged and skipped.
+        
+        Args:
+            paths: File paths to load
+            model: Model class to validate the files against
+            label: Entity name used in error messages
+            
+        Returns:
+            Loaded models, in the order of ``paths``
+        """
+        def load(path: str) -> Optional[ModelT]:
+            try:
+                return self._load_entity(path, model)
+            except Exception as e:
+                logger.error(f"Failed to read {label} {path}: {e}")
+                return None
+        
+        if len(paths) >= _PARALLEL_LOAD_THRESHOLD:
+            results = list(_LOAD_POOL.map(load, paths))
+        else:
+            results = [load(path) for path in paths]
+        
+        return [entity for entity in results if entity is not None]
+    
+    def _load_entity(
+        self,
+        path: str,
+        model: Type[ModelT],
+        stat: Optional[os.stat_result] = None
+    ) -> ModelT:
+        """
+        Load a single entity file through the mtime/size cache.
+        
+        Args:
+            path: File path
+            model: Model class to validate the file against
+            stat: Already-known stat result for the file
+            
+        Returns:
+            Loaded model
+        """
+        if stat is None:
+            stat = os.stat(path)
+        
+        cached = _cache_get(path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return _copy(cached[2])
+        
+        with open(path, 'rb') as f:
+            entity = model.model_validate_json(f.read())
+        _cache_put(path, stat.st_mtime_ns, stat.st_size, entity)
+        return _copy(entity)
+    
+    def _message_db(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection to the sqlite index of the messages channel.
+        
+        The index maps ``(to_agent, status)`` to message files so lookups do
+        not have to read every message, and holds the current status of each
+        message. Its schema is created by ``_ensure_directories``; sqlite
+        connections cannot cross threads, so each thread opens its own once.
+        
+        Returns:
+            Open database connection
+        """
+        conn: Optional[sqlite3.Connection] = getattr(self._message_conns, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.coord_dir / 'messages.db'), timeout=30)
+            self._message_conns.conn = conn
+        return conn
+    
+    def _index_new_messages(self, conn: sqlite3.Connection) -> None:
+        """
+        Add message files missing from the sqlite index to it.
+        
+        Covers the files present when the index is first built and those that
+        arrive later without a row (git pull, older clients), with
+        ``messages/deltas.ndjson`` folded over them. As with
+        ``_index_new_files``, the directory is only listed when its mtime
+        changed since the last check.
+        
+        Args:
+            conn: Connection to the messages index
+        """
+        messages_dir = self.coord_dir / 'messages'
+        try:
+            dir_mtime_ns = messages_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        
+        if self._reconciled.get('messages') == dir_mtime_ns:
+            return
+        
+        indexed = {file_name for (file_name,) in conn.execute("SELECT file FROM messages")}
+        with os.scandir(messages_dir) as entries:
+            paths = [
+                entry.path for entry in entries
+                if entry.name.startswith("MSG-") and entry.name.endswith('.json')
+                and entry.name not in indexed
+            ]
+        
+        found = self.load_many(paths, Message, "message")
+        if found:
+            deltas = self._load_deltas('messages')
+            with conn:
+                for message in found:
+                    if message.id in deltas:
+                        message = message.model_copy(update=deltas[message.id])
+                    self._index_message(conn, message)
+        
+        # A file still being written fails to load; look again on the next read
+        if len(found) == len(paths):
+            self._reconciled['messages'] = dir_mtime_ns
+    
+    def _load_deltas(self, channel: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Fold a channel's ``deltas.ndjson`` into the latest changed fields per id.
+        
+        Args:
+            channel: Channel directory name
+            
+        Returns:
+            Mapping of entity id to its changed fields
+        """
+        deltas_file = self.coord_dir / channel / "deltas.ndjson"
+        deltas: Dict[str, Dict[str, Any]] = {}
+        
+        if not deltas_file.exists():
+            return deltas
+        
+        for line in deltas_file.read_bytes().splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = loads_json(line)
+            except ValueError as e:
+                logger.error(f"Skipping malformed record in {deltas_file}: {e}")
+                continue
+            
+            record.pop('op', None)
+            deltas.setdefault(record.pop('id'), {}).update(record)
+        
+        return deltas
+    
+    def _index_message(self, conn: sqlite3.Connection, message: Message) -> None:
+        """Insert or refresh a message row in the sqlite index."""
+        conn.execute(
+            "INSERT OR REPLACE INTO messages"
+            " (id, to_agent, status, created_at_ns, read_at_ns, file)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (message.id, message.to_agent, message.status,
+             message.created_at_ns, message.read_at_ns, f"{message.id}.json")
+        )
     
     def post_blocker(
         self,
@@ -121,27 +683,29 @@ class CommunicationCoordinator:
             impact=impact
         )
         
-        # Write blocker file
+        data = blocker.model_dump(mode="json")
+        
+        # Write blocker file (and markdown for easy reading, if enabled) in one batch
+        self._seed_index('blockers', "BLOCKER-", Blocker)
         blocker_file = self.coord_dir / 'blockers' / f"{blocker_id}.json"
-        with open(blocker_file, 'w') as f:
-            json.dump(blocker.model_dump(), f, indent=2, default=str)
-        
-        # Also create markdown for easy reading
-        md_file = self.coord_dir / 'blockers' / f"{blocker_id}.md"
-        with open(md_file, 'w') as f:
-            f.write(f"# {title}\n\n")
-            f.write(f"**Agent**: {agent_id}\n")
-            f.write(f"**Task**: {task_id}\n")
-            f.write(f"**Created**: {blocker.created_at}\n\n")
-            f.write(f"## Description\n{description}\n\n")
-            f.write(f"## Impact\n{impact}\n")
+        files = [(blocker_file, dumps_json(data))]
+        if self._write_markdown:
+            md_file = self.coord_dir / 'blockers' / f"{blocker_id}.md"
+            files.append((md_file, self._blocker_markdown(blocker).encode('utf-8')))
+        write_files(files)
+        self.invalidate(blocker_file)
+        self._append_index('blockers', {'op': 'create', **data})
         
         logger.info(f"Posted blocker {blocker_id} from {agent_id}")
         return blocker_id
     
     def resolve_blocker(self, blocker_id: str, resolution: str) -> bool:
         """
-        Mark a blocker as resolved.
+        Mark a blocker as resolved and move it to the blocker archive.
+        
+        Resolved blockers are appended to ``blockers/archive.ndjson`` as
+        compact JSON lines and their per-blocker files are removed, so open
+        blocker lookups never load resolved history.
         
         Args:
             blocker_id: ID of the blocker to resolve
@@ -157,16 +721,19 @@ class CommunicationCoordinator:
             return False
         
         try:
-            with open(blocker_file, 'r') as f:
-                blocker_data = json.load(f)
-            
-            blocker = Blocker(**blocker_data)
+            self._seed_index('blockers', "BLOCKER-", Blocker)
+            blocker = Blocker.model_validate_json(blocker_file.read_bytes())
             blocker.status = 'resolved'
-            blocker.resolved_at = datetime.utcnow()
+            blocker.resolved_at_ns = time.time_ns()
             blocker.resolution = resolution
             
-            with open(blocker_file, 'w') as f:
-                json.dump(blocker.model_dump(), f, indent=2, default=str)
+            # Archive first so a crash in between never loses the blocker
+            self._append_index('blockers', blocker.model_dump(mode="json"), "archive.ndjson")
+            self._append_index('blockers', {'op': 'delete', 'id': blocker_id})
+            
+            for path in (blocker_file, blocker_file.with_suffix('.md')):
+                path.unlink(missing_ok=True)
+                self.invalidate(path)
             
             logger.info(f"Resolved blocker {blocker_id}")
             return True
@@ -196,7 +763,9 @@ class CommunicationCoordinator:
         Returns:
             Resource ID
         """
-        resource_id = hashlib.md5(f"{resource_name}{agent_id}".encode()).hexdigest()[:8]
+        resource_id = hashlib.blake2b(
+            f"{resource_name}{agent_id}".encode(), digest_size=4
+        ).hexdigest()
         
         resource = SharedResource(
             id=resource_id,
@@ -207,24 +776,81 @@ class CommunicationCoordinator:
             usage_example=usage_example
         )
         
-        # Write resource file
+        data = resource.model_dump(mode="json")
+        
+        # Write resource file (and markdown documentation, if enabled) in one batch
+        self._seed_index('shared', "SHARED-", SharedResource)
         resource_file = self.coord_dir / 'shared' / f"SHARED-{resource_name}.json"
-        with open(resource_file, 'w') as f:
-            json.dump(resource.model_dump(), f, indent=2, default=str)
-        
-        # Create markdown documentation
-        md_file = self.coord_dir / 'shared' / f"SHARED-{resource_name}.md"
-        with open(md_file, 'w') as f:
-            f.write(f"# SHARED RESOURCE: {resource_name}\n\n")
-            f.write(f"**Created By**: {agent_id}\n")
-            f.write(f"**Location**: `{file_path}`\n")
-            f.write(f"**Created**: {resource.created_at}\n\n")
-            f.write(f"## Description\n{description}\n\n")
-            f.write(f"## Usage Example\n```\n{usage_example}\n```\n")
+        files = [(resource_file, dumps_json(data))]
+        if self._write_markdown:
+            md_file = self.coord_dir / 'shared' / f"SHARED-{resource_name}.md"
+            files.append((md_file, self._resource_markdown(resource).encode('utf-8')))
+        write_files(files)
+        self.invalidate(resource_file)
+        self._append_index('shared', {'op': 'create', **data})
         
         logger.info(f"Shared resource {resource_name} from {agent_id}")
         return resource_id
     
+    def render_blocker_markdown(self, blocker_id: str) -> Optional[str]:
+        """
+        Render a blocker as markdown for human reading.
+        
+        Args:
+            blocker_id: ID of the blocker to render
+            
+        Returns:
+            Markdown text, or None if the blocker does not exist
+        """
+        blocker_file = self.coord_dir / 'blockers' / f"{blocker_id}.json"
+        
+        if not blocker_file.exists():
+            archived = [b for b in self._load_archive() if b.id == blocker_id]
+            return self._blocker_markdown(archived[0]) if archived else None
+        
+        return self._blocker_markdown(Blocker.model_validate_json(blocker_file.read_bytes()))
+    
+    def render_resource_markdown(self, resource_name: str) -> Optional[str]:
+        """
+        Render a shared resource as markdown documentation.
+        
+        Args:
+            resource_name: Name of the shared resource
+            
+        Returns:
+            Markdown text, or None if the resource does not exist
+        """
+        resource_file = self.coord_dir / 'shared' / f"SHARED-{resource_name}.json"
+        
+        if not resource_file.exists():
+            return None
+        
+        return self._resource_markdown(
+            SharedResource.model_validate_json(resource_file.read_bytes())
+        )
+    
+    def _blocker_markdown(self, blocker: Blocker) -> str:
+        """Build the markdown view of a blocker."""
+        return (
+            f"# {blocker.title}\n\n"
+            f"**Agent**: {blocker.agent_id}\n"
+            f"**Task**: {blocker.task_id}\n"
+            f"**Created**: {blocker.created_at}\n\n"
+            f"## Description\n{blocker.description}\n\n"
+            f"## Impact\n{blocker.impact}\n"
+        )
+    
+    def _resource_markdown(self, resource: SharedResource) -> str:
+        """Build the markdown documentation of a shared resource."""
+        return (
+            f"# SHARED RESOURCE: {resource.name}\n\n"
+            f"**Created By**: {resource.created_by}\n"
+            f"**Location**: `{resource.file_path}`\n"
+            f"**Created**: {resource.created_at}\n\n"
+            f"## Description\n{resource.description}\n\n"
+            f"## Usage Example\n```\n{resource.usage_example}\n```\n"
+        )
+    
     def send_message(
         self,
         from_agent: str,
@@ -258,8 +884,12 @@ class CommunicationCoordinator:
         )
         
         msg_file = self.coord_dir / 'messages' / f"{msg_id}.json"
-        with open(msg_file, 'w') as f:
-            json.dump(message.model_dump(), f, indent=2, default=str)
+        write_files([(msg_file, dumps_json(message.model_dump(mode="json")))])
+        self.invalidate(msg_file)
+        
+        conn = self._message_db()
+        with conn:
+            self._index_message(conn, message)
         
         logger.info(f"Sent message from {from_agent} to {to_agent}")
         return msg_id
@@ -275,51 +905,99 @@ class CommunicationCoordinator:
         Returns:
             List of messages
         """
-        messages = []
+        conn = self._message_db()
+        self._index_new_messages(conn)
+        rows = conn.execute(
+            "SELECT file, read_at_ns FROM messages WHERE to_agent = ? AND status = ?"
+            " ORDER BY created_at_ns",
+            (agent_id, status)
+        ).fetchall()
+        
+        messages: List[Optional[Message]] = []
+        misses: List[str] = []
         messages_dir = self.coord_dir / 'messages'
         
-        if not messages_dir.exists():
-            return messages
+        for file_name, read_at_ns in rows:
+            msg_file = str(messages_dir / file_name)
+            
+            # Only status and read_at_ns ever change after a message is sent, and
+            # they live in the index row rather than the file, so a cached
+            # message matching the row is current without touching the file.
+            cached = _cache_get(msg_file)
+            if cached and cached[2].status == status and cached[2].read_at_ns == read_at_ns:
+                messages.append(_copy(cached[2]))
+            else:
+                messages.append(None)
+                misses.append(msg_file)
         
-        for msg_file in messages_dir.glob("MSG-*.json"):
-            try:
-                with open(msg_file, 'r') as f:
-                    msg_data = json.load(f)
+        if misses:
+            loaded = {m.id: m for m in self.load_many(misses, Message, "message")}
+            for i, (file_name, read_at_ns) in enumerate(rows):
+                message = loaded.get(Path(file_name).stem)
+                if messages[i] is not None or message is None:
+                    continue
                 
-                message = Message(**msg_data)
-                if message.to_agent == agent_id and message.status == status:
-                    messages.append(message)
-                    
-            except Exception as e:
-                logger.error(f"Failed to read message {msg_file}: {e}")
+                if message.status != status or message.read_at_ns != read_at_ns:
+                    message = message.model_copy(
+                        update={'status': status, 'read_at_ns': read_at_ns}
+                    )
+                    # Cache the current state under the unchanged file's key
+                    msg_file = str(messages_dir / file_name)
+                    cached = _cache_get(msg_file)
+                    if cached:
+                        _cache_put(msg_file, cached[0], cached[1], _copy(message))
+                messages[i] = message
         
-        return sorted(messages, key=lambda m: m.created_at)
+        return [m for m in messages if m is not None]
+    
+    async def get_messages_async(self, agent_id: str, status: str = 'unread') -> List[Message]:
+        """
+        Get messages for an agent without blocking the event loop.
+        
+        The read runs in the loop's default executor, which keeps agents that
+        poll from asyncio code responsive on slow (e.g. network) filesystems.
+        
+        Args:
+            agent_id: Agent ID to get messages for
+            status: Message status to filter by
+            
+        Returns:
+            List of messages
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.get_messages, agent_id, status)
+        )
     
     def mark_message_read(self, msg_id: str) -> bool:
         """
         Mark a message as read.
         
+        The message file is left untouched: the change is appended to
+        ``messages/deltas.ndjson`` and applied to the sqlite index row.
+        
         Args:
             msg_id: Message ID to mark as read
             
         Returns:
             True if successful, False otherwise
         """
-        msg_file = self.coord_dir / 'messages' / f"{msg_id}.json"
-        
-        if not msg_file.exists():
-            return False
+        read_at_ns = time.time_ns()
         
         try:
-            with open(msg_file, 'r') as f:
-                msg_data = json.load(f)
-            
-            message = Message(**msg_data)
-            message.status = 'read'
-            message.read_at = datetime.utcnow()
-            
-            with open(msg_file, 'w') as f:
-                json.dump(message.model_dump(), f, indent=2, default=str)
+            conn = self._message_db()
+            self._index_new_messages(conn)
+            with conn:
+                updated = conn.execute(
+                    "UPDATE messages SET status = 'read', read_at_ns = ? WHERE id = ?",
+                    (read_at_ns, msg_id)
+                ).rowcount
+                if not updated:
+                    return False
+                
+                self._append_index('messages', {
+                    'op': 'update', 'id': msg_id, 'status': 'read', 'read_at_ns': read_at_ns
+                }, "deltas.ndjson")
             
             return True
             
@@ -337,25 +1015,47 @@ class CommunicationCoordinator:
         Returns:
             List of blockers
         """
-        blockers = []
-        blockers_dir = self.coord_dir / 'blockers'
+        blockers = self._scan_blockers().get(status, [])
         
-        if not blockers_dir.exists():
-            return blockers
+        # Only resolved lookups read the archive
+        if status == 'resolved':
+            blockers = sorted(blockers + self._load_archive(), key=lambda b: b.created_at_ns)
         
-        for blocker_file in blockers_dir.glob("BLOCKER-*.json"):
-            try:
-                with open(blocker_file, 'r') as f:
-                    blocker_data = json.load(f)
-                
-                blocker = Blocker(**blocker_data)
-                if blocker.status == status:
-                    blockers.append(blocker)
-                    
-            except Exception as e:
-                logger.error(f"Failed to read blocker {blocker_file}: {e}")
+        return blockers
+    
+    def _load_archive(self) -> List[Blocker]:
+        """Load the resolved blockers moved to ``blockers/archive.ndjson``."""
+        return self._load_index('blockers', Blocker, 'id', "archive.ndjson") or []
+    
+    def _scan_blockers(self) -> Dict[str, List[Blocker]]:
+        """
+        Load the live (not archived) blockers once and bucket them by status.
+        
+        Returns:
+            Mapping of status to blockers sorted by creation time
+        """
+        buckets: Dict[str, List[Blocker]] = {}
+        blockers = self._load_channel('blockers', "BLOCKER-", Blocker, 'id')
+        
+        for blocker in sorted(blockers, key=lambda b: b.created_at_ns):
+            buckets.setdefault(blocker.status, []).append(blocker)
+        
+        return buckets
+    
+    async def get_blockers_async(self, status: str = 'open') -> List[Blocker]:
+        """
+        Get blockers by status without blocking the event loop.
         
-        return sorted(blockers, key=lambda b: b.created_at)
+        Args:
+            status: Blocker status to filter by
+            
+        Returns:
+            List of blockers
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.get_blockers, status)
+        )
     
     def get_shared_resources(self) -> List[SharedResource]:
         """
@@ -364,24 +1064,9 @@ class CommunicationCoordinator:
         Returns:
             List of shared resources
         """
-        resources = []
-        shared_dir = self.coord_dir / 'shared'
-        
-        if not shared_dir.exists():
-            return resources
+        resources = self._load_channel('shared', "SHARED-", SharedResource, 'name')
         
-        for resource_file in shared_dir.glob("SHARED-*.json"):
-            try:
-                with open(resource_file, 'r') as f:
-                    resource_data = json.load(f)
-                
-                resource = SharedResource(**resource_data)
-                resources.append(resource)
-                
-            except Exception as e:
-                logger.error(f"Failed to read resource {resource_file}: {e}")
-        
-        return sorted(resources, key=lambda r: r.created_at)
+        return sorted(resources, key=lambda r: r.created_at_ns)
     
     def get_coordination_summary(self) -> Dict[str, Any]:
         """
@@ -390,13 +1075,14 @@ class CommunicationCoordinator:
         Returns:
             Summary dictionary
         """
-        blockers = self.get_blockers('open')
+        buckets = self._scan_blockers()
+        blockers = buckets.get('open', [])
         resources = self.get_shared_resources()
         
         summary = {
             'blockers': {
                 'open': len(blockers),
-                'resolved': len(self.get_blockers('resolved')),
+                'resolved': len(buckets.get('resolved', [])) + len(self._load_archive()),
                 'list': [{'id': b.id, 'agent': b.agent_id, 'title': b.title} for b in blockers]
             },
             'shared_resources': [
@@ -409,6 +1095,12 @@ class CommunicationCoordinator:
         return summary
 
 
+@functools.lru_cache(maxsize=None)
+def _get_coordinator(project_name: str, repo_root: str) -> CommunicationCoordinator:
+    """Return the process-wide coordinator for a project."""
+    return CommunicationCoordinator(project_name, Path(repo_root))
+
+
 class AgentCommunicator:
     """
     Communication interface for individual agents.
@@ -427,7 +1119,8 @@ class AgentCommunicator:
             repo_root: Root path of the git repository
         """
         self.agent_id = agent_id
-        self.coordinator = CommunicationCoordinator(project_name, repo_root)
+        # All agents of a project share one coordinator (and its caches)
+        self.coordinator = _get_coordinator(project_name, str(Path(repo_root)))
     
     def report_blocker(
         self,
@@ -2,23 +2,43 @@
 SwarmCoordinator - Main coordination class for managing agent swarms.
 """
 
-import json
+import io
+import mmap
 import os
+import shlex
 import subprocess
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 
-import git
 from pydantic import BaseModel, Field
 
-from ..utils.git import GitWorktreeManager
-from ..utils.helpers import generate_id, setup_logging
+from ..utils.helpers import (
+    dumps_json, find_repo_root, generate_id, git_dir_for, lazy_import, setup_logging, utc_now,
+    write_files
+)
 from .planner import TaskPlanner
 from .distributor import TaskDistributor
 
+if TYPE_CHECKING:
+    import git
+    
+    from ..utils.git import GitWorktreeManager
+else:
+    # GitPython is the most expensive import here; load it when a repo is opened
+    git = lazy_import("git")
+
 logger = setup_logging(__name__)
 
+AGENT_REGISTRY_HEADER = (
+    "agent_id,branch_name,worktree_path,status,tasks_assigned,tasks_completed,last_commit,last_update\n"
+)
+TASK_REGISTRY_HEADER = (
+    "task_id,description,category,complexity,dependencies,assigned_agent,status,start_time,end_time,commits\n"
+)
+
 
 class ProjectConfig(BaseModel):
     """Configuration for a swarm project."""
@@ -27,9 +47,36 @@ class ProjectConfig(BaseModel):
     num_agents: int
     branch_prefix: str = "swarm-agent"
     worktree_dir: str = "../swarm-worktrees"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     status: str = "initialized"
     description: Optional[str] = None
+    share_objects: bool = True
+
+
+def _dump_config(config: ProjectConfig) -> bytes:
+    """
+    Serialize a project configuration for ``config/swarm.json``.
+    
+    The fields are known and few, so they are listed directly instead of
+    going through Pydantic's serializer; the output has the same fields and
+    layout as ``model_dump_json(indent=2)``.
+    
+    Args:
+        config: Project configuration
+        
+    Returns:
+        Encoded JSON
+    """
+    return dumps_json({
+        "project_name": config.project_name,
+        "num_agents": config.num_agents,
+        "branch_prefix": config.branch_prefix,
+        "worktree_dir": config.worktree_dir,
+        "created_at": config.created_at.isoformat(),
+        "status": config.status,
+        "description": config.description,
+        "share_objects": config.share_objects,
+    })
 
 
 class SwarmCoordinator:
@@ -57,16 +104,64 @@ class SwarmCoordinator:
         # Ensure directories exist
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         
-        # Git repository handling
-        try:
-            self.repo = git.Repo(self.work_dir, search_parent_directories=True)
-            self.repo_root = Path(self.repo.working_tree_dir)
-        except git.InvalidGitRepositoryError:
-            raise ValueError(f"Not in a git repository: {self.work_dir}")
+        # Git repository handling: most commands only need the root, so find
+        # it on the filesystem and open the repository (self.repo) on demand
+        repo_root = self._find_repo_root(self.work_dir)
+        if repo_root is None:
+            # Let GitPython search too; it also honours GIT_DIR and friends
+            try:
+                self.repo = git.Repo(self.work_dir, search_parent_directories=True)
+                repo_root = Path(self.repo.working_tree_dir)
+            except git.InvalidGitRepositoryError:
+                raise ValueError(f"Not in a git repository: {self.work_dir}") from None
+        self.repo_root = repo_root
+        
+        # Last loaded configuration: (st_mtime_ns, st_size, config)
+        self._config_cache: Optional[Tuple[int, int, ProjectConfig]] = None
+        self._base_branch: Optional[str] = None
+    
+    _find_repo_root = staticmethod(find_repo_root)
+    
+    def _current_branch(self) -> str:
+        """
+        Get the checked-out branch of the repository, read straight from HEAD.
         
-        # Initialize managers
-        self.git_manager = GitWorktreeManager(self.repo_root)
+        Returns:
+            Branch name, or the commit id if HEAD is detached
+        """
+        if self._base_branch is not None:
+            return self._base_branch
         
+        head = None
+        git_dir = git_dir_for(self.repo_root)
+        if git_dir is not None:
+            try:
+                head = (git_dir / "HEAD").read_text().strip()
+            except OSError:
+                pass
+        
+        if head is None:
+            # No plain HEAD file (e.g. GIT_DIR elsewhere); let GitPython resolve it
+            head = f"ref: refs/heads/{self.repo.active_branch.name}"
+        
+        prefix = "ref: refs/heads/"
+        self._base_branch = head[len(prefix):] if head.startswith(prefix) else head
+        return self._base_branch
+    
+    @cached_property
+    def repo(self) -> "git.Repo":
+        """The GitPython repository, opened on first use."""
+        try:
+            return git.Repo(self.repo_root)
+        except git.InvalidGitRepositoryError:
+            raise ValueError(f"Not in a git repository: {self.work_dir}") from None
+    
+    @cached_property
+    def git_manager(self) -> "GitWorktreeManager":
+        """Worktree manager for the repository, created on first use."""
+        from ..utils.git import GitWorktreeManager
+        return GitWorktreeManager(self.repo_root)
+    
     @classmethod
     def get_active_project(cls) -> Optional[str]:
         """Get the currently active project name."""
@@ -115,27 +210,33 @@ class SwarmCoordinator:
             "templates"
         ]
         
-        for dir_name in directories:
-            (self.project_dir / dir_name).mkdir(parents=True, exist_ok=True)
-        
-        # Save configuration
-        config_file = self.project_dir / "config" / "swarm.json"
-        with open(config_file, 'w') as f:
-            json.dump(config.model_dump(), f, indent=2, default=str)
-        
-        # Initialize registries
-        self._create_registries(num_agents)
-        
-        # Set as active project
-        self.set_active_project()
-        
-        # Create coordination directory in repo
+        # Coordination directory in repo
         coord_dir = self.repo_root / ".swarm-coordination" / self.project_name
         coord_dirs = ["blockers", "shared", "dependencies", "reports", "messages"]
-        for dir_name in coord_dirs:
-            (coord_dir / dir_name).mkdir(parents=True, exist_ok=True)
         
-        # Create README for coordination
+        # The paths are independent, so overlap the round-trips (which add up
+        # on network filesystems): all directories first, then the files
+        paths = [self.project_dir / d for d in directories] + [coord_dir / d for d in coord_dirs]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda path: path.mkdir(parents=True, exist_ok=True), paths))
+            
+            futures = [
+                # Save configuration
+                pool.submit(self._save_config, config),
+                # Initialize registries
+                pool.submit(self._create_registries, num_agents),
+                # Set as active project
+                pool.submit(self.set_active_project),
+                # Create README for coordination
+                pool.submit(self._write_coordination_readme, coord_dir),
+            ]
+            for future in futures:
+                future.result()
+        
+        logger.info(f"Project {self.project_name} initialized successfully")
+    
+    def _write_coordination_readme(self, coord_dir: Path) -> None:
+        """Write the README of the coordination directory."""
         readme_content = f"""# Swarm Coordination Directory
 
 This directory contains coordination files for the {self.project_name} swarm.
@@ -152,20 +253,14 @@ This directory is in the main repository for coordination purposes.
 Agents should read from here but commit changes through their own branches.
 """
         (coord_dir / "README.md").write_text(readme_content)
-        
-        logger.info(f"Project {self.project_name} initialized successfully")
     
     def _create_registries(self, num_agents: int) -> None:
         """Create agent and task registries."""
         # Agent registry
-        agent_registry = self.project_dir / "registry" / "agents.csv"
-        with open(agent_registry, 'w') as f:
-            f.write("agent_id,branch_name,worktree_path,status,tasks_assigned,tasks_completed,last_commit,last_update\n")
+        (self.project_dir / "registry" / "agents.csv").write_text(AGENT_REGISTRY_HEADER)
         
         # Task registry
-        task_registry = self.project_dir / "registry" / "tasks.csv"
-        with open(task_registry, 'w') as f:
-            f.write("task_id,description,category,complexity,dependencies,assigned_agent,status,start_time,end_time,commits\n")
+        (self.project_dir / "registry" / "tasks.csv").write_text(TASK_REGISTRY_HEADER)
         
         # Initialize empty agent entries
         for i in range(1, num_agents + 1):
@@ -205,84 +300,142 @@ Agents should read from here but commit changes through their own branches.
         """Create git worktrees for all agents."""
         logger.info(f"Creating {config.num_agents} worktrees")
         
-        base_branch = self.repo.active_branch.name
+        base_branch = self._current_branch()
+        # One timestamp for the whole batch
+        now_iso = utc_now().isoformat()
         worktree_parent = self.repo_root / config.worktree_dir / config.project_name
         worktree_parent.mkdir(parents=True, exist_ok=True)
         
-        for i in range(1, config.num_agents + 1):
-            agent_id = f"agent-{i}"
-            branch_name = f"{config.branch_prefix}-{config.project_name}-{i}"
-            worktree_path = worktree_parent / agent_id
-            
-            # Create worktree
-            self.git_manager.create_worktree(
-                path=worktree_path,
-                branch=branch_name,
-                base_branch=base_branch
-            )
-            
-            # Create agent configuration
-            agent_config_dir = worktree_path / ".swarm"
-            agent_config_dir.mkdir(exist_ok=True)
-            
-            agent_config = {
-                "agent_id": agent_id,
-                "project_name": config.project_name,
-                "branch_name": branch_name,
-                "worktree_path": str(worktree_path),
-                "created_at": datetime.utcnow().isoformat(),
-                "base_branch": base_branch
-            }
-            
-            with open(agent_config_dir / "agent.json", 'w') as f:
-                json.dump(agent_config, f, indent=2)
-            
-            # Initialize progress log
-            progress_file = agent_config_dir / "progress.log"
-            progress_file.write_text(f"Agent {i} initialized at {datetime.utcnow()}\n")
-            
-            # Update agent registry
-            self._update_agent_registry(agent_id, branch_name, str(worktree_path))
+        # Each agent is one `git worktree add` subprocess; run them concurrently
+        results = []
+        max_workers = min(config.num_agents, (os.cpu_count() or 1) * 2) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self._provision_agent, i, config, base_branch, worktree_parent, now_iso)
+                for i in range(1, config.num_agents + 1)
+            ]
+            for future in as_completed(futures):
+                agent_id, branch_name, worktree_path = future.result()
+                results.append((agent_id, branch_name, worktree_path))
+                
+                if verbose:
+                    logger.info(f"Created worktree for {agent_id} at {worktree_path}")
+        
+        # Registry rows in agent order, written once
+        results.sort(key=lambda result: int(result[0].rsplit('-', 1)[1]))
+        self._update_agent_registry_bulk(results, now_iso)
+    
+    def _provision_agent(
+        self,
+        i: int,
+        config: ProjectConfig,
+        base_branch: str,
+        worktree_parent: Path,
+        now_iso: str
+    ) -> Tuple[str, str, str]:
+        """
+        Create the worktree and agent files for a single agent.
+        
+        Args:
+            i: Agent number (1-based)
+            config: Project configuration
+            base_branch: Branch the agent branches from
+            worktree_parent: Directory holding the project's worktrees
+            now_iso: Creation timestamp (ISO 8601)
             
-            if verbose:
-                logger.info(f"Created worktree for {agent_id} at {worktree_path}")
+        Returns:
+            (agent_id, branch_name, worktree_path) tuple
+        """
+        agent_id = f"agent-{i}"
+        branch_name = f"{config.branch_prefix}-{config.project_name}-{i}"
+        worktree_path = worktree_parent / agent_id
+        
+        # Create worktree
+        self.git_manager.create_worktree(
+            path=worktree_path,
+            branch=branch_name,
+            base_branch=base_branch,
+            reference=self.repo_root if config.share_objects else None
+        )
+        
+        # Create agent configuration
+        agent_config_dir = worktree_path / ".swarm"
+        try:
+            os.mkdir(agent_config_dir)
+        except FileExistsError:
+            pass
+        
+        agent_config = {
+            "agent_id": agent_id,
+            "project_name": config.project_name,
+            "branch_name": branch_name,
+            "worktree_path": str(worktree_path),
+            "created_at": now_iso,
+            "base_branch": base_branch
+        }
+        
+        # Write the config and initialize the progress log
+        write_files([
+            (agent_config_dir / "agent.json", dumps_json(agent_config)),
+            (agent_config_dir / "progress.log", f"Agent {i} initialized at {now_iso}\n".encode()),
+        ])
+        
+        return agent_id, branch_name, str(worktree_path)
     
     def _update_agent_registry(self, agent_id: str, branch_name: str, worktree_path: str) -> None:
         """Update the agent registry with new agent information."""
+        self._update_agent_registry_bulk([(agent_id, branch_name, worktree_path)])
+    
+    def _update_agent_registry_bulk(
+        self,
+        agents: List[Tuple[str, str, str]],
+        timestamp: Optional[str] = None
+    ) -> None:
+        """
+        Append several agents to the agent registry in a single write.
+        
+        The header is written by ``_create_registries``, so existing rows are
+        never read back or rewritten.
+        
+        Args:
+            agents: (agent_id, branch_name, worktree_path) tuples
+            timestamp: last_update value (ISO 8601, defaults to now)
+        """
         registry_file = self.project_dir / "registry" / "agents.csv"
         
-        # Read existing entries
-        entries = []
-        if registry_file.exists():
-            with open(registry_file, 'r') as f:
-                lines = f.readlines()
-                entries = lines[1:]  # Skip header
-        
-        # Add new entry
-        new_entry = f"{agent_id},{branch_name},{worktree_path},initialized,0,0,,{datetime.utcnow().isoformat()}\n"
-        entries.append(new_entry)
-        
-        # Write back
-        with open(registry_file, 'w') as f:
-            f.write("agent_id,branch_name,worktree_path,status,tasks_assigned,tasks_completed,last_commit,last_update\n")
-            f.writelines(entries)
+        now = timestamp or utc_now().isoformat()
+        rows = [
+            f"{agent_id},{branch_name},{worktree_path},initialized,0,0,,{now}\n"
+            for agent_id, branch_name, worktree_path in agents
+        ]
+        
+        if not registry_file.exists():
+            rows.insert(0, AGENT_REGISTRY_HEADER)
+        
+        with open(registry_file, 'a', buffering=1 << 16) as f:
+            f.writelines(rows)
     
     def _generate_launch_instructions(self, config: ProjectConfig, mode: str) -> None:
         """Generate launch instructions for agents."""
         launch_dir = self.project_dir / "launch"
         launch_dir.mkdir(exist_ok=True)
         
-        # Generate individual launch scripts
-        for i in range(1, config.num_agents + 1):
-            agent_id = f"agent-{i}"
-            worktree_path = self.repo_root / config.worktree_dir / config.project_name / agent_id
-            
-            script_content = f"""#!/bin/bash
-echo "Starting {agent_id} for {config.project_name}"
-echo "Worktree: {worktree_path}"
+        # Generate one launch script that takes the agent number
+        worktree_parent = self.repo_root / config.worktree_dir / config.project_name
+        script_content = f"""#!/bin/bash
+# Usage: start_agent.sh <agent number 1-{config.num_agents}>
+AGENT="$1"
+if ! [[ "$AGENT" =~ ^[0-9]+$ ]] || [ "$AGENT" -lt 1 ] || [ "$AGENT" -gt {config.num_agents} ]; then
+    echo "Usage: $0 <agent number 1-{config.num_agents}>"
+    exit 1
+fi
+WORKTREE={shlex.quote(str(worktree_parent))}/agent-$AGENT
+
+echo "Starting agent-$AGENT for {config.project_name}"
+echo "Worktree: $WORKTREE"
 echo ""
 echo "Instructions:"
-echo "1. cd {worktree_path}"
+echo "1. cd $WORKTREE"
 echo "2. Run 'claude' to start Claude Code"
 echo "3. Tell Claude: 'Read .swarm/agent_instructions.md and begin working on assigned tasks'"
 echo ""
@@ -291,23 +444,33 @@ echo ""
 echo "Press Enter to continue..."
 read
 """
-            
-            script_file = launch_dir / f"start_{agent_id}.sh"
-            script_file.write_text(script_content)
-            script_file.chmod(0o755)
         
-        # Generate README
+        script_file = launch_dir / "start_agent.sh"
+        script_file.write_text(script_content)
+        script_file.chmod(0o755)
+        
+        # Generate README, building both per-agent lists in one pass
+        worktree_parent_str = str(worktree_parent)
+        terminals = io.StringIO()
+        agents = io.StringIO()
+        for i in range(1, config.num_agents + 1):
+            if i > 1:
+                terminals.write("\n")
+                agents.write("\n")
+            terminals.write(f"Terminal {i}: ./start_agent.sh {i}")
+            agents.write(f"Agent {i}:\n  cd {worktree_parent_str}/agent-{i}\n  claude\n")
+        
         readme_content = f"""# Agent Launch Instructions
 
 ## Manual Launch
 Open {config.num_agents} terminal windows and run:
 
-{chr(10).join([f"Terminal {i}: ./start_agent-{i}.sh" for i in range(1, config.num_agents + 1)])}
+{terminals.getvalue()}
 
 ## Direct Agent Start
 For each agent, you can also:
 
-{chr(10).join([f"Agent {i}:" + chr(10) + f"  cd {self.repo_root / config.worktree_dir / config.project_name / f'agent-{i}'}" + chr(10) + "  claude" + chr(10) for i in range(1, config.num_agents + 1)])}
+{agents.getvalue()}
 
 ## Important Notes
 - Each agent must work in their assigned worktree
@@ -333,23 +496,29 @@ For each agent, you can also:
         completed_tasks = 0
         
         if task_registry.exists():
-            with open(task_registry, 'r') as f:
-                lines = f.readlines()[1:]  # Skip header
-                total_tasks = len(lines)
-                completed_tasks = sum(1 for line in lines if ",completed," in line)
+            total_tasks, completed_tasks = self._count_registry_tasks(task_registry)
         
         # Count blockers (simplified)
         coord_dir = self.repo_root / ".swarm-coordination" / self.project_name / "blockers"
         open_blockers = 0
         if coord_dir.exists():
-            open_blockers = len(list(coord_dir.glob("BLOCKER-*.json")))
-        
-        # Recent commits (simplified)
+            with os.scandir(coord_dir) as entries:
+                open_blockers = sum(
+                    1 for entry in entries
+                    if entry.name.startswith("BLOCKER-") and entry.name.endswith(".json")
+                )
+        
+        # Recent commits (simplified): one rev-list pipe that only counts oids,
+        # without loading GitPython or decoding commit objects
         recent_commits = 0
         try:
-            commits = list(self.repo.iter_commits(max_count=10))
-            recent_commits = len(commits)
-        except:
+            result = subprocess.run(
+                ['git', 'rev-list', '--count', '--max-count=10', 'HEAD'],
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+            if result.returncode == 0:
+                recent_commits = int(result.stdout.strip())
+        except (OSError, ValueError):
             pass
         
         return {
@@ -361,6 +530,33 @@ For each agent, you can also:
             "recent_commits": recent_commits
         }
     
+    def _count_registry_tasks(self, task_registry: Path) -> Tuple[int, int]:
+        """
+        Count total and completed tasks in a tasks.csv registry.
+        
+        The file is memory-mapped and counted with C-level ``bytes.count``
+        instead of being split into Python lines.
+        
+        Args:
+            task_registry: Path to tasks.csv
+            
+        Returns:
+            (total_tasks, completed_tasks) tuple
+        """
+        with open(task_registry, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0, 0
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                # mmap.count() only exists on Python 3.13+; older versions count
+                # over a single C-level copy of the mapping
+                data = mm if hasattr(mm, 'count') else mm[:]
+                lines = data.count(b"\n") + (0 if data[-1:] == b"\n" else 1)
+                return lines - 1, data.count(b",completed,")  # Skip header
+    
     def cleanup_project(self, verbose: bool = False) -> None:
         """Clean up worktrees and project data."""
         logger.info(f"Cleaning up project: {self.project_name}")
@@ -371,51 +567,166 @@ For each agent, you can also:
         archive_tag = f"archive/{self.project_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         
         # Archive branches
-        for i in range(1, config.num_agents + 1):
-            branch_name = f"{config.branch_prefix}-{self.project_name}-{i}"
-            try:
-                self.repo.create_tag(f"{archive_tag}-agent-{i}", branch_name)
-                if verbose:
-                    logger.info(f"Archived branch {branch_name}")
-            except:
-                pass
+        self._archive_branches(config, archive_tag, verbose)
         
         # Remove worktrees
         worktree_parent = self.repo_root / config.worktree_dir / config.project_name
         if worktree_parent.exists():
-            for i in range(1, config.num_agents + 1):
-                agent_id = f"agent-{i}"
-                worktree_path = worktree_parent / agent_id
-                if worktree_path.exists():
-                    self.git_manager.remove_worktree(worktree_path)
-                    if verbose:
-                        logger.info(f"Removed worktree: {worktree_path}")
+            worktree_paths = [
+                worktree_parent / f"agent-{i}" for i in range(1, config.num_agents + 1)
+                if (worktree_parent / f"agent-{i}").exists()
+            ]
+            
+            # One `git worktree remove` per agent, run concurrently
+            if worktree_paths:
+                with ThreadPoolExecutor(max_workers=min(len(worktree_paths), 8)) as pool:
+                    removed = list(pool.map(self.git_manager.remove_worktree, worktree_paths))
+                
+                if verbose:
+                    for worktree_path, ok in zip(worktree_paths, removed):
+                        if ok:
+                            logger.info(f"Removed worktree: {worktree_path}")
+            
+            # Clear administrative data of anything that was removed by hand
+            self.git_manager.prune_worktrees()
         
         # Archive coordination directory
         coord_dir = self.repo_root / ".swarm-coordination" / self.project_name
         if coord_dir.exists():
             import shutil
-            archive_path = self.project_dir / f"coordination-archive-{datetime.now().strftime('%Y%m%d-%H%M%S')}.tar.gz"
-            shutil.make_archive(str(archive_path.with_suffix('')), 'gztar', coord_dir)
+            archive_path = self._archive_directory(
+                coord_dir,
+                self.project_dir / f"coordination-archive-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            )
             shutil.rmtree(coord_dir)
             if verbose:
                 logger.info(f"Archived coordination directory to {archive_path}")
         
         # Update project status
         config.status = "cleaned"
-        config_file = self.project_dir / "config" / "swarm.json"
-        with open(config_file, 'w') as f:
-            json.dump(config.model_dump(), f, indent=2, default=str)
+        self._save_config(config)
         
         logger.info("Project cleanup completed")
     
+    def _archive_branches(self, config: ProjectConfig, archive_tag: str, verbose: bool = False) -> None:
+        """
+        Tag every existing agent branch under ``archive_tag``.
+        
+        Branch tips are resolved with one ``git for-each-ref`` and all tags are
+        created in one ``git update-ref --stdin`` transaction, instead of one
+        ``git tag`` process per agent.
+        
+        Args:
+            config: Project configuration
+            archive_tag: Tag name prefix
+            verbose: Log each archived branch
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'for-each-ref', '--format=%(objectname) %(refname:short)', 'refs/heads/'],
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+        except OSError as e:
+            logger.error(f"Failed to list branches for archiving: {e}")
+            return
+        
+        if result.returncode != 0:
+            logger.error(f"Failed to list branches for archiving: {result.stderr.strip()}")
+            return
+        
+        tips = {}
+        for line in result.stdout.splitlines():
+            oid, _, branch_name = line.partition(' ')
+            tips[branch_name] = oid
+        
+        commands = []
+        archived = []
+        for i in range(1, config.num_agents + 1):
+            branch_name = f"{config.branch_prefix}-{self.project_name}-{i}"
+            if branch_name in tips:
+                commands.append(f"create refs/tags/{archive_tag}-agent-{i} {tips[branch_name]}\n")
+                archived.append(branch_name)
+        
+        if not commands:
+            return
+        
+        result = subprocess.run(
+            ['git', 'update-ref', '--stdin'],
+            input=''.join(commands), capture_output=True, text=True, cwd=self.repo_root
+        )
+        if result.returncode != 0:
+            logger.error(f"Failed to create archive tags: {result.stderr.strip()}")
+            return
+        
+        if verbose:
+            for branch_name in archived:
+                logger.info(f"Archived branch {branch_name}")
+    
+    def _archive_directory(self, source: Path, archive_stem: Path) -> Path:
+        """
+        Stream a directory into a compressed tarball.
+        
+        Uses multi-threaded zstd when the optional ``zstandard`` package is
+        installed and gzip otherwise. The tar stream is written straight
+        into the compressor, without an intermediate uncompressed file.
+        
+        Args:
+            source: Directory to archive
+            archive_stem: Archive path without extension
+            
+        Returns:
+            Path of the written archive
+        """
+        import tarfile
+        
+        try:
+            import zstandard
+        except ImportError:  # pragma: no cover - optional speedup
+            zstandard = None
+        
+        if zstandard is not None:
+            archive_path = archive_stem.with_name(archive_stem.name + ".tar.zst")
+            compressor = zstandard.ZstdCompressor(level=10, threads=-1)
+            with open(archive_path, 'wb') as fh, compressor.stream_writer(fh) as stream:
+                with tarfile.open(fileobj=stream, mode='w|') as tar:
+                    tar.add(source, arcname='.')
+        else:
+            import gzip
+            archive_path = archive_stem.with_name(archive_stem.name + ".tar.gz")
+            with gzip.open(archive_path, 'wb', compresslevel=6) as stream:
+                with tarfile.open(fileobj=stream, mode='w|') as tar:
+                    tar.add(source, arcname='.')
+        
+        return archive_path
+    
     def _load_config(self) -> ProjectConfig:
         """Load project configuration."""
         config_file = self.project_dir / "config" / "swarm.json"
-        if not config_file.exists():
-            raise FileNotFoundError(f"Project configuration not found: {config_file}")
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Project configuration not found: {config_file}") from None
+        
+        # Reuse the parsed config while the file is unchanged
+        cached = self._config_cache
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        config = ProjectConfig.model_validate_json(config_file.read_bytes())
+        self._config_cache = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+    
+    def _save_config(self, config: ProjectConfig) -> None:
+        """
+        Write the project configuration and cache it for _load_config().
         
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
+        The config was built and validated in-process, so loading it back
+        does not need to parse and validate the file again.
         
-        return ProjectConfig(**config_data)
\ No newline at end of file
+        Args:
+            config: Project configuration to save
+        """
+        config_file = self.project_dir / "config" / "swarm.json"
+        config_file.write_bytes(_dump_config(config))
+        stat = config_file.stat()
+        self._config_cache = (stat.st_mtime_ns, stat.st_size, config)
\ No newline at end of file
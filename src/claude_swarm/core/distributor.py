@@ -5,19 +5,100 @@ Intelligently distributes tasks among agents based on complexity, dependencies,
 """
 
 import csv
-import json
+import functools
+import heapq
+import io
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 from pydantic import BaseModel
 
-from ..utils.helpers import setup_logging
-from .planner import Task, TaskPlan
+from ..utils.helpers import IO_BUFFER_SIZE, setup_logging, utc_now, write_json
+from .planner import COMPLEXITY_SCORE, PRIORITY_RANK, Task, TaskPlan
 
 logger = setup_logging(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_template(path: str) -> Optional[str]:
+    """Read an instruction template once per process (None if missing)."""
+    try:
+        return Path(path).read_text()
+    except FileNotFoundError:
+        return None
+
+
+def coffman_graham_order(tasks: List[Task], key: Callable[[Task], Any]) -> List[Task]:
+    """
+    Order tasks for list scheduling using Coffman-Graham labels.
+    
+    Tasks are labelled bottom-up: the next label goes to a task whose
+    dependents are all labelled and whose (descending) dependent labels are
+    lexicographically smallest. Scheduling by decreasing label puts tasks
+    that head long dependency chains first and is always a valid dependency
+    order. Ties are broken by ``key`` (smaller first, then input order), so
+    without dependencies this is a plain sort by ``key``. Dependencies on
+    unknown task IDs are ignored; tasks in a dependency cycle are appended
+    in ``key`` order.
+    
+    Args:
+        tasks: Tasks to order
+        key: Sort key used to break ties
+        
+    Returns:
+        Tasks in scheduling order
+    """
+    index = {t.task_id: i for i, t in enumerate(tasks)}
+    rank = [0] * len(tasks)
+    for position, i in enumerate(sorted(range(len(tasks)), key=lambda i: (key(tasks[i]), i))):
+        rank[i] = position
+    
+    deps: List[List[int]] = []
+    dependents: List[List[int]] = [[] for _ in tasks]
+    for i, task in enumerate(tasks):
+        task_deps = {index[d] for d in task.dependencies if d in index} - {i}
+        deps.append(list(task_deps))
+        for d in task_deps:
+            dependents[d].append(i)
+    
+    # Label the lowest-ranked candidate first so high-ranked tasks get the
+    # higher labels and are scheduled earlier
+    unlabelled = [len(children) for children in dependents]
+    labels = [0] * len(tasks)
+    ready: List[Tuple[Tuple[int, ...], int, int]] = [
+        ((), -rank[i], i) for i in range(len(tasks)) if not unlabelled[i]
+    ]
+    heapq.heapify(ready)
+    
+    label = 0
+    while ready:
+        _, _, i = heapq.heappop(ready)
+        label += 1
+        labels[i] = label
+        for d in deps[i]:
+            unlabelled[d] -= 1
+            if not unlabelled[d]:
+                child_labels = tuple(sorted((labels[c] for c in dependents[d]), reverse=True))
+                heapq.heappush(ready, (child_labels, -rank[d], d))
+    
+    ordered = sorted((i for i in range(len(tasks)) if labels[i]), key=lambda i: -labels[i])
+    if len(ordered) < len(tasks):
+        cyclic = sorted((i for i in range(len(tasks)) if not labels[i]), key=lambda i: rank[i])
+        logger.warning(f"Dependency cycle among tasks: {', '.join(tasks[i].task_id for i in cyclic)}")
+        ordered.extend(cyclic)
+    
+    return [tasks[i] for i in ordered]
+
+
+class _PlanTasks(BaseModel):
+    """The part of ``task_plan.json`` the distributor reads."""
+    
+    tasks: List[Task]
+
+
 class Agent(BaseModel):
     """Agent model for task distribution."""
     
@@ -52,6 +133,12 @@ class TaskDistributor:
         
         self.tasks: List[Task] = []
         self.agents: List[Agent] = []
+        self._total_agent_time = 0
+        
+        # Task sets as integer bitsets, one bit per task
+        self._task_bit: Dict[str, int] = {}
+        self._transitive_deps: Dict[str, int] = {}
+        self._owned_tasks: Dict[str, int] = {}
     
     def distribute_tasks(self, verbose: bool = False) -> Dict[str, Any]:
         """
@@ -97,11 +184,9 @@ class TaskDistributor:
         if not task_file.exists():
             raise FileNotFoundError("Task plan not found. Run 'claude-swarm plan' first.")
         
-        with open(task_file, 'r') as f:
-            plan_data = json.load(f)
-        
-        # Convert to Task objects
-        self.tasks = [Task(**task_data) for task_data in plan_data['tasks']]
+        # Parse and validate in one pydantic-core pass; other plan fields are
+        # skipped
+        self.tasks = _PlanTasks.model_validate_json(task_file.read_bytes()).tasks
         logger.info(f"Loaded {len(self.tasks)} tasks from plan")
     
     def _load_agents(self) -> None:
@@ -111,7 +196,7 @@ class TaskDistributor:
         if not agents_file.exists():
             raise FileNotFoundError("Agent registry not found. Initialize project first.")
         
-        with open(agents_file, 'r') as f:
+        with open(agents_file, 'r', newline='', buffering=IO_BUFFER_SIZE) as f:
             reader = csv.DictReader(f)
             for row in reader:
                 if row['agent_id']:  # Skip empty rows
@@ -127,35 +212,59 @@ class TaskDistributor:
     
     def _assign_tasks(self) -> None:
         """Assign tasks to agents using load balancing algorithm."""
-        # Sort tasks by priority and dependencies
-        priority_order = {'high': 0, 'normal': 1, 'low': 2}
-        sorted_tasks = sorted(
+        self._total_agent_time = sum(a.total_time for a in self.agents)
+        
+        # Critical chains first, then by priority
+        sorted_tasks = coffman_graham_order(
             self.tasks,
             key=lambda t: (
                 len(t.dependencies),
-                priority_order.get(t.priority, 1),
-                -self._calculate_complexity_score(t.complexity)
+                PRIORITY_RANK.get(t.priority, 1),
+                -t.complexity_score
             )
         )
+        self._compute_transitive_deps(sorted_tasks)
         
         unassigned = []
         
-        for task in sorted_tasks:
-            assigned = False
-            
-            # Find eligible agents
-            eligible_agents = [a for a in self.agents if self._can_assign_task(task, a)]
+        # Agents keyed by workload; the index keeps ties in registry order
+        heap = [(a.total_time, a.complexity_score, i) for i, a in enumerate(self.agents)]
+        heapq.heapify(heap)
+        
+        if not any(self._transitive_deps.values()):
+            # Without dependencies the least loaded agent is always within the
+            # workload limit, so eligibility checks can be skipped
+            logger.debug("Fast path: no task dependencies")
+            for task in sorted_tasks:
+                _, _, i = heap[0]
+                agent = self.agents[i]
+                self._assign_task_to_agent(task, agent)
+                heapq.heapreplace(heap, (agent.total_time, agent.complexity_score, i))
             
-            if eligible_agents:
-                # Select agent with lowest workload
-                best_agent = min(eligible_agents, key=lambda a: (a.total_time, a.complexity_score))
-                
-                # Assign task
-                self._assign_task_to_agent(task, best_agent)
-                assigned = True
+            logger.info(f"Successfully distributed all {len(self.tasks)} tasks")
+            return
+        
+        for task in sorted_tasks:
+            # Pop agents in workload order until one is eligible
+            skipped = []
+            best = None
+            while heap:
+                entry = heapq.heappop(heap)
+                if self._can_assign_task(task, self.agents[entry[2]]):
+                    best = entry
+                    break
+                skipped.append(entry)
             
-            if not assigned:
+            if best is not None:
+                # Assign task to the least loaded eligible agent
+                agent = self.agents[best[2]]
+                self._assign_task_to_agent(task, agent)
+                heapq.heappush(heap, (agent.total_time, agent.complexity_score, best[2]))
+            else:
                 unassigned.append(task)
+            
+            for entry in skipped:
+                heapq.heappush(heap, entry)
         
         # Handle unassigned tasks (force assignment to least loaded agent)
         for task in unassigned:
@@ -164,19 +273,44 @@ class TaskDistributor:
         
         logger.info(f"Successfully distributed all {len(self.tasks)} tasks")
     
+    def _compute_transitive_deps(self, ordered_tasks: List[Task]) -> None:
+        """
+        Precompute every task's direct and indirect dependencies.
+        
+        Args:
+            ordered_tasks: Tasks in dependency order
+        """
+        self._task_bit = {t.task_id: 1 << i for i, t in enumerate(self.tasks)}
+        self._owned_tasks = {}
+        for task in self.tasks:
+            if task.assigned_agent:
+                self._owned_tasks[task.assigned_agent] = (
+                    self._owned_tasks.get(task.assigned_agent, 0) | self._task_bit[task.task_id]
+                )
+        
+        closures: Dict[str, int] = {}
+        for task in ordered_tasks:
+            closure = 0
+            for dep_id in task.dependencies:
+                bit = self._task_bit.get(dep_id)
+                if bit is not None:
+                    closure |= bit | closures.get(dep_id, 0)
+            closures[task.task_id] = closure
+        
+        self._transitive_deps = closures
+    
     def _can_assign_task(self, task: Task, agent: Agent) -> bool:
         """Check if a task can be assigned to an agent."""
-        # Check dependencies - avoid assigning dependent tasks to same agent
-        for dep_id in task.dependencies:
-            dep_task = next((t for t in self.tasks if t.task_id == dep_id), None)
-            if dep_task and dep_task.assigned_agent == agent.agent_id:
-                return False
+        # Check dependencies - avoid assigning dependent tasks to same agent,
+        # including indirect ones
+        if self._transitive_deps.get(task.task_id, 0) & self._owned_tasks.get(agent.agent_id, 0):
+            return False
         
         # Check workload balance (soft limit)
         if not self.agents:
             return True
         
-        avg_time = sum(a.total_time for a in self.agents) / len(self.agents)
+        avg_time = self._total_agent_time / len(self.agents)
         if agent.total_time > avg_time * 1.5:  # 50% above average
             return False
         
@@ -186,13 +320,16 @@ class TaskDistributor:
         """Assign a task to an agent."""
         task.assigned_agent = agent.agent_id
         agent.assigned_tasks.append(task.task_id)
+        self._owned_tasks[agent.agent_id] = (
+            self._owned_tasks.get(agent.agent_id, 0) | self._task_bit.get(task.task_id, 0)
+        )
         agent.total_time += task.estimated_time
-        agent.complexity_score += self._calculate_complexity_score(task.complexity)
+        self._total_agent_time += task.estimated_time
+        agent.complexity_score += task.complexity_score
     
     def _calculate_complexity_score(self, complexity: str) -> int:
         """Convert complexity to numerical score."""
-        scores = {'low': 1, 'medium': 3, 'high': 5}
-        return scores.get(complexity, 2)
+        return COMPLEXITY_SCORE.get(complexity, 2)
     
     def _generate_agent_instructions(self) -> None:
         """Generate specific instructions for each agent."""
@@ -200,13 +337,24 @@ class TaskDistributor:
         
         # Load instruction template
         template_file = Path(__file__).parent.parent / "templates" / "agent_instructions.md"
-        if template_file.exists():
-            template_content = template_file.read_text()
-        else:
+        template_content = _load_template(str(template_file))
+        if template_content is None:
             template_content = self._get_default_template()
         
+        # Group tasks by agent in one pass, keeping plan order
+        tasks_by_agent: Dict[str, List[Task]] = {}
+        for task in self.tasks:
+            if task.assigned_agent is not None:
+                tasks_by_agent.setdefault(task.assigned_agent, []).append(task)
+        
+        coord_dir = self._get_coordination_dir()
+        tasks_dir = self.project_dir / "tasks"
+        
+        # Render everything first, then write the files concurrently
+        writes: List[Tuple[Path, bytes]] = []
+        
         for agent in self.agents:
-            agent_tasks = [t for t in self.tasks if t.assigned_agent == agent.agent_id]
+            agent_tasks = tasks_by_agent.get(agent.agent_id, [])
             
             if not agent_tasks:
                 continue
@@ -220,7 +368,7 @@ class TaskDistributor:
                 PROJECT_NAME=self.project_name,
                 WORKTREE_PATH=agent.worktree_path,
                 BRANCH_NAME=agent.branch_name,
-                COORD_DIR=self._get_coordination_dir(),
+                COORD_DIR=coord_dir,
                 TASK_LIST=task_list,
                 NUM_TASKS=len(agent_tasks),
                 TOTAL_TIME=agent.total_time,
@@ -228,52 +376,60 @@ class TaskDistributor:
             )
             
             # Save to project directory and worktree (if exists)
-            instruction_file = self.project_dir / "tasks" / f"{agent.agent_id}_instructions.md"
-            instruction_file.write_text(instructions)
+            data = instructions.encode()
+            writes.append((tasks_dir / f"{agent.agent_id}_instructions.md", data))
             
             # Copy to worktree if it exists
-            worktree_path = Path(agent.worktree_path)
-            if worktree_path.exists():
-                swarm_dir = worktree_path / ".swarm"
-                swarm_dir.mkdir(exist_ok=True)
+            if os.path.isdir(agent.worktree_path):
+                swarm_dir = Path(agent.worktree_path) / ".swarm"
+                try:
+                    os.mkdir(swarm_dir)
+                except FileExistsError:
+                    pass
                 
-                (swarm_dir / "agent_instructions.md").write_text(instructions)
+                writes.append((swarm_dir / "agent_instructions.md", data))
                 
                 # Also create tasks.md with just the task list
-                (swarm_dir / "tasks.md").write_text(f"# Tasks for {agent.agent_id.upper()}\n\n{task_list}")
+                writes.append((
+                    swarm_dir / "tasks.md",
+                    f"# Tasks for {agent.agent_id.upper()}\n\n{task_list}".encode()
+                ))
                 
-                logger.debug(f"Created instructions for {agent.agent_id}")
+                logger.debug(f"Rendered instructions for {agent.agent_id}")
+        
+        if writes:
+            with ThreadPoolExecutor(max_workers=min(len(writes), 32)) as pool:
+                list(pool.map(lambda job: job[0].write_bytes(job[1]), writes))
     
     def _generate_task_list(self, tasks: List[Task]) -> str:
         """Generate formatted task list for an agent."""
-        task_list = ""
+        task_list = io.StringIO()
         
         # Group by category
-        categories = {}
+        categories: Dict[str, List[Task]] = defaultdict(list)
         for task in tasks:
-            cat = task.category
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(task)
+            categories[task.category].append(task)
         
         for category, cat_tasks in sorted(categories.items()):
-            task_list += f"### {category.replace('_', ' ').title()}\n\n"
+            task_list.write(f"### {category.replace('_', ' ').title()}\n\n")
             
             for task in cat_tasks:
-                task_list += f"#### {task.task_id}: {task.description}\n"
-                task_list += f"- **Complexity**: {task.complexity}\n"
-                task_list += f"- **Priority**: {task.priority}\n"
-                task_list += f"- **Estimated time**: {task.estimated_time} minutes\n"
+                task_list.write(
+                    f"#### {task.task_id}: {task.description}\n"
+                    f"- **Complexity**: {task.complexity}\n"
+                    f"- **Priority**: {task.priority}\n"
+                    f"- **Estimated time**: {task.estimated_time} minutes\n"
+                )
                 
                 if task.dependencies:
-                    task_list += f"- **Dependencies**: {', '.join(task.dependencies)}\n"
+                    task_list.write(f"- **Dependencies**: {', '.join(task.dependencies)}\n")
                 
                 if task.required_skills:
-                    task_list += f"- **Required skills**: {', '.join(task.required_skills)}\n"
+                    task_list.write(f"- **Required skills**: {', '.join(task.required_skills)}\n")
                 
-                task_list += "\n"
+                task_list.write("\n")
         
-        return task_list
+        return task_list.getvalue()
     
     def _get_coordination_dir(self) -> str:
         """Get coordination directory path."""
@@ -323,34 +479,28 @@ Good luck!
         # Update task registry with assignments
         registry_file = self.project_dir / "registry" / "tasks.csv"
         
-        with open(registry_file, 'w') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+        rows = [
+            (task.task_id, task.description, task.category, task.complexity,
+             ';'.join(task.dependencies), task.assigned_agent or '', task.status)
+            for task in self.tasks
+        ]
+        
+        with open(registry_file, 'w', newline='', buffering=IO_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow([
                 'task_id', 'description', 'category', 'complexity',
                 'dependencies', 'assigned_agent', 'status', 'start_time',
                 'end_time', 'commits'
             ])
-            writer.writeheader()
-            
-            for task in self.tasks:
-                writer.writerow({
-                    'task_id': task.task_id,
-                    'description': task.description,
-                    'category': task.category,
-                    'complexity': task.complexity,
-                    'dependencies': ';'.join(task.dependencies),
-                    'assigned_agent': task.assigned_agent or '',
-                    'status': task.status,
-                    'start_time': '',
-                    'end_time': '',
-                    'commits': ''
-                })
+            # start_time, end_time and commits start empty
+            writer.writerows(row + ('', '', '') for row in rows)
         
         # Save distribution summary
         summary_file = self.project_dir / "tasks" / "distribution_summary.json"
         
         summary = {
             'project_name': self.project_name,
-            'distributed_at': datetime.utcnow().isoformat(),
+            'distributed_at': utc_now().isoformat(),
             'total_tasks': len(self.tasks),
             'agents': []
         }
@@ -365,8 +515,7 @@ Good luck!
             }
             summary['agents'].append(agent_summary)
         
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary_file, summary)
         
         logger.info(f"Distribution saved to: {summary_file}")
     
@@ -4,18 +4,85 @@ Task Planner for Claude Swarm Coordinator
 Analyzes project requirements and creates task breakdown for distribution among agents.
 """
 
+import csv
+import functools
+from collections import Counter
 import json
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 from pydantic import BaseModel, Field
 
-from ..utils.helpers import setup_logging
+from ..utils.helpers import (
+    IO_BUFFER_SIZE, loads_json, setup_logging, topological_order, utc_now, write_json
+)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
 
 logger = setup_logging(__name__)
 
+# Sort ranks (lower sorts first)
+PRIORITY_RANK = {'high': 0, 'normal': 1, 'low': 2}
+COMPLEXITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+# Load-balancing weight per complexity level
+COMPLEXITY_SCORE = {'low': 1, 'medium': 3, 'high': 5}
+
+_NUMBERED_ITEM_RE = re.compile(r'^\d+\.')
+_ITEM_MARKER_RE = re.compile(r'^[-*\d.]+\s*')
+
+# Complexity indicator keywords
+_HIGH_COMPLEXITY_KEYWORDS = (
+    'refactor', 'architect', 'design', 'optimize', 'migration',
+    'security', 'performance', 'scale', 'distributed', 'integration'
+)
+_LOW_COMPLEXITY_KEYWORDS = (
+    'fix', 'update', 'add', 'remove', 'rename', 'move',
+    'document', 'comment', 'typo', 'format'
+)
+
+# Keyword lists compiled to one alternation each. Complexity indicators are
+# matched inside a lookahead so overlapping keywords ("remove"/"move") are
+# all found, as with the substring checks they replace.
+_HIGH_COMPLEXITY_RE = re.compile('(?=({}))'.format('|'.join(_HIGH_COMPLEXITY_KEYWORDS)))
+_LOW_COMPLEXITY_RE = re.compile('(?=({}))'.format('|'.join(_LOW_COMPLEXITY_KEYWORDS)))
+
+
+def _build_complexity_automaton() -> Optional[Any]:
+    """Compile all complexity keywords into one Aho-Corasick automaton, if available."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for level, keywords in (('high', _HIGH_COMPLEXITY_KEYWORDS), ('low', _LOW_COMPLEXITY_KEYWORDS)):
+        for keyword in keywords:
+            automaton.add_word(keyword, (level, keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick, both keyword lists are found in a single pass
+_COMPLEXITY_AUTOMATON = _build_complexity_automaton()
+
+# Technology indicators
+_SKILL_RES = {
+    skill: re.compile('|'.join(keywords))
+    for skill, keywords in {
+        'api': ['api', 'endpoint', 'rest', 'graphql'],
+        'database': ['database', 'sql', 'query', 'schema', 'migration'],
+        'frontend': ['ui', 'ux', 'react', 'vue', 'angular', 'css', 'html'],
+        'backend': ['server', 'api', 'endpoint', 'controller', 'service'],
+        'testing': ['test', 'spec', 'tdd', 'unit', 'integration'],
+        'devops': ['deploy', 'ci', 'cd', 'docker', 'kubernetes'],
+        'security': ['security', 'auth', 'encrypt', 'permission', 'role']
+    }.items()
+}
+
 
 class Task(BaseModel):
     """Individual task model."""
@@ -30,19 +97,89 @@ class Task(BaseModel):
     required_skills: List[str] = Field(default_factory=list)
     assigned_agent: Optional[str] = None
     status: str = Field(default="pending", pattern="^(pending|in_progress|completed|blocked)$")
+    
+    @property
+    def complexity_score(self) -> int:
+        """Numerical weight of the task's complexity."""
+        return COMPLEXITY_SCORE.get(self.complexity, 2)
 
 
 class TaskPlan(BaseModel):
     """Complete task plan model."""
     
     project_name: str
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
     total_tasks: int
     total_estimated_time: int
     complexity_breakdown: Dict[str, int]
     tasks: List[Task]
 
 
+def topological_sort(tasks: List[Task], key: Callable[[Task], Any]) -> List[Task]:
+    """
+    Order tasks so that every task comes after its dependencies.
+    
+    Uses Kahn's algorithm with a priority queue: among the tasks whose
+    dependencies have all been emitted, the one with the smallest ``key`` goes
+    first (ties keep input order). Dependencies on unknown task IDs are
+    ignored. Tasks caught in a dependency cycle are appended in ``key`` order.
+    
+    Args:
+        tasks: Tasks to order
+        key: Sort key used to pick among ready tasks
+        
+    Returns:
+        Tasks in dependency order
+    """
+    index = {t.task_id: i for i, t in enumerate(tasks)}
+    edges = []
+    for i, task in enumerate(tasks):
+        for dep_id in set(task.dependencies):
+            dep = index.get(dep_id)
+            if dep is not None and dep != i:
+                edges.append((dep, i))
+    
+    # No edges: a plain sort is already a valid order
+    if not edges:
+        return sorted(tasks, key=key)
+    
+    keys = [key(t) for t in tasks]
+    ordered, cyclic = topological_order(range(len(tasks)), edges, key=keys.__getitem__)
+    
+    if cyclic:
+        cyclic.sort(key=lambda i: (keys[i], i))
+        logger.warning(f"Dependency cycle among tasks: {', '.join(tasks[i].task_id for i in cyclic)}")
+    
+    return [tasks[i] for i in ordered + cyclic]
+
+
+@functools.lru_cache(maxsize=4096)
+def _complexity_for(desc_lower: str) -> str:
+    """Estimate complexity from a lower-cased description (memoized)."""
+    # Count distinct indicator keywords present
+    if _COMPLEXITY_AUTOMATON is not None:
+        found = {match for _, match in _COMPLEXITY_AUTOMATON.iter(desc_lower)}
+        high_count = sum(1 for level, _ in found if level == 'high')
+        low_count = len(found) - high_count
+    else:
+        high_count = len(set(_HIGH_COMPLEXITY_RE.findall(desc_lower)))
+        low_count = len(set(_LOW_COMPLEXITY_RE.findall(desc_lower)))
+    
+    if high_count > low_count:
+        return 'high'
+    elif low_count > 0:
+        return 'low'
+    else:
+        return 'medium'
+
+
+@functools.lru_cache(maxsize=4096)
+def _skills_for(desc_lower: str) -> Tuple[str, ...]:
+    """Extract required skills from a lower-cased description (memoized)."""
+    skills = tuple(skill for skill, pattern in _SKILL_RES.items() if pattern.search(desc_lower))
+    return skills or ('general',)
+
+
 class TaskPlanner:
     """
     Analyzes project requirements and creates structured task breakdown.
@@ -92,6 +229,8 @@ class TaskPlanner:
         else:
             self._parse_text_requirements(content)
         
+        logger.debug(f"Complexity estimate cache: {_complexity_for.cache_info()}")
+        
         # Post-processing
         self._analyze_dependencies()
         self._optimize_task_order()
@@ -121,8 +260,8 @@ class TaskPlanner:
                 continue
             
             # Task items (- or * or numbered lists)
-            if line.startswith(('-', '*')) or re.match(r'^\d+\.', line):
-                task_desc = re.sub(r'^[-*\d.]+\s*', '', line).strip()
+            if line.startswith(('-', '*')) or _NUMBERED_ITEM_RE.match(line):
+                task_desc = _ITEM_MARKER_RE.sub('', line).strip()
                 if task_desc:
                     self._add_task(task_desc, current_category)
             
@@ -135,7 +274,7 @@ class TaskPlanner:
     def _parse_json_requirements(self, content: str) -> None:
         """Parse JSON-formatted requirements."""
         try:
-            data = json.loads(content)
+            data = loads_json(content)
             
             if isinstance(data, list):
                 for item in data:
@@ -200,29 +339,7 @@ class TaskPlanner:
     
     def _estimate_complexity(self, description: str) -> str:
         """Estimate task complexity based on description."""
-        desc_lower = description.lower()
-        
-        # High complexity indicators
-        high_indicators = [
-            'refactor', 'architect', 'design', 'optimize', 'migration',
-            'security', 'performance', 'scale', 'distributed', 'integration'
-        ]
-        
-        # Low complexity indicators
-        low_indicators = [
-            'fix', 'update', 'add', 'remove', 'rename', 'move',
-            'document', 'comment', 'typo', 'format'
-        ]
-        
-        high_count = sum(1 for word in high_indicators if word in desc_lower)
-        low_count = sum(1 for word in low_indicators if word in desc_lower)
-        
-        if high_count > low_count:
-            return 'high'
-        elif low_count > 0:
-            return 'low'
-        else:
-            return 'medium'
+        return _complexity_for(description.lower())
     
     def _estimate_time(self, complexity: str) -> int:
         """Estimate time in minutes based on complexity."""
@@ -235,73 +352,108 @@ class TaskPlanner:
     
     def _extract_required_skills(self, description: str) -> List[str]:
         """Extract required skills from task description."""
-        skills = []
-        desc_lower = description.lower()
-        
-        # Technology indicators
-        tech_skills = {
-            'api': ['api', 'endpoint', 'rest', 'graphql'],
-            'database': ['database', 'sql', 'query', 'schema', 'migration'],
-            'frontend': ['ui', 'ux', 'react', 'vue', 'angular', 'css', 'html'],
-            'backend': ['server', 'api', 'endpoint', 'controller', 'service'],
-            'testing': ['test', 'spec', 'tdd', 'unit', 'integration'],
-            'devops': ['deploy', 'ci', 'cd', 'docker', 'kubernetes'],
-            'security': ['security', 'auth', 'encrypt', 'permission', 'role']
-        }
-        
-        for skill, keywords in tech_skills.items():
-            if any(keyword in desc_lower for keyword in keywords):
-                skills.append(skill)
-        
-        return skills or ['general']
+        # Copy so callers can't modify the cached result
+        return list(_skills_for(description.lower()))
     
     def _analyze_dependencies(self) -> None:
         """Analyze and detect task dependencies."""
         logger.debug("Analyzing task dependencies...")
         
+        descs_lower = [t.description.lower() for t in self.tasks]
+        
+        # Look for explicit dependencies
+        referring = [
+            i for i, desc_lower in enumerate(descs_lower)
+            if 'after' in desc_lower or 'depends on' in desc_lower
+        ]
+        mentions = self._find_mentions(descs_lower, referring)
+        
+        # Testing tasks depend on implementation tasks
+        impl_tasks = [t.task_id for t in self.tasks if t.category in ['feature', 'implementation']]
+        
         for i, task in enumerate(self.tasks):
-            desc_lower = task.description.lower()
-            
-            # Look for explicit dependencies
-            if 'after' in desc_lower or 'depends on' in desc_lower:
-                for j, other_task in enumerate(self.tasks):
-                    if i != j and other_task.description.lower() in desc_lower:
-                        task.dependencies.append(other_task.task_id)
+            for j in mentions.get(i, ()):
+                task.dependencies.append(self.tasks[j].task_id)
             
             # Implicit dependencies based on categories
             if task.category == 'testing' and not task.dependencies:
-                # Testing tasks depend on implementation tasks
-                impl_tasks = [
-                    t.task_id for t in self.tasks
-                    if t.category in ['feature', 'implementation'] and t.task_id != task.task_id
-                ]
                 task.dependencies.extend(impl_tasks[:2])  # Limit dependencies
     
+    def _find_mentions(self, descs_lower: List[str], referring: List[int]) -> Dict[int, List[int]]:
+        """
+        Find which task descriptions appear inside the referring descriptions.
+        
+        Uses an Aho-Corasick automaton over all descriptions when the optional
+        ``pyahocorasick`` package is installed, so each referring description is
+        scanned once; otherwise falls back to substring checks.
+        
+        Args:
+            descs_lower: Lower-cased description of every task
+            referring: Indices of the tasks to scan
+            
+        Returns:
+            Mentioned task indices (in task order) for each referring task
+        """
+        if not referring:
+            return {}
+        
+        if ahocorasick is None:
+            return {
+                i: [j for j, other in enumerate(descs_lower) if i != j and other in descs_lower[i]]
+                for i in referring
+            }
+        
+        automaton = ahocorasick.Automaton()
+        for j, desc_lower in enumerate(descs_lower):
+            if desc_lower:
+                automaton.add_word(desc_lower, automaton.get(desc_lower, ()) + (j,))
+        
+        # An empty description is contained in every description
+        empty = {j for j, desc_lower in enumerate(descs_lower) if not desc_lower}
+        
+        mentions = {}
+        if len(automaton):
+            automaton.make_automaton()
+        for i in referring:
+            found = set(empty)
+            if len(automaton):
+                for _, indices in automaton.iter(descs_lower[i]):
+                    found.update(indices)
+            found.discard(i)
+            mentions[i] = sorted(found)
+        
+        return mentions
+    
     def _optimize_task_order(self) -> None:
         """Optimize task order based on dependencies."""
-        # Simple topological sort by priority and dependencies
-        self.tasks.sort(key=lambda t: (
+        # Dependencies first, then by priority and complexity
+        self.tasks = topological_sort(self.tasks, key=lambda t: (
             len(t.dependencies),
-            {'high': 0, 'normal': 1, 'low': 2}[t.priority],
-            {'high': 0, 'medium': 1, 'low': 2}[t.complexity]
+            PRIORITY_RANK[t.priority],
+            COMPLEXITY_RANK[t.complexity]
         ))
     
     def _create_task_plan(self) -> TaskPlan:
         """Create a complete task plan from analyzed tasks."""
-        complexity_breakdown = {
-            'high': len([t for t in self.tasks if t.complexity == 'high']),
-            'medium': len([t for t in self.tasks if t.complexity == 'medium']),
-            'low': len([t for t in self.tasks if t.complexity == 'low'])
-        }
+        complexity_breakdown, total_time = self._aggregate_tasks()
         
         return TaskPlan(
             project_name=self.project_name,
             total_tasks=len(self.tasks),
-            total_estimated_time=sum(t.estimated_time for t in self.tasks),
+            total_estimated_time=total_time,
             complexity_breakdown=complexity_breakdown,
             tasks=self.tasks
         )
     
+    def _aggregate_tasks(self) -> Tuple[Dict[str, int], int]:
+        """Count tasks per complexity and sum estimated time in one pass."""
+        complexity_breakdown = {'high': 0, 'medium': 0, 'low': 0}
+        total_time = 0
+        for task in self.tasks:
+            complexity_breakdown[task.complexity] += 1
+            total_time += task.estimated_time
+        return complexity_breakdown, total_time
+    
     def _save_task_plan(self, task_plan: TaskPlan) -> None:
         """Save task plan to project directory."""
         # Ensure tasks directory exists
@@ -310,17 +462,21 @@ class TaskPlanner:
         
         # Save JSON version
         json_file = tasks_dir / "task_plan.json"
-        with open(json_file, 'w') as f:
-            json.dump(task_plan.model_dump(), f, indent=2, default=str)
+        write_json(json_file, task_plan.model_dump(mode="json"))
         
         # Save CSV version for easy viewing
         csv_file = tasks_dir / "task_plan.csv"
-        with open(csv_file, 'w') as f:
-            f.write("task_id,description,category,complexity,estimated_time,dependencies,priority\n")
-            for task in self.tasks:
-                deps = ';'.join(task.dependencies)
-                f.write(f"{task.task_id},{task.description},{task.category},"
-                       f"{task.complexity},{task.estimated_time},{deps},{task.priority}\n")
+        with open(csv_file, 'w', newline='', buffering=IO_BUFFER_SIZE) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow([
+                'task_id', 'description', 'category', 'complexity',
+                'estimated_time', 'dependencies', 'priority'
+            ])
+            writer.writerows(
+                [task.task_id, task.description, task.category, task.complexity,
+                 task.estimated_time, ';'.join(task.dependencies), task.priority]
+                for task in self.tasks
+            )
         
         logger.info(f"Task plan saved to: {json_file}")
     
@@ -338,9 +494,7 @@ class TaskPlanner:
             print(f"  {complexity.capitalize()}: {count} tasks")
         
         print(f"\nCategory breakdown:")
-        categories = {}
-        for task in self.tasks:
-            categories[task.category] = categories.get(task.category, 0) + 1
+        categories = Counter(task.category for task in self.tasks)
         
         for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
             print(f"  {category}: {count} tasks")
@@ -354,14 +508,10 @@ class TaskPlanner:
         if not self.tasks:
             return {}
         
-        complexity_breakdown = {
-            'high': len([t for t in self.tasks if t.complexity == 'high']),
-            'medium': len([t for t in self.tasks if t.complexity == 'medium']),
-            'low': len([t for t in self.tasks if t.complexity == 'low'])
-        }
+        complexity_breakdown, total_time = self._aggregate_tasks()
         
         return {
             'total_tasks': len(self.tasks),
-            'total_time': sum(t.estimated_time for t in self.tasks),
+            'total_time': total_time,
             'complexity_breakdown': complexity_breakdown
         }
\ No newline at end of file
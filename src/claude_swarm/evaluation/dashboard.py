@@ -5,28 +5,210 @@ Provides visual monitoring of agent progress, task completion, and system health
 """
 
 import csv
-import json
+import functools
 import os
 import subprocess
 import sys
+import threading
 import time
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Callable, Optional, Tuple, cast
 
-import git
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-from rich.table import Table
-from rich.text import Text
+from ..utils.helpers import (
+    IO_BUFFER_SIZE, find_repo_root, git_dir_for, lazy_import, loads_json, setup_logging
+)
 
-from ..utils.helpers import setup_logging
+if TYPE_CHECKING:
+    import git
+    from rich.console import RenderableType
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    from watchdog.events import FileSystemEvent
+
+# Rich and watchdog are imported by the methods that render or watch, so
+# get_status_summary() (e.g. for JSON output) never loads them.
 
 logger = setup_logging(__name__)
-console = Console()
+
+if not TYPE_CHECKING:
+    # Only needed when the repository root cannot be found on disk
+    git = lazy_import("git")
+
+# Task statuses counted separately in the task summary
+_TASK_STATUSES = frozenset(('pending', 'in_progress', 'completed', 'blocked'))
+
+# Agents that committed within this many seconds count as active
+ACTIVE_WINDOW_SECONDS = 3600
+
+# Minimum seconds between background commit-graph updates
+COMMIT_GRAPH_INTERVAL = 300
+
+# Fixed parts of the text sections, built once instead of on every refresh
+_RULE_40 = "─" * 40
+_RULE_80 = "─" * 80
+
+
+@functools.lru_cache(maxsize=8)
+def _column_indices(header: Tuple[str, ...], columns: Tuple[str, ...]) -> Optional[Tuple[int, ...]]:
+    """Return the positions of ``columns`` in a CSV header, or None if one is missing."""
+    try:
+        return tuple(header.index(name) for name in columns)
+    except ValueError:
+        return None
+
+
+def _is_active(agent: Dict[str, Any], now: float) -> bool:
+    """Return whether an agent's last commit falls within the active window."""
+    timestamp = agent.get('last_commit_ts')
+    return timestamp is not None and now - timestamp < ACTIVE_WINDOW_SECONDS
+
+
+def _relative_date(timestamp: int, now: int) -> str:
+    """Format a unix time like git's ``--date=relative`` (e.g. ``5 minutes ago``)."""
+    def ago(count: int, unit: str) -> str:
+        return f"{count} {unit}{'' if count == 1 else 's'} ago"
+    
+    diff = now - timestamp
+    if diff < 0:
+        return "in the future"
+    if diff < 90:
+        return ago(diff, "second")
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return ago(diff, "minute")
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return ago(diff, "hour")
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return ago(diff, "day")
+    if diff < 70:
+        return ago((diff + 3) // 7, "week")
+    if diff < 365:
+        return ago((diff + 15) // 30, "month")
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            year_text = f"{years} year{'' if years == 1 else 's'}"
+            return f"{year_text}, {ago(months, 'month')}"
+        return ago(years, "year")
+    return ago((diff + 183) // 365, "year")
+
+
+class _CatFileBatch:
+    """
+    Long-lived ``git cat-file --batch`` process for reading commit objects.
+    
+    Looking up branch heads through it costs a pipe round trip instead of a
+    fork and exec of git on every dashboard refresh.
+    """
+    
+    def __init__(self, repo_root: Path):
+        """
+        Args:
+            repo_root: Repository to read objects from
+        """
+        self.repo_root = repo_root
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._lock = threading.Lock()
+    
+    def commit_times(self, revs: List[str]) -> Dict[str, Tuple[str, int]]:
+        """
+        Resolve revisions to commits and their author dates.
+        
+        Args:
+            revs: Revisions such as ``refs/heads/<branch>``
+            
+        Returns:
+            Mapping of each existing revision to (commit SHA, unix author date)
+        """
+        with self._lock:
+            try:
+                return self._query(revs)
+            except (OSError, ValueError):
+                # The process died (e.g. repository repacked away); start a new one
+                self.close()
+                return self._query(revs)
+    
+    def _query(self, revs: List[str]) -> Dict[str, Tuple[str, int]]:
+        if self._process is None:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                cwd=self.repo_root
+            )
+        
+        stdin, stdout = self._process.stdin, self._process.stdout
+        assert stdin is not None and stdout is not None  # Both are pipes
+        stdin.write(''.join(f"{rev}\n" for rev in revs).encode())
+        stdin.flush()
+        
+        commits = {}
+        for rev in revs:
+            header = stdout.readline()
+            if not header:
+                raise ValueError("git cat-file exited")
+            fields = header.split()
+            if len(fields) != 3:
+                continue  # "<rev> missing"
+            
+            sha, kind, size = fields
+            body = stdout.read(int(size) + 1)
+            if kind != b'commit':
+                continue
+            
+            for line in body.split(b'\n'):
+                if line.startswith(b'author '):
+                    commits[rev] = (sha.decode(), int(line.rsplit(b' ', 2)[1]))
+                    break
+                if not line:
+                    break  # End of headers
+        return commits
+    
+    def close(self) -> None:
+        """Stop the git process."""
+        if self._process is not None:
+            try:
+                if self._process.stdin is not None:
+                    self._process.stdin.close()
+            except OSError:
+                pass
+            self._process.wait()
+            self._process = None
+
+
+class _ChangeHandler:
+    """
+    Watchdog handler that flags file changes for the refresh loop.
+    
+    Observers only call ``dispatch``, so this does not need to subclass
+    watchdog's ``FileSystemEventHandler``.
+    """
+    
+    def __init__(self, changed: threading.Event, names: Optional[Tuple[str, ...]] = None):
+        """
+        Args:
+            changed: Event to set on changes
+            names: Only react to files with these names (default: any file)
+        """
+        self.changed = changed
+        self.names = names
+    
+    def dispatch(self, event: "FileSystemEvent") -> None:
+        if event.event_type not in ('created', 'deleted', 'modified', 'moved'):
+            return  # e.g. the dashboard itself opening a registry
+        
+        if self.names is not None:
+            paths = (event.src_path, getattr(event, 'dest_path', '') or '')
+            if not any(os.path.basename(path) in self.names for path in paths):
+                return
+        
+        self.changed.set()
 
 
 class SwarmDashboard:
@@ -37,6 +219,10 @@ class SwarmDashboard:
     and performance metrics.
     """
     
+    # Registry columns the dashboard reads (the first one identifies a row)
+    AGENT_COLS = ('agent_id', 'branch_name', 'status')
+    TASK_COLS = ('task_id', 'status', 'assigned_agent')
+    
     def __init__(self, project_name: str, work_dir: Optional[Path] = None):
         """
         Initialize the swarm dashboard.
@@ -49,37 +235,174 @@ class SwarmDashboard:
         self.work_dir = Path(work_dir) if work_dir else Path.cwd()
         self.project_dir = self.work_dir / ".claude-swarm" / "projects" / project_name
         
-        # Find git repository
-        try:
-            self.repo = git.Repo(self.work_dir, search_parent_directories=True)
-            self.repo_root = Path(self.repo.working_tree_dir)
-        except git.InvalidGitRepositoryError:
-            raise ValueError(f"Not in a git repository: {self.work_dir}")
+        # Find git repository; all git calls below run as subprocesses, so
+        # GitPython is only loaded if the root cannot be found on disk
+        repo_root = find_repo_root(self.work_dir)
+        if repo_root is None:
+            try:
+                self.repo = git.Repo(self.work_dir, search_parent_directories=True)
+                repo_root = Path(self.repo.working_tree_dir)
+            except git.InvalidGitRepositoryError:
+                raise ValueError(f"Not in a git repository: {self.work_dir}")
+        self.repo_root = repo_root
         
         self.coord_dir = self.repo_root / ".swarm-coordination" / project_name
+        
+        # branch -> (branch head, main head, commits ahead of main)
+        self._commit_counts: Dict[str, Tuple[str, str, int]] = {}
+        
+        # name -> (on-disk stamp, result) for registry and blocker reads
+        self._read_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # blocker file path -> (mtime_ns, parsed blocker)
+        self._blocker_files: Dict[str, Tuple[int, Any]] = {}
+        
+        # Aggregates behind the last metrics and the metrics themselves
+        self._metrics: Optional[Tuple[Tuple[int, ...], Dict[str, Any]]] = None
+        
+        # Sections of the last frame, its panel and the panel's header text
+        self._last_frame: Optional[Tuple[List[Any], Panel, Text]] = None
+        
+        # Cells of the last agent table and the table built from them
+        self._agent_table: Optional[Tuple[Tuple[Tuple[str, ...], ...], Table]] = None
+        
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cat_file = _CatFileBatch(self.repo_root)
+        
+        # Background commit-graph write and when the last one was started
+        self._graph_proc: Optional[subprocess.Popen[bytes]] = None
+        self._graph_started: Optional[float] = None
+    
+    @functools.cached_property
+    def repo(self) -> "git.Repo":
+        """The GitPython repository, opened on first use."""
+        return git.Repo(self.repo_root)
+    
+    @functools.cached_property
+    def _libgit2(self) -> Optional[Any]:
+        """A pygit2 repository for in-process history walks, if pygit2 is installed."""
+        try:
+            import pygit2
+        except ImportError:  # pragma: no cover - optional speedup
+            return None
+        
+        try:
+            return pygit2.Repository(str(self.repo_root))
+        except Exception as e:
+            logger.debug(f"pygit2 could not open {self.repo_root}: {e}")
+            return None
+    
+    def _git_common_dir(self) -> Path:
+        """Return the git directory holding refs, shared by all worktrees."""
+        return git_dir_for(self.repo_root, common=True) or self.repo_root / ".git"
+    
+    def _update_commit_graph(self) -> None:
+        """
+        Start an incremental commit-graph write in the background.
+        
+        The dashboard's history walks read commit parents and dates from the
+        commit-graph (git reads it by default since 2.24) instead of inflating
+        each commit object. New agent commits are added as a ``--split`` layer
+        by a git process that runs alongside the refresh loop, at most once
+        every ``COMMIT_GRAPH_INTERVAL`` seconds and never two at a time.
+        """
+        if self._graph_proc is not None:
+            if self._graph_proc.poll() is None:
+                return  # The previous write is still running
+            self._graph_proc = None
+        
+        now = time.monotonic()
+        if self._graph_started is not None and now - self._graph_started < COMMIT_GRAPH_INTERVAL:
+            return
+        self._graph_started = now
+        
+        try:
+            self._graph_proc = subprocess.Popen(
+                ['git', 'commit-graph', 'write', '--reachable', '--changed-paths', '--split'],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                cwd=self.repo_root
+            )
+        except OSError as e:
+            logger.debug(f"Failed to start commit-graph write: {e}")
     
     def run(self, refresh_interval: int = 30) -> None:
         """
         Run the dashboard with auto-refresh.
         
+        With ``watchdog`` installed, the layout is regenerated as soon as the
+        registries, blockers or git refs change, and at least every
+        ``refresh_interval`` seconds so relative times stay current.
+        Without it, the dashboard polls every ``refresh_interval`` seconds.
+        
         Args:
             refresh_interval: Refresh interval in seconds
         """
+        from rich.console import Console
+        from rich.live import Live
+        
+        changed = threading.Event()
+        observer = self._watch_changes(changed)
+        
         try:
             with Live(self._generate_layout(), refresh_per_second=1/refresh_interval) as live:
                 while True:
+                    changed.wait(timeout=refresh_interval)
+                    changed.clear()
                     live.update(self._generate_layout())
-                    time.sleep(refresh_interval)
         except KeyboardInterrupt:
-            console.print("\n👋 Dashboard closed.")
+            Console().print("\n👋 Dashboard closed.")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self.close()
+    
+    def _watch_changes(self, changed: threading.Event) -> Optional[Any]:
+        """
+        Set ``changed`` whenever a file the dashboard reads is modified.
+        
+        Args:
+            changed: Event to set on changes
+            
+        Returns:
+            Running watchdog observer, or None if watchdog is not installed
+        """
+        try:
+            from watchdog.observers import Observer
+        except ImportError:  # pragma: no cover - optional speedup
+            return None
+        
+        git_dir = self._git_common_dir()
+        handler = _ChangeHandler(changed)
+        watches = [
+            (self.project_dir / "registry", handler, False),
+            (self.coord_dir / "blockers", handler, False),
+            (git_dir / "refs", handler, True),
+            (git_dir, _ChangeHandler(changed, names=('packed-refs',)), False),
+        ]
+        
+        observer = Observer()
+        for path, path_handler, recursive in watches:
+            if path.is_dir():
+                # Duck-typed handler (see _ChangeHandler), not a FileSystemEventHandler
+                observer.schedule(cast(Any, path_handler), str(path), recursive=recursive)
+        
+        try:
+            observer.start()
+        except Exception as e:
+            logger.warning(f"File watching unavailable, falling back to polling: {e}")
+            return None
+        return observer
     
-    def _generate_layout(self) -> Panel:
+    def _generate_layout(self) -> "Panel":
         """Generate the complete dashboard layout."""
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+        
+        self._update_commit_graph()
+        
         # Get all data
-        agents = self._get_agent_status()
-        task_stats = self._get_task_status()
-        blockers = self._get_blockers()
-        recent_activity = self._get_recent_activity()
+        agents, task_stats, blockers, recent_activity = self._collect(activity=True)
         metrics = self._calculate_metrics(agents, task_stats)
         
         # Create sections
@@ -91,28 +414,35 @@ class SwarmDashboard:
         activity_section = self._create_activity_section(recent_activity)
         
         # Combine all sections
-        content = Text()
-        content.append(header)
-        content.append("\n\n")
-        content.append(overview)
-        content.append("\n\n")
-        content.append(task_progress)
-        content.append("\n\n")
-        content.append(agent_table)
+        sections: List[RenderableType] = [overview, task_progress, agent_table]
         
         if blockers:
-            content.append("\n\n")
-            content.append(blockers_section)
+            sections.append(blockers_section)
         
         if recent_activity:
-            content.append("\n\n")
-            content.append(activity_section)
-        
-        return Panel(
-            content,
+            sections.append(activity_section)
+        
+        # Nothing but the clock changed: keep the last panel, update its header.
+        # The agent table is memoized, so an unchanged table is the same object.
+        if self._last_frame is not None and self._last_frame[0] == sections:
+            panel, header_text = self._last_frame[1:]
+            header_text.plain = header
+            return panel
+        
+        # Separate renderables, one blank line apart, instead of one big Text
+        header_text = Text(header)
+        renderables: List[RenderableType] = [header_text]
+        for section in sections:
+            renderables.append(Text())
+            renderables.append(Text(section.rstrip("\n")) if isinstance(section, str) else section)
+        
+        panel = Panel(
+            Group(*renderables),
             title=f"Claude Swarm Dashboard - {self.project_name}",
             border_style="blue"
         )
+        self._last_frame = (sections, panel, header_text)
+        return panel
     
     def _create_header(self) -> str:
         """Create dashboard header."""
@@ -121,223 +451,473 @@ class SwarmDashboard:
     
     def _create_overview(self, metrics: Dict[str, Any], task_stats: Dict[str, Any], blocker_count: int) -> str:
         """Create overview section."""
-        overview = "📈 OVERVIEW\n"
-        overview += "─" * 40 + "\n"
-        overview += f"Active Agents:     {metrics['active_agents']}/{metrics['total_agents']}\n"
-        overview += f"Task Progress:     {task_stats['completed']}/{task_stats['total']} "
-        overview += f"({metrics['completion_rate']:.1f}%)\n"
-        overview += f"Open Blockers:     {blocker_count}\n"
-        overview += f"Est. Completion:   {metrics['estimated_completion']}\n"
-        return overview
+        return (
+            "📈 OVERVIEW\n"
+            f"{_RULE_40}\n"
+            f"Active Agents:     {metrics['active_agents']}/{metrics['total_agents']}\n"
+            f"Task Progress:     {task_stats['completed']}/{task_stats['total']} "
+            f"({metrics['completion_rate']:.1f}%)\n"
+            f"Open Blockers:     {blocker_count}\n"
+            f"Est. Completion:   {metrics['estimated_completion']}\n"
+        )
     
     def _create_task_progress(self, task_stats: Dict[str, Any]) -> str:
         """Create task progress section."""
-        progress_text = "📋 TASK STATUS\n"
-        progress_text += "─" * 40 + "\n"
-        progress_text += f"✅ Completed:    {task_stats['completed']:3d}\n"
-        progress_text += f"🔄 In Progress:  {task_stats['in_progress']:3d}\n"
-        progress_text += f"⏳ Pending:      {task_stats['pending']:3d}\n"
-        progress_text += f"🚫 Blocked:      {task_stats['blocked']:3d}\n"
-        return progress_text
-    
-    def _create_agent_table(self, agents: List[Dict[str, Any]], task_stats: Dict[str, Any]) -> str:
-        """Create agent status table."""
-        table_text = "🤖 AGENT STATUS\n"
-        table_text += "─" * 80 + "\n"
-        table_text += f"{'Agent':<10} {'Branch':<25} {'Tasks':<15} {'Commits':<10} {'Last Activity':<20}\n"
-        table_text += "─" * 80 + "\n"
+        return (
+            "📋 TASK STATUS\n"
+            f"{_RULE_40}\n"
+            f"✅ Completed:    {task_stats['completed']:3d}\n"
+            f"🔄 In Progress:  {task_stats['in_progress']:3d}\n"
+            f"⏳ Pending:      {task_stats['pending']:3d}\n"
+            f"🚫 Blocked:      {task_stats['blocked']:3d}\n"
+        )
+    
+    def _create_agent_table(self, agents: List[Dict[str, Any]], task_stats: Dict[str, Any]) -> "Table":
+        """
+        Create agent status table.
+        
+        The table is rebuilt only when one of its cells changed since the
+        previous refresh; otherwise the previous ``Table`` is returned.
+        """
+        by_agent = task_stats['by_agent']
+        no_tasks = {'assigned': 0, 'completed': 0}
+        now = time.time()
+        rows = []
         
         for agent in sorted(agents, key=lambda a: a['agent_id']):
             agent_id = agent['agent_id']
             branch = agent['branch_name'][:23] + '..' if len(agent['branch_name']) > 25 else agent['branch_name']
             
-            agent_tasks = task_stats['by_agent'].get(agent_id, {'assigned': 0, 'completed': 0})
+            agent_tasks = by_agent.get(agent_id, no_tasks)
             tasks = f"{agent_tasks['completed']}/{agent_tasks['assigned']}"
             
-            status_icon = "🟢" if agent['last_commit'] and 'minute' in agent['last_commit'] else "🟡"
+            status_icon = "🟢" if _is_active(agent, now) else "🟡"
             
-            table_text += f"{status_icon} {agent_id:<8} {branch:<25} {tasks:<15} "
-            table_text += f"{agent['commits']:<10} {agent['last_commit']:<20}\n"
-        
-        return table_text
+            rows.append((status_icon, agent_id, branch, tasks, str(agent['commits']), agent['last_commit']))
+        
+        cells: Tuple[Tuple[str, ...], ...] = tuple(rows)
+        if self._agent_table is not None and self._agent_table[0] == cells:
+            return self._agent_table[1]
+        
+        from rich import box
+        from rich.table import Table
+        
+        table = Table(title="🤖 AGENT STATUS", title_justify="left", box=box.SIMPLE_HEAD, show_edge=False)
+        table.add_column("", width=2)
+        table.add_column("Agent", min_width=8)
+        table.add_column("Branch", min_width=25)
+        table.add_column("Tasks", min_width=7)
+        table.add_column("Commits", justify="right")
+        table.add_column("Last Activity", min_width=14)
+        for row in cells:
+            table.add_row(*row)
+        
+        self._agent_table = (cells, table)
+        return table
     
     def _create_blockers_section(self, blockers: List[Dict[str, Any]]) -> str:
         """Create blockers section."""
         if not blockers:
             return ""
         
-        blockers_text = "🚨 ACTIVE BLOCKERS\n"
-        blockers_text += "─" * 80 + "\n"
-        
+        parts = ["🚨 ACTIVE BLOCKERS\n", f"{_RULE_80}\n"]
         for blocker in blockers[:5]:  # Show max 5
-            blockers_text += f"[{blocker['agent_id']}] {blocker['title'][:60]}\n"
+            parts.append(f"[{blocker['agent_id']}] {blocker['title'][:60]}\n")
         
-        return blockers_text
+        return ''.join(parts)
     
     def _create_activity_section(self, activity: List[Dict[str, Any]]) -> str:
         """Create recent activity section."""
         if not activity:
             return ""
         
-        activity_text = "📝 RECENT ACTIVITY (Last 30 min)\n"
-        activity_text += "─" * 80 + "\n"
-        
+        parts = ["📝 RECENT ACTIVITY (Last 30 min)\n", f"{_RULE_80}\n"]
         for act in activity[-5:]:  # Show last 5
             branch_short = act['branch'].split('/')[-1][:15]
             msg = act['message'][:40] + '..' if len(act['message']) > 40 else act['message']
-            activity_text += f"[{branch_short}] {act['commit']} - {msg} ({act['time']})\n"
+            parts.append(f"[{branch_short}] {act['commit']} - {msg} ({act['time']})\n")
         
-        return activity_text
+        return ''.join(parts)
+    
+    def _collect(
+        self, activity: bool
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run the status collectors concurrently.
+        
+        The collectors read disjoint inputs (two registries, the blockers
+        directory and git), and spend their time in file reads and git
+        subprocesses, so they overlap well on a small thread pool that lives
+        as long as the dashboard.
+        
+        Args:
+            activity: Whether to collect recent commit activity as well
+            
+        Returns:
+            Agents, task stats, blockers and recent activity (empty if not collected)
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="swarm-dashboard")
+        
+        futures: List[Future[Any]] = [
+            self._pool.submit(self._get_agent_status),
+            self._pool.submit(self._get_task_status),
+            self._pool.submit(self._get_blockers),
+        ]
+        if activity:
+            futures.append(self._pool.submit(self._get_recent_activity))
+        
+        agents, task_stats, blockers, *recent = [future.result() for future in futures]
+        return agents, task_stats, blockers, recent[0] if recent else []
+    
+    def close(self) -> None:
+        """Shut down the collector thread pool, the git object reader and any commit-graph write."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._cat_file.close()
+        if self._graph_proc is not None:
+            self._graph_proc.wait()
+            self._graph_proc = None
+    
+    def _cached_read(self, name: str, stamp: Tuple[int, int], load: Callable[[], Any]) -> Any:
+        """
+        Return the result of ``load`` unless ``stamp`` matches the last call.
+        
+        Args:
+            name: Cache slot
+            stamp: On-disk state the result depends on, e.g. (mtime_ns, size)
+            load: Function reading the state from disk
+            
+        Returns:
+            Cached or freshly loaded result
+        """
+        cached = self._read_cache.get(name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        result = load()
+        self._read_cache[name] = (stamp, result)
+        return result
     
     def _get_agent_status(self) -> List[Dict[str, Any]]:
         """Get current status of all agents."""
-        agents = []
         agents_file = self.project_dir / "registry" / "agents.csv"
         
-        if not agents_file.exists():
+        try:
+            st = agents_file.stat()
+        except FileNotFoundError:
+            return []
+        
+        def load() -> List[Dict[str, str]]:
+            with open(agents_file, 'r', newline='', buffering=IO_BUFFER_SIZE) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                cols = _column_indices(tuple(header), self.AGENT_COLS)
+                if cols is None:
+                    logger.error(f"Unexpected agent registry header in {agents_file}: {header}")
+                    return []
+                
+                # Keep only the fields the dashboard shows, not whole rows
+                width = max(cols) + 1
+                rows = []
+                for row in reader:
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    if row[cols[0]]:
+                        rows.append({name: row[i] for name, i in zip(self.AGENT_COLS, cols)})
+                return rows
+        
+        # Only the CSV parse is cached; commit info is looked up every time
+        rows = self._cached_read('agents', (st.st_mtime_ns, st.st_size), load)
+        agents = [row.copy() for row in rows]
+        
+        # Latest commit info for all branches with two git calls in total
+        try:
+            heads = self._get_branch_heads([a['branch_name'] for a in agents] + ['main'])
+            counts = self._get_commit_counts(heads)
+        except Exception as e:
+            logger.error(f"Failed to get agent commit info: {e}")
+            for agent in agents:
+                agent['commits'] = 0
+                agent['last_commit'] = 'Unknown'
+                agent['last_commit_ts'] = None
             return agents
         
-        with open(agents_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not row.get('agent_id'):
-                    continue
-                
-                agent = row.copy()
-                
-                # Get latest commit info
-                branch = row['branch_name']
-                try:
-                    # Get commit count
-                    result = subprocess.run(
-                        ['git', 'rev-list', '--count', f'main..{branch}'],
-                        capture_output=True, text=True, cwd=self.repo_root
-                    )
-                    agent['commits'] = int(result.stdout.strip()) if result.returncode == 0 else 0
-                    
-                    # Get last commit time
-                    result = subprocess.run(
-                        ['git', 'log', '-1', '--format=%ar', branch],
-                        capture_output=True, text=True, cwd=self.repo_root
-                    )
-                    agent['last_commit'] = result.stdout.strip() if result.returncode == 0 else 'Never'
-                    
-                except Exception:
-                    agent['commits'] = 0
-                    agent['last_commit'] = 'Unknown'
-                
-                agents.append(agent)
+        for agent in agents:
+            branch = agent['branch_name']
+            agent['commits'] = counts.get(branch, 0)
+            if branch in heads:
+                agent['last_commit'], agent['last_commit_ts'] = heads[branch][1:]
+            else:
+                agent['last_commit'], agent['last_commit_ts'] = 'Never', None
         
         return agents
     
+    def _get_branch_heads(self, branches: List[str]) -> Dict[str, Tuple[str, str, int]]:
+        """
+        Look up the head commit of several local branches.
+        
+        The commits are read from a persistent ``git cat-file --batch`` process,
+        so repeated refreshes do not start a git process for this.
+        
+        Args:
+            branches: Branch names
+            
+        Returns:
+            Mapping of existing branch to (commit SHA, relative commit date, unix commit date)
+        """
+        commits = self._cat_file.commit_times([f'refs/heads/{branch}' for branch in branches])
+        now = int(time.time())
+        
+        heads = {}
+        for branch in branches:
+            commit = commits.get(f'refs/heads/{branch}')
+            if commit is not None:
+                sha, timestamp = commit
+                heads[branch] = (sha, _relative_date(timestamp, now), timestamp)
+        return heads
+    
+    def _get_commit_counts(self, heads: Dict[str, Tuple[str, str, int]]) -> Dict[str, int]:
+        """
+        Count each branch's commits ahead of main (``git rev-list --count main..branch``).
+        
+        Branches whose head and main are unchanged since the last call reuse
+        the cached count; the rest are counted from a single ``git rev-list``
+        over all of them, or walked in-process when pygit2 is installed.
+        
+        Args:
+            heads: Branch heads from ``_get_branch_heads`` (including main)
+            
+        Returns:
+            Mapping of branch to commit count
+        """
+        if 'main' not in heads:
+            return {}
+        main_sha = heads['main'][0]
+        
+        counts = {}
+        stale = {}
+        for branch, (sha, _, _) in heads.items():
+            if branch == 'main':
+                continue
+            cached = self._commit_counts.get(branch)
+            if cached and cached[:2] == (sha, main_sha):
+                counts[branch] = cached[2]
+            else:
+                stale[branch] = sha
+        
+        if stale and self._libgit2 is not None:
+            # In-process walks: no git subprocess at all
+            for branch, sha in stale.items():
+                walker = self._libgit2.walk(sha)
+                walker.hide(main_sha)
+                count = sum(1 for _ in walker)
+                counts[branch] = count
+                self._commit_counts[branch] = (sha, main_sha, count)
+        
+        elif stale:
+            result = subprocess.run(
+                ['git', 'rev-list', '--parents', '^main'] + sorted(set(stale.values())),
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+            if result.returncode != 0:
+                return counts
+            
+            parents: Dict[str, List[str]] = {}
+            for line in result.stdout.splitlines():
+                sha, *commit_parents = line.split()
+                parents[sha] = commit_parents
+            
+            for branch, sha in stale.items():
+                # Walk the commits not on main that this branch reaches
+                seen = set()
+                todo = [sha] if sha in parents else []
+                while todo:
+                    commit = todo.pop()
+                    if commit in seen:
+                        continue
+                    seen.add(commit)
+                    todo.extend(p for p in parents[commit] if p in parents)
+                
+                counts[branch] = len(seen)
+                self._commit_counts[branch] = (sha, main_sha, len(seen))
+        
+        return counts
+    
     def _get_task_status(self) -> Dict[str, Any]:
-        """Get current task completion status."""
-        task_stats = {
+        """
+        Get current task completion status.
+        
+        The counts are recomputed only when ``tasks.csv`` changes. A copy of
+        the cached counts is returned, so callers may modify it.
+        """
+        tasks_file = self.project_dir / "registry" / "tasks.csv"
+        
+        try:
+            st = tasks_file.stat()
+        except FileNotFoundError:
+            st = None
+        
+        stamp = (st.st_mtime_ns, st.st_size) if st else (0, -1)
+        task_stats = self._cached_read('tasks', stamp, lambda: self._read_task_status(tasks_file))
+        return {
+            **task_stats,
+            'by_agent': {agent: dict(counts) for agent, counts in task_stats['by_agent'].items()}
+        }
+    
+    def _read_task_status(self, tasks_file: Path) -> Dict[str, Any]:
+        """Count tasks by status and agent in the task registry."""
+        task_stats: Dict[str, Any] = {
             'total': 0,
             'pending': 0,
             'in_progress': 0,
             'completed': 0,
             'blocked': 0,
-            'by_agent': defaultdict(lambda: {'assigned': 0, 'completed': 0})
+            'by_agent': {}
         }
         
-        tasks_file = self.project_dir / "registry" / "tasks.csv"
-        
         if not tasks_file.exists():
             return task_stats
         
-        with open(tasks_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not row.get('task_id'):
-                    continue
-                
-                task_stats['total'] += 1
-                status = row.get('status', 'pending')
-                
-                if status == 'pending':
-                    task_stats['pending'] += 1
-                elif status == 'in_progress':
-                    task_stats['in_progress'] += 1
-                elif status == 'completed':
-                    task_stats['completed'] += 1
-                elif status == 'blocked':
-                    task_stats['blocked'] += 1
-                
-                agent = row.get('assigned_agent', '')
-                if agent:
-                    task_stats['by_agent'][agent]['assigned'] += 1
-                    if status == 'completed':
-                        task_stats['by_agent'][agent]['completed'] += 1
+        # Plain rows with fixed column indices; no dict is built per task
+        with open(tasks_file, 'r', newline='', buffering=IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            cols = _column_indices(tuple(header), self.TASK_COLS)
+            if cols is None:
+                logger.error(f"Unexpected task registry header in {tasks_file}: {header}")
+                return task_stats
+            
+            id_col, status_col, agent_col = cols
+            width = max(cols) + 1
+            padded = (row if len(row) >= width else row + [''] * (width - len(row)) for row in reader)
+            
+            # One count per (status, agent) pair; everything else is derived from these
+            pairs = Counter((row[status_col], row[agent_col]) for row in padded if row[id_col])
+        
+        by_agent = task_stats['by_agent']
+        for (status, agent), count in pairs.items():
+            task_stats['total'] += count
+            if status in _TASK_STATUSES:
+                task_stats[status] += count
+            
+            if agent:
+                agent_tasks = by_agent.get(agent)
+                if agent_tasks is None:
+                    agent_tasks = by_agent[agent] = {'assigned': 0, 'completed': 0}
+                agent_tasks['assigned'] += count
+                if status == 'completed':
+                    agent_tasks['completed'] += count
         
         return task_stats
     
     def _get_blockers(self) -> List[Dict[str, Any]]:
-        """Get current blockers."""
-        blockers = []
+        """
+        Get current blockers.
+        
+        Blocker files are created and deleted but not rewritten in place, so
+        the directory's mtime and entry count tell whether they need re-reading.
+        """
         blockers_dir = self.coord_dir / "blockers"
         
-        if not blockers_dir.exists():
-            return blockers
+        try:
+            stamp = (blockers_dir.stat().st_mtime_ns, len(os.listdir(blockers_dir)))
+        except FileNotFoundError:
+            return []
         
-        for blocker_file in blockers_dir.glob("BLOCKER-*.json"):
-            try:
-                with open(blocker_file, 'r') as f:
-                    blocker = json.load(f)
+        return list(self._cached_read('blockers', stamp, lambda: self._read_blockers(blockers_dir)))
+    
+    def _read_blockers(self, blockers_dir: Path) -> List[Dict[str, Any]]:
+        """Load the open blockers from a blockers directory."""
+        blockers = []
+        parsed: Dict[str, Tuple[int, Any]] = {}
+        
+        # Only files whose mtime changed since the last scan are parsed again
+        with os.scandir(blockers_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('BLOCKER-') and entry.name.endswith('.json')):
+                    continue
+                
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                    cached = self._blocker_files.get(entry.path)
+                    if cached is not None and cached[0] == mtime:
+                        blocker = cached[1]
+                    else:
+                        with open(entry.path, 'rb') as f:
+                            blocker = loads_json(f.read())
+                    parsed[entry.path] = (mtime, blocker)
+                    
                     if blocker.get('status') == 'open':
                         blockers.append(blocker)
-            except Exception:
-                pass
+                except Exception:
+                    pass
         
+        self._blocker_files = parsed
         return blockers
     
     def _get_recent_activity(self, minutes: int = 30) -> List[Dict[str, Any]]:
         """Get recent commit activity."""
         activity = []
+        pattern = f'swarm-agent-{self.project_name}-*'
         
         try:
-            # Get all swarm branches
+            # One revision walk over all agent branches, local and remote;
+            # --source records which branch each commit was reached from
             result = subprocess.run(
-                ['git', 'branch', '-r'],
+                ['git', 'log', f'--branches={pattern}', f'--remotes=*/{pattern}', '--source',
+                 '--since', f'{minutes} minutes ago', '--format=%h%x1f%ct%x1f%ar%x1f%an%x1f%S%x1f%s'],
                 capture_output=True, text=True, cwd=self.repo_root
             )
             
             if result.returncode != 0:
                 return activity
             
-            branches = [
-                b.strip() for b in result.stdout.split('\n')
-                if f'swarm-agent-{self.project_name}' in b
-            ]
-            
-            for branch in branches:
-                # Get recent commits
-                result = subprocess.run(
-                    ['git', 'log', branch, '--since', f'{minutes} minutes ago',
-                     '--format=%h|%ar|%s|%an'],
-                    capture_output=True, text=True, cwd=self.repo_root
-                )
+            # %s is always a single line; as the last field it may hold anything else
+            for line in result.stdout.splitlines():
+                parts = line.split('\x1f', 5)
+                if len(parts) != 6:
+                    continue
                 
-                if result.returncode == 0 and result.stdout:
-                    for line in result.stdout.strip().split('\n'):
-                        parts = line.split('|')
-                        if len(parts) == 4:
-                            activity.append({
-                                'commit': parts[0],
-                                'time': parts[1],
-                                'message': parts[2],
-                                'author': parts[3],
-                                'branch': branch
-                            })
+                branch = parts[4]
+                for prefix in ('refs/heads/', 'refs/remotes/'):
+                    if branch.startswith(prefix):
+                        branch = branch[len(prefix):]
+                        break
+                
+                activity.append({
+                    'commit': parts[0],
+                    'timestamp': int(parts[1]),
+                    'time': parts[2],
+                    'message': parts[5],
+                    'author': parts[3],
+                    'branch': branch
+                })
         
         except Exception as e:
             logger.error(f"Failed to get recent activity: {e}")
         
-        return sorted(activity, key=lambda x: x['time'])
+        # Oldest first, so the activity section's last entries are the newest
+        return sorted(activity, key=lambda x: x['timestamp'])
     
     def _calculate_metrics(self, agents: List[Dict[str, Any]], task_stats: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate performance metrics."""
-        metrics = {
+        """
+        Calculate performance metrics.
+        
+        The metrics depend only on a few aggregates of the inputs; while those
+        are unchanged they are not recomputed. A copy is returned, so callers
+        may modify it.
+        """
+        now = time.time()
+        total_commits = sum(a['commits'] for a in agents)
+        active_agents = sum(1 for a in agents if _is_active(a, now))
+        key = (len(agents), total_commits, active_agents, task_stats['total'], task_stats['completed'])
+        
+        if self._metrics is not None and self._metrics[0] == key:
+            return dict(self._metrics[1])
+        
+        metrics: Dict[str, Any] = {
             'completion_rate': 0,
             'avg_commits_per_agent': 0,
             'active_agents': 0,
@@ -345,23 +925,20 @@ class SwarmDashboard:
             'tasks_per_hour': 0,
             'estimated_completion': 'Unknown'
         }
+        self._metrics = (key, metrics)
         
         if not agents:
-            return metrics
+            return dict(metrics)
         
         # Completion rate
         if task_stats['total'] > 0:
             metrics['completion_rate'] = (task_stats['completed'] / task_stats['total']) * 100
         
         # Average commits
-        total_commits = sum(a['commits'] for a in agents)
         metrics['avg_commits_per_agent'] = total_commits / len(agents)
         
         # Active agents (committed in last hour)
-        for agent in agents:
-            last_commit = agent.get('last_commit', '')
-            if last_commit and ('minute' in last_commit or 'hour ago' in last_commit):
-                metrics['active_agents'] += 1
+        metrics['active_agents'] = active_agents
         
         # Simple completion estimate
         if task_stats['completed'] > 0 and metrics['active_agents'] > 0:
@@ -373,7 +950,7 @@ class SwarmDashboard:
             else:
                 metrics['estimated_completion'] = "Complete!"
         
-        return metrics
+        return dict(metrics)
     
     def get_status_summary(self) -> Dict[str, Any]:
         """
@@ -382,9 +959,7 @@ class SwarmDashboard:
         Returns:
             Status summary dictionary
         """
-        agents = self._get_agent_status()
-        task_stats = self._get_task_status()
-        blockers = self._get_blockers()
+        agents, task_stats, blockers, _ = self._collect(activity=False)
         metrics = self._calculate_metrics(agents, task_stats)
         
         return {
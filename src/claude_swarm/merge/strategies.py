@@ -4,19 +4,125 @@ Smart Merge Strategies for Claude Swarm
 Handles dependency-aware merging, conflict prediction, and automated resolution.
 """
 
+import asyncio
+import csv
+import os
+import shutil
 import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional, Tuple
 
 import git
-import networkx as nx
 from git.exc import GitCommandError
 
-from ..utils.helpers import setup_logging
+from ..utils.helpers import IO_BUFFER_SIZE, setup_logging, topological_order
 
 logger = setup_logging(__name__)
 
+# Merge orders keyed by registry path: {path: (st_mtime_ns, st_size, order)},
+# least recently used first and capped at _ORDER_CACHE_SIZE entries.
+_ORDER_CACHE_SIZE = 16
+_ORDER_CACHE: "OrderedDict[str, Tuple[int, int, Optional[List[str]]]]" = OrderedDict()
+
+# Merges started with execute_merge_async() run here, one per CPU at most
+_MERGE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="swarm-merge")
+
+# One lock per working tree: merges check out and commit in the repository
+# itself, so those started on the pool for the same repo_root run one at a time
+_REPO_LOCKS: Dict[str, threading.Lock] = {}
+_REPO_LOCKS_GUARD = threading.Lock()
+
+# Lines kept in a merger's log; older ones are dropped
+MERGE_LOG_LIMIT = 10_000
+
+# Conflicted files of these types are resolved by taking the incoming side
+_THEIRS_EXTENSIONS = ('.md', '.json', '.txt')
+
+# Pairwise trial merges allowed per prediction to pin conflicts on branches
+CONFLICT_PAIR_CHECKS = 64
+
+# Trial merge commits are never referenced, so any identity will do
+_TRIAL_IDENTITY = {
+    'GIT_AUTHOR_NAME': 'claude-swarm', 'GIT_AUTHOR_EMAIL': 'claude-swarm@localhost',
+    'GIT_COMMITTER_NAME': 'claude-swarm', 'GIT_COMMITTER_EMAIL': 'claude-swarm@localhost',
+}
+
+
+def _agent_merge_order(task_registry: Path) -> Optional[List[str]]:
+    """
+    Order the agents of a task registry so dependencies are merged first.
+    
+    Results are memoized on the file's mtime and size, so repeated merges
+    against an unchanged registry skip parsing and sorting.
+    
+    Args:
+        task_registry: Path to the project's ``tasks.csv``
+        
+    Returns:
+        Agent ids in merge order, or None if their dependencies form a cycle
+    """
+    stat = task_registry.stat()
+    path = str(task_registry)
+    cached = _ORDER_CACHE.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _ORDER_CACHE.move_to_end(path)
+        return None if cached[2] is None else list(cached[2])
+    
+    agent_tasks: Dict[str, Dict[str, List[str]]] = {}
+    
+    with open(task_registry, 'r', newline='', buffering=IO_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        columns = {name: i for i, name in enumerate(header)}
+        task_col = columns.get('task_id', -1)
+        agent_col = columns.get('assigned_agent', -1)
+        deps_col = columns.get('dependencies', -1)
+        
+        if task_col >= 0 and agent_col >= 0:
+            # Plain rows indexed by column, not a dict per row
+            for row in reader:
+                if len(row) <= max(task_col, agent_col):
+                    continue
+                task_id = row[task_col]
+                agent = row[agent_col]
+                if not (task_id and agent):
+                    continue
+                
+                data = agent_tasks.setdefault(agent, {'tasks': [], 'deps': []})
+                data['tasks'].append(task_id)
+                if 0 <= deps_col < len(row) and row[deps_col]:
+                    data['deps'].extend(d for d in row[deps_col].split(';') if d)
+    
+    # Which agents hold each task, so each dependency is one lookup
+    task_owners: Dict[str, List[str]] = {}
+    for agent, data in agent_tasks.items():
+        for task_id in data['tasks']:
+            owners = task_owners.setdefault(task_id, [])
+            if not owners or owners[-1] != agent:
+                owners.append(agent)
+    
+    # Add edges based on dependencies
+    edges = []
+    for agent, data in agent_tasks.items():
+        for dep_task in data['deps']:
+            for other_agent in task_owners.get(dep_task, ()):
+                if other_agent != agent:
+                    edges.append((other_agent, agent))
+    
+    # Generation by generation, in registry order (the order networkx produced)
+    ordered, cyclic = topological_order(agent_tasks, edges)
+    agent_order = None if cyclic else ordered
+    
+    _ORDER_CACHE[path] = (stat.st_mtime_ns, stat.st_size, agent_order)
+    if len(_ORDER_CACHE) > _ORDER_CACHE_SIZE:
+        _ORDER_CACHE.popitem(last=False)
+    return None if agent_order is None else list(agent_order)
+
 
 class SmartMerger:
     """
@@ -45,8 +151,16 @@ class SmartMerger:
         except git.InvalidGitRepositoryError:
             raise ValueError(f"Not in a git repository: {self.work_dir}")
         
-        self.merge_log: List[str] = []
+        # Most recent log lines for the merge report
+        self.merge_log: Deque[str] = deque(maxlen=MERGE_LOG_LIMIT)
+        self._log_second = -1
+        self._log_stamp = ''
         self.conflicts: List[Dict[str, Any]] = []
+        
+        # Remote agent branches, listed once per merge (see refresh())
+        self._agent_branches: Optional[List[str]] = None
+        # Resolved test tool executables by name (None if not on PATH)
+        self._which_cache: Dict[str, Optional[str]] = {}
     
     def execute_merge(
         self,
@@ -82,20 +196,15 @@ class SmartMerger:
             else:
                 merge_order = sorted(branches)
             
-            # Predict conflicts
-            conflicts = self._predict_conflicts(branches)
+            # Predict conflicts in the order the branches will be merged
+            conflicts = self._predict_conflicts(merge_order)
             self._log(f"Predicted {len(conflicts)} potential conflicts")
             
             # Create merge branch
             merge_branch = self._create_merge_branch()
             
             # Execute merges
-            merged_count = 0
-            for branch in merge_order:
-                if self._merge_branch(branch, verbose):
-                    merged_count += 1
-                else:
-                    self._log(f"Failed to merge {branch}", "ERROR")
+            merged_count = self._merge_branches(merge_order, conflicts, verbose)
             
             # Run tests if possible
             test_result = self._run_tests()
@@ -127,32 +236,74 @@ class SmartMerger:
                 'error': str(e)
             }
     
+    def refresh(self) -> None:
+        """Forget the cached list of agent branches."""
+        self._agent_branches = None
+    
     def _get_agent_branches(self) -> List[str]:
-        """Get all agent branches for the project."""
+        """
+        Get all agent branches for the project.
+        
+        The remote branches are listed once and cached until ``refresh()`` or
+        the next ``_create_merge_branch()``, which pulls from origin.
+        """
+        if self._agent_branches is not None:
+            return self._agent_branches
+        
         try:
-            # Get remote branches
+            # Let git filter the remote refs by glob instead of listing them all
+            remote = "refs/remotes/origin/"
             result = subprocess.run(
-                ['git', 'branch', '-r'],
+                ['git', 'for-each-ref', '--format=%(refname)',
+                 f"{remote}swarm-agent-{self.project_name}-*"],
                 capture_output=True, text=True, cwd=self.repo_root
             )
             
             if result.returncode != 0:
                 return []
             
-            branches = []
-            prefix = f"origin/swarm-agent-{self.project_name}-"
-            
-            for line in result.stdout.split('\n'):
-                branch = line.strip()
-                if branch.startswith(prefix):
-                    branches.append(branch.replace('origin/', ''))
+            branches = [
+                ref[len(remote):] for ref in result.stdout.splitlines() if ref.startswith(remote)
+            ]
             
+            self._agent_branches = branches
             return branches
             
         except Exception as e:
             logger.error(f"Failed to get agent branches: {e}")
             return []
     
+    async def execute_merge_async(
+        self,
+        strategy: str = "smart",
+        verbose: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute the complete merge process without blocking the event loop.
+        
+        The merge, including its test run of up to five minutes, runs on a
+        shared pool with one worker per CPU, so an orchestrator can
+        ``asyncio.gather`` merges in different repositories and overlap their
+        test suites. Merges in the same working tree (e.g. several projects of
+        one repository) are serialized on a per-``repo_root`` lock.
+        
+        Args:
+            strategy: Merge strategy ("smart", "sequential", "manual")
+            verbose: Enable verbose logging
+            
+        Returns:
+            Merge result summary
+        """
+        with _REPO_LOCKS_GUARD:
+            repo_lock = _REPO_LOCKS.setdefault(str(self.repo_root), threading.Lock())
+        
+        def merge() -> Dict[str, Any]:
+            with repo_lock:
+                return self.execute_merge(strategy, verbose)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_MERGE_POOL, merge)
+    
     def _analyze_dependencies(self) -> List[str]:
         """Analyze task dependencies to determine merge order."""
         self._log("Analyzing dependencies for optimal merge order...")
@@ -165,55 +316,24 @@ class SmartMerger:
             branches = self._get_agent_branches()
             return sorted(branches)
         
-        # Build dependency graph (simplified)
         try:
-            import csv
-            
-            G = nx.DiGraph()
-            agent_tasks = {}
-            
-            with open(task_registry, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    task_id = row.get('task_id')
-                    agent = row.get('assigned_agent')
-                    deps = row.get('dependencies', '').split(';')
-                    
-                    if task_id and agent:
-                        if agent not in agent_tasks:
-                            agent_tasks[agent] = {'tasks': [], 'deps': []}
-                        
-                        agent_tasks[agent]['tasks'].append(task_id)
-                        agent_tasks[agent]['deps'].extend([d for d in deps if d])
-            
-            # Add nodes for agents
-            for agent in agent_tasks:
-                G.add_node(agent)
-            
-            # Add edges based on dependencies
-            for agent, data in agent_tasks.items():
-                for dep_task in data['deps']:
-                    # Find which agent has this dependency
-                    for other_agent, other_data in agent_tasks.items():
-                        if dep_task in other_data['tasks'] and other_agent != agent:
-                            G.add_edge(other_agent, agent)
-            
-            # Topological sort
-            try:
-                agent_order = list(nx.topological_sort(G))
-                
-                # Convert back to branch names
+            agent_order = _agent_merge_order(task_registry)
+            if agent_order is not None:
+                # Convert back to branch names: agent-<n> -> swarm-agent-<project>-<n>
+                prefix = f"swarm-agent-{self.project_name}-"
+                branch_by_number = {
+                    branch[len(prefix):]: branch for branch in self._get_agent_branches()
+                }
                 branches = []
                 for agent in agent_order:
-                    branch = f"swarm-agent-{self.project_name}-{agent.split('-')[-1]}"
-                    if branch in self._get_agent_branches():
+                    branch = branch_by_number.get(agent.rpartition('-')[2])
+                    if branch is not None:
                         branches.append(branch)
                 
                 self._log(f"Optimal merge order: {branches}")
                 return branches
-                
-            except nx.NetworkXUnfeasible:
-                self._log("Circular dependencies detected, using default order", "WARNING")
+            
+            self._log("Circular dependencies detected, using default order", "WARNING")
                 
         except Exception as e:
             logger.error(f"Failed to analyze dependencies: {e}")
@@ -223,42 +343,227 @@ class SmartMerger:
         return sorted(branches)
     
     def _predict_conflicts(self, branches: List[str]) -> List[Dict[str, Any]]:
-        """Predict potential merge conflicts."""
+        """
+        Predict potential merge conflicts.
+        
+        Branches that change a file another branch also changes are
+        trial-merged one by one, in merge order, onto the running result of
+        the clean merges before them, which is what the real merge does. That
+        is one ``git merge-tree`` per branch; a branch that conflicts is left
+        out of the running result and its conflicts are pinned on the merged
+        branches that changed the same files, with at most
+        ``CONFLICT_PAIR_CHECKS`` extra pairwise merges per prediction.
+        
+        Args:
+            branches: Branches in merge order
+            
+        Returns:
+            Conflicts as dicts with the ``file``, the ``branches`` involved
+            (in merge order) and a ``severity``
+        """
         self._log("Predicting potential conflicts...")
         
-        conflicts = []
-        file_changes = {}
+        changes = self._diff_files(branches)
+        file_changes: Dict[str, List[str]] = {}
         
         # Collect all file changes by branch
+        for branch, changed_files in changes.items():
+            for file in changed_files:
+                file_changes.setdefault(file, []).append(branch)
+        
+        shared = {file for file, branches_list in file_changes.items() if len(branches_list) > 1}
+        
+        conflicted: Dict[str, List[str]] = {}
+        running: Optional[str] = None
+        merged: List[str] = []
+        pair_checks = CONFLICT_PAIR_CHECKS
         for branch in branches:
-            try:
-                result = subprocess.run(
-                    ['git', 'diff', '--name-only', f'main...{branch}'],
-                    capture_output=True, text=True, cwd=self.repo_root
-                )
-                
-                if result.returncode == 0:
-                    changed_files = [f for f in result.stdout.strip().split('\n') if f]
-                    for file in changed_files:
-                        if file not in file_changes:
-                            file_changes[file] = []
-                        file_changes[file].append(branch)
-                        
-            except Exception as e:
-                logger.error(f"Failed to get changes for {branch}: {e}")
-        
-        # Identify files changed by multiple branches
-        for file, branches_list in file_changes.items():
-            if len(branches_list) > 1:
-                conflicts.append({
-                    'file': file,
-                    'branches': branches_list,
-                    'severity': 'high' if len(branches_list) > 2 else 'medium'
-                })
-                self._log(f"Potential conflict in {file}: modified by {len(branches_list)} branches", "WARNING")
+            if shared.isdisjoint(changes.get(branch, ())):
+                continue
+            if running is None:
+                running = branch
+                merged.append(branch)
+                continue
+            
+            trial = self._trial_merge(running, branch)
+            if trial is not None and not trial[1]:
+                commit = self._trial_commit(trial[0], running, branch)
+                if commit is not None:
+                    running = commit
+                    merged.append(branch)
+                continue
+            
+            # Without a trial merge, fall back to the shared files
+            files = [f for f in changes[branch] if f in shared] if trial is None else trial[1]
+            for file in files:
+                owners = [b for b in merged if b in file_changes.get(file, ())]
+                culprits = owners
+                if len(owners) > 1 and pair_checks >= len(owners):
+                    # Pin the conflict on the merged branches it reproduces with
+                    pair_checks -= len(owners)
+                    culprits = []
+                    for owner in owners:
+                        pair = self._trial_merge(owner, branch)
+                        if pair is None or file in pair[1]:
+                            culprits.append(owner)
+                conflicted.setdefault(file, []).extend((culprits or owners) + [branch])
+        
+        rank = {branch: i for i, branch in enumerate(branches)}
+        conflicts = []
+        for file, branches_list in conflicted.items():
+            involved = sorted(set(branches_list), key=lambda b: rank.get(b, len(rank)))
+            conflicts.append({
+                'file': file,
+                'branches': involved,
+                'severity': 'high' if len(involved) > 2 else 'medium'
+            })
+            self._log(f"Potential conflict in {file}: conflicts between {len(involved)} branches", "WARNING")
         
         return conflicts
     
+    def _trial_merge(self, first: str, second: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Merge two commits in memory and list the files that conflict.
+        
+        Uses ``git merge-tree --write-tree`` (git 2.38+), which neither
+        touches the working tree nor the index.
+        
+        Args:
+            first: One branch or commit
+            second: The other branch or commit
+            
+        Returns:
+            The merged tree and the conflicted file paths (empty if the
+            commits merge cleanly), or None if the trial merge could not be run
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'merge-tree', '--write-tree', '--name-only', '--no-messages', '-z',
+                 first, second],
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+        except Exception as e:
+            logger.error(f"Failed to trial-merge {first} and {second}: {e}")
+            return None
+        
+        if result.returncode not in (0, 1):
+            logger.debug(f"Cannot trial-merge {first} and {second}: {result.stderr.strip()}")
+            return None
+        
+        # Output is the merged tree id followed by the conflicted paths
+        tree, *files = result.stdout.split('\0')
+        return tree, [f for f in files if f]
+    
+    def _trial_commit(self, tree: str, first: str, second: str) -> Optional[str]:
+        """
+        Record a trial merge as a dangling commit so later trials build on it.
+        
+        Args:
+            tree: Merged tree from ``_trial_merge()``
+            first: First parent
+            second: Second parent
+            
+        Returns:
+            The commit id, or None if it could not be created
+        """
+        result = subprocess.run(
+            ['git', 'commit-tree', tree, '-p', first, '-p', second, '-m', "Trial merge"],
+            capture_output=True, text=True, cwd=self.repo_root,
+            env={**os.environ, **_TRIAL_IDENTITY}
+        )
+        if result.returncode != 0:
+            logger.debug(f"Cannot record trial merge of {second}: {result.stderr.strip()}")
+            return None
+        return result.stdout.strip()
+    
+    def _diff_files(self, branches: List[str]) -> Dict[str, List[str]]:
+        """
+        List the files each branch changed since it forked from main.
+        
+        Equivalent to ``git diff --name-only main...<branch>`` per branch,
+        but done with three git processes in total: one resolves the branch
+        tips, one their merge bases with main, and one ``diff-tree --stdin``
+        diffs every tip against its merge base.
+        
+        Args:
+            branches: Branches to diff
+            
+        Returns:
+            Changed file paths by branch, in branch order (empty for
+            branches that could not be diffed)
+        """
+        changes: Dict[str, List[str]] = {branch: [] for branch in branches}
+        if not branches:
+            return changes
+        
+        def git_cmd(*args: str, stdin: str = '') -> Optional[str]:
+            result = subprocess.run(
+                ['git', *args], input=stdin,
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+            if result.returncode != 0:
+                logger.error(f"Failed to get branch changes: {result.stderr.strip()}")
+                return None
+            return result.stdout
+        
+        try:
+            # Resolve tips without failing the whole batch on a missing branch
+            output = git_cmd(
+                'cat-file', '--batch-check=%(objectname) %(objecttype)',
+                stdin=''.join(f"{branch}^{{commit}}\n" for branch in branches)
+            )
+            if output is None:
+                return changes
+            tips = {}
+            for branch, line in zip(branches, output.splitlines()):
+                sha, _, kind = line.partition(' ')
+                if kind == 'commit':
+                    tips[branch] = sha
+                else:
+                    logger.error(f"Failed to get changes for {branch}: not a commit")
+            if not tips:
+                return changes
+            
+            # rev-parse prints "<tip>", "<main>" and "^<base>" lines per range
+            distinct = list(dict.fromkeys(tips.values()))
+            output = git_cmd('rev-parse', *(f"main...{tip}" for tip in distinct))
+            if output is None:
+                return changes
+            bases: Dict[str, str] = {}
+            tip: Optional[str] = None
+            seen_main = True
+            for line in output.split():
+                if line.startswith('^'):
+                    if tip is not None:
+                        bases.setdefault(tip, line[1:])
+                elif seen_main:
+                    tip, seen_main = line, False
+                else:
+                    seen_main = True
+            
+            # Headers are the tip being diffed; tips without changes print nothing
+            output = git_cmd(
+                'diff-tree', '--stdin', '-r', '--name-only', '-z',
+                stdin=''.join(f"{tip} {bases[tip]}\n" for tip in distinct if tip in bases)
+            )
+            if output is None:
+                return changes
+            files: Dict[str, List[str]] = {}
+            current: List[str] = []
+            for token in output.split('\0'):
+                if token in bases and token not in files:
+                    current = files[token] = []
+                elif token:
+                    current.append(token)
+            
+            for branch, tip in tips.items():
+                changes[branch] = list(files.get(tip, ()))
+                
+        except Exception as e:
+            logger.error(f"Failed to get branch changes: {e}")
+        
+        return changes
+    
     def _create_merge_branch(self) -> str:
         """Create a new branch for the merge operation."""
         merge_branch = f"merge/{self.project_name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
@@ -275,12 +580,121 @@ class SmartMerger:
             new_branch = self.repo.create_head(merge_branch)
             new_branch.checkout()
             
+            # The pull may have fetched new remote agent branches
+            self.refresh()
+            
             return merge_branch
             
         except Exception as e:
             logger.error(f"Failed to create merge branch: {e}")
             raise
     
+    def _merge_branches(
+        self,
+        merge_order: List[str],
+        conflicts: List[Dict[str, Any]],
+        verbose: bool = False
+    ) -> int:
+        """
+        Merge branches into the checked-out merge branch, in order.
+        
+        Branches without predicted conflicts are merged speculatively in
+        memory: each merge commit is built on top of the previous one with
+        ``git merge-tree`` and ``git commit-tree``, leaving the working tree
+        alone. The merge branch is fast-forwarded to the speculative head
+        before a branch needs a working-tree merge (a predicted or actual
+        conflict, which may be auto-resolved) and once at the end.
+        
+        Args:
+            merge_order: Branches in the order they should be merged
+            conflicts: Predicted conflicts from ``_predict_conflicts()``
+            verbose: Enable verbose logging
+            
+        Returns:
+            Number of branches merged
+        """
+        risky = {branch for conflict in conflicts for branch in conflict['branches']}
+        head = self.repo.head.commit
+        merged_count = 0
+        speculative = None  # (commit, tree) not yet checked out
+        pending = 0  # Branches merged into the speculative head only
+        
+        for branch in merge_order:
+            if branch not in risky:
+                base = speculative or (head.hexsha, head.tree.hexsha)
+                merged = self._merge_in_memory(branch, *base)
+                if merged is not None:
+                    speculative = merged
+                    pending += 1
+                    self._log(f"Merging {branch}")
+                    self._log(f"Successfully merged {branch}", "SUCCESS")
+                    continue
+            
+            # Needs the working tree: catch up with the speculative merges first
+            if speculative is not None:
+                if not self._fast_forward(speculative[0]):
+                    return merged_count
+                merged_count += pending
+                speculative, pending = None, 0
+            
+            if self._merge_branch(branch, verbose):
+                merged_count += 1
+            else:
+                self._log(f"Failed to merge {branch}", "ERROR")
+            head = self.repo.head.commit
+        
+        if speculative is not None and self._fast_forward(speculative[0]):
+            merged_count += pending
+        
+        return merged_count
+    
+    def _merge_in_memory(self, branch: str, head: str, head_tree: str) -> Optional[Tuple[str, str]]:
+        """
+        Create the merge commit of ``branch`` onto ``head`` without a checkout.
+        
+        Args:
+            branch: Branch to merge
+            head: Commit to merge into
+            head_tree: Tree of ``head``
+            
+        Returns:
+            The merge commit and its tree, or None if the branch conflicts or
+            cannot be merged this way (then merge it in the working tree)
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'merge-tree', '--write-tree', '--no-messages', head, branch],
+                capture_output=True, text=True, cwd=self.repo_root
+            )
+            if result.returncode != 0:
+                return None
+            tree = result.stdout.split('\n', 1)[0]
+            
+            # Like ``git merge --no-ff``, an already merged branch adds nothing
+            if tree == head_tree and subprocess.run(
+                ['git', 'merge-base', '--is-ancestor', branch, head],
+                capture_output=True, cwd=self.repo_root
+            ).returncode == 0:
+                return head, head_tree
+            
+            commit = self.repo.git.commit_tree(
+                tree, '-p', head, '-p', branch, '-m', f"feat: merge {branch}"
+            )
+            return commit, tree
+            
+        except Exception as e:
+            logger.debug(f"In-memory merge of {branch} failed: {e}")
+            return None
+    
+    def _fast_forward(self, commit: str) -> bool:
+        """Advance the checked-out merge branch, index and working tree to ``commit``."""
+        try:
+            self.repo.git.merge('--ff-only', commit)
+            return True
+        except GitCommandError as e:
+            self._log(f"Failed to check out speculative merges: {e}", "ERROR")
+            return False
+    
     def _merge_branch(self, branch: str, verbose: bool = False) -> bool:
         """Merge a single branch."""
         self._log(f"Merging {branch}")
@@ -298,11 +712,11 @@ class SmartMerger:
             # Get conflict files
             try:
                 result = subprocess.run(
-                    ['git', 'diff', '--name-only', '--diff-filter=U'],
+                    ['git', 'diff', '-z', '--name-only', '--diff-filter=U'],
                     capture_output=True, text=True, cwd=self.repo_root
                 )
                 
-                conflict_files = [f for f in result.stdout.strip().split('\n') if f]
+                conflict_files = [f for f in result.stdout.split('\0') if f]
                 
                 conflict_info = {
                     'branch': branch,
@@ -319,50 +733,54 @@ class SmartMerger:
                     return True
                 else:
                     # Abort merge
-                    self.repo.git.merge('--abort')
+                    if self._in_merge():
+                        self.repo.git.merge('--abort')
                     self._log(f"Could not auto-resolve conflicts in {branch}, skipping", "ERROR")
                     return False
                     
             except Exception as resolution_error:
                 logger.error(f"Failed to handle conflict resolution: {resolution_error}")
                 try:
-                    self.repo.git.merge('--abort')
+                    if self._in_merge():
+                        self.repo.git.merge('--abort')
                 except:
                     pass
                 return False
     
+    def _in_merge(self) -> bool:
+        """Return whether a merge is in progress, so there is one to abort."""
+        return (Path(self.repo.git_dir) / 'MERGE_HEAD').exists()
+    
     def _auto_resolve_conflicts(self, conflict_files: List[str]) -> bool:
         """Attempt to automatically resolve conflicts."""
-        resolved_all = True
+        files = [file for file in conflict_files if file]
         
-        for file in conflict_files:
-            if not file:
-                continue
-            
-            self._log(f"Attempting to auto-resolve {file}")
-            
-            # Simple strategy: prefer incoming changes for certain file types
-            if file.endswith(('.md', '.json', '.txt')) or 'generated' in file.lower():
-                try:
-                    self.repo.git.checkout('--theirs', file)
-                    self.repo.git.add(file)
-                    self._log(f"Resolved {file} by taking incoming changes")
-                except Exception as e:
-                    logger.error(f"Failed to resolve {file}: {e}")
-                    resolved_all = False
-            else:
-                # For code files, we're more conservative
-                resolved_all = False
+        # Simple strategy: prefer incoming changes for certain file types.
+        # For code files we're more conservative, and a single one means the
+        # merge is aborted, so don't touch any file in that case.
+        for file in files:
+            if not (file.endswith(_THEIRS_EXTENSIONS) or 'generated' in file.lower()):
+                self._log(f"Cannot auto-resolve {file}")
+                return False
         
-        if resolved_all:
+        if files:
+            self._log(f"Attempting to auto-resolve {len(files)} files")
             try:
-                self.repo.git.commit('--no-edit')
-                return True
+                # One checkout and one add for all files
+                self.repo.git.checkout('--theirs', '--', *files)
+                self.repo.git.add('--', *files)
+                for file in files:
+                    self._log(f"Resolved {file} by taking incoming changes")
             except Exception as e:
-                logger.error(f"Failed to commit resolved conflicts: {e}")
+                logger.error(f"Failed to resolve {files}: {e}")
                 return False
         
-        return False
+        try:
+            self.repo.git.commit('--no-edit')
+            return True
+        except Exception as e:
+            logger.error(f"Failed to commit resolved conflicts: {e}")
+            return False
     
     def _run_tests(self) -> bool:
         """Run tests after merge to ensure nothing is broken."""
@@ -379,9 +797,12 @@ class SmartMerger:
         for cmd in test_commands:
             try:
                 # Check if command exists
-                if subprocess.run(['which', cmd[0]], capture_output=True).returncode == 0:
+                if cmd[0] not in self._which_cache:
+                    self._which_cache[cmd[0]] = shutil.which(cmd[0])
+                path = self._which_cache[cmd[0]]
+                if path is not None:
                     result = subprocess.run(
-                        cmd, capture_output=True, text=True, 
+                        [path, *cmd[1:]], capture_output=True, text=True, 
                         cwd=self.repo_root, timeout=300
                     )
                     
@@ -401,40 +822,47 @@ class SmartMerger:
     
     def _generate_merge_report(self) -> None:
         """Generate detailed merge report."""
-        report_file = self.project_dir / "reports" / f"merge_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        now = datetime.now()
+        report_file = self.project_dir / "reports" / f"merge_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
         report_file.parent.mkdir(exist_ok=True)
         
         branches = self._get_agent_branches()
+        resolved_count = sum(1 for c in self.conflicts if c.get('resolved'))
+        
+        # Build the report in memory and write it once
+        parts = [
+            f"# Merge Report for {self.project_name}\n\n",
+            f"**Date**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "## Summary\n",
+            f"- Total branches to merge: {len(branches)}\n",
+            f"- Conflicts encountered: {len(self.conflicts)}\n",
+            f"- Auto-resolved conflicts: {resolved_count}\n\n",
+        ]
+        
+        if self.conflicts:
+            parts.append("## Conflicts\n")
+            for conflict in self.conflicts:
+                parts.append(f"\n### {conflict['branch']}\n")
+                parts.append("**Files with conflicts:**\n")
+                parts.extend(f"- {file}\n" for file in conflict['files'])
+                parts.append(f"**Resolved**: {'Yes' if conflict.get('resolved') else 'No'}\n")
+        
+        parts.append("\n## Merge Log\n```\n")
+        parts.append("\n".join(self.merge_log))
+        parts.append("\n```\n")
         
-        with open(report_file, 'w') as f:
-            f.write(f"# Merge Report for {self.project_name}\n\n")
-            f.write(f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write("## Summary\n")
-            f.write(f"- Total branches to merge: {len(branches)}\n")
-            f.write(f"- Conflicts encountered: {len(self.conflicts)}\n")
-            f.write(f"- Auto-resolved conflicts: {len([c for c in self.conflicts if c.get('resolved')])}\n\n")
-            
-            if self.conflicts:
-                f.write("## Conflicts\n")
-                for conflict in self.conflicts:
-                    f.write(f"\n### {conflict['branch']}\n")
-                    f.write("**Files with conflicts:**\n")
-                    for file in conflict['files']:
-                        f.write(f"- {file}\n")
-                    f.write(f"**Resolved**: {'Yes' if conflict.get('resolved') else 'No'}\n")
-            
-            f.write("\n## Merge Log\n")
-            f.write("```\n")
-            f.write("\n".join(self.merge_log))
-            f.write("\n```\n")
+        report_file.write_text(''.join(parts))
         
         self._log(f"Merge report saved to: {report_file}")
     
     def _log(self, message: str, level: str = "INFO") -> None:
         """Log merge operations."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}"
+        # Many lines share a second, so format the timestamp once per second
+        now = int(time.time())
+        if now != self._log_second:
+            self._log_second = now
+            self._log_stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        log_entry = f"[{self._log_stamp}] [{level}] {message}"
         self.merge_log.append(log_entry)
         
         if level == "ERROR":
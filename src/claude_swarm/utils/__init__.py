@@ -1,10 +1,22 @@
 """Utility modules for Claude Swarm Coordinator."""
 
+from typing import TYPE_CHECKING, Any
+
 from .helpers import setup_logging, generate_id
-from .git import GitWorktreeManager
+
+if TYPE_CHECKING:
+    from .git import GitWorktreeManager
 
 __all__ = [
     "setup_logging",
     "generate_id", 
     "GitWorktreeManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # GitWorktreeManager pulls in GitPython; import it on first access (PEP 562)
+    if name == "GitWorktreeManager":
+        from .git import GitWorktreeManager
+        return GitWorktreeManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@
 
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 
 import git
 from git.exc import GitCommandError
@@ -33,24 +33,36 @@ class GitWorktreeManager:
             self.repo = git.Repo(self.repo_path)
         except git.InvalidGitRepositoryError:
             raise ValueError(f"Not a valid git repository: {repo_path}")
+        
+        # Full names of all refs, listed once for branch_exists()
+        self._ref_set: Optional[FrozenSet[str]] = None
     
     def create_worktree(
         self,
         path: Path,
         branch: str,
-        base_branch: str = "main"
+        base_branch: str = "main",
+        reference: Optional[Path] = None
     ) -> bool:
         """
         Create a new git worktree.
         
+        Linked worktrees already share the main repository's object database;
+        submodules do not. With ``reference``, submodules that are initialized
+        in the reference repository are initialized in the new worktree with
+        ``--reference`` so they borrow its objects instead of cloning them.
+        
         Args:
             path: Path for the new worktree
             branch: Name of the new branch
             base_branch: Base branch to branch from
+            reference: Repository root whose submodule objects should be shared
             
         Returns:
             True if successful, False otherwise
         """
+        self._ref_set = None  # A branch may be created even if this fails
+        
         try:
             # Check if branch exists on remote
             remote_branch = f"origin/{branch}"
@@ -71,12 +83,47 @@ class GitWorktreeManager:
                 logger.info(f"Creating new worktree at {path} with branch {branch}")
                 self.repo.git.worktree('add', '-b', branch, str(path), base_branch)
             
+            if reference is not None:
+                self._share_submodule_objects(Path(path), Path(reference))
+            
             return True
             
         except GitCommandError as e:
             logger.error(f"Failed to create worktree {path}: {e}")
             return False
     
+    def _share_submodule_objects(self, worktree: Path, reference: Path) -> None:
+        """
+        Initialize a worktree's submodules against a reference repository.
+        
+        Args:
+            worktree: Newly created worktree
+            reference: Repository root holding the submodule object stores
+        """
+        if not (worktree / ".gitmodules").exists():
+            return
+        
+        try:
+            output = self.repo.git.config(
+                '-f', str(worktree / ".gitmodules"), '--get-regexp', r'^submodule\..*\.path$'
+            )
+        except GitCommandError:
+            return
+        
+        for line in output.splitlines():
+            key, _, sub_path = line.partition(' ')
+            name = key[len('submodule.'):-len('.path')]
+            modules_dir = reference / ".git" / "modules" / name
+            if not modules_dir.is_dir():
+                continue  # Not initialized in the reference repository either
+            
+            try:
+                git.Repo(worktree).git.submodule(
+                    'update', '--init', '--reference', str(modules_dir), '--', sub_path
+                )
+            except GitCommandError as e:
+                logger.warning(f"Failed to share objects for submodule {name} in {worktree}: {e}")
+    
     def remove_worktree(self, path: Path, force: bool = False) -> bool:
         """
         Remove a git worktree.
@@ -109,24 +156,30 @@ class GitWorktreeManager:
             List of worktree information dictionaries
         """
         try:
-            output = self.repo.git.worktree('list', '--porcelain')
+            try:
+                output = self.repo.git.worktree('list', '--porcelain', '-z')
+                sep = '\0'
+            except GitCommandError:
+                # -z needs git 2.36; older versions separate fields with newlines,
+                # which only breaks on paths that contain one
+                output = self.repo.git.worktree('list', '--porcelain')
+                sep = '\n'
             worktrees = []
             
-            current_worktree = {}
-            for line in output.split('\n'):
-                if line.startswith('worktree '):
-                    if current_worktree:
-                        worktrees.append(current_worktree)
-                    current_worktree = {'path': line[9:]}  # Remove 'worktree ' prefix
-                elif line.startswith('HEAD '):
-                    current_worktree['head'] = line[5:]
-                elif line.startswith('branch '):
-                    current_worktree['branch'] = line[7:]
-                elif line == 'bare':
-                    current_worktree['bare'] = True
-            
-            if current_worktree:
-                worktrees.append(current_worktree)
+            # Records end with an empty field; fields are "<name> <value>"
+            for record in output.split(sep * 2):
+                fields = dict(field.partition(' ')[::2] for field in record.split(sep) if field)
+                if 'worktree' not in fields:
+                    continue
+                
+                worktree = {'path': fields['worktree']}
+                if 'HEAD' in fields:
+                    worktree['head'] = fields['HEAD']
+                if 'branch' in fields:
+                    worktree['branch'] = fields['branch']
+                if 'bare' in fields:
+                    worktree['bare'] = True
+                worktrees.append(worktree)
             
             return worktrees
             
@@ -162,8 +215,8 @@ class GitWorktreeManager:
             List of changed file paths
         """
         try:
-            output = self.repo.git.diff('--name-only', f'{base_branch}...{branch}')
-            return output.split('\n') if output.strip() else []
+            output = self.repo.git.diff('-z', '--name-only', f'{base_branch}...{branch}')
+            return [f for f in output.split('\0') if f]
             
         except GitCommandError as e:
             logger.error(f"Failed to get branch changes for {branch}: {e}")
@@ -199,10 +252,10 @@ class GitWorktreeManager:
             Dictionary with commit information or None if failed
         """
         try:
-            commit_hash = self.repo.git.log('-1', '--format=%h', branch)
-            commit_time = self.repo.git.log('-1', '--format=%ar', branch)
-            commit_message = self.repo.git.log('-1', '--format=%s', branch)
-            commit_author = self.repo.git.log('-1', '--format=%an', branch)
+            # One git log for all fields; the subject goes last so a stray
+            # separator in it cannot shift the other fields
+            output = self.repo.git.log('-1', '--format=%h%x1f%ar%x1f%an%x1f%s', branch)
+            commit_hash, commit_time, commit_author, commit_message = output.split('\x1f', 3)
             
             return {
                 'hash': commit_hash.strip(),
@@ -211,7 +264,7 @@ class GitWorktreeManager:
                 'author': commit_author.strip()
             }
             
-        except GitCommandError as e:
+        except (GitCommandError, ValueError) as e:
             logger.error(f"Failed to get commit info for {branch}: {e}")
             return None
     
@@ -226,13 +279,21 @@ class GitWorktreeManager:
         Returns:
             True if branch exists, False otherwise
         """
-        try:
-            ref = f"refs/remotes/origin/{branch}" if remote else f"refs/heads/{branch}"
-            self.repo.git.show_ref('--verify', '--quiet', ref)
-            return True
-            
-        except GitCommandError:
-            return False
+        ref = f"refs/remotes/origin/{branch}" if remote else f"refs/heads/{branch}"
+        return ref in self._refs()
+    
+    def _refs(self) -> FrozenSet[str]:
+        """
+        Get the full names of all refs, read in-process once and cached.
+        
+        The cache is dropped by the methods that create or delete refs.
+        
+        Returns:
+            Set of ref names such as ``refs/heads/main``
+        """
+        if self._ref_set is None:
+            self._ref_set = frozenset(ref.path for ref in self.repo.references)
+        return self._ref_set
     
     def create_archive_tag(self, tag_name: str, branch: str) -> bool:
         """
@@ -247,6 +308,7 @@ class GitWorktreeManager:
         """
         try:
             self.repo.create_tag(tag_name, branch)
+            self._ref_set = None
             logger.info(f"Created archive tag {tag_name} for branch {branch}")
             return True
             
@@ -287,6 +349,7 @@ class GitWorktreeManager:
         try:
             flag = '-D' if force else '-d'
             self.repo.git.branch(flag, branch)
+            self._ref_set = None
             logger.info(f"Deleted branch {branch}")
             return True
             
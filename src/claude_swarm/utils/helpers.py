@@ -1,11 +1,32 @@
 """Helper utilities for Claude Swarm Coordinator."""
 
+import functools
+import importlib.util
+import json
 import logging
-import uuid
+import os
+import re
+import sys
+import threading
 import hashlib
-from typing import Optional
+import heapq
+import itertools
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar, Union
 from pathlib import Path
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+NodeT = TypeVar("NodeT", bound=Hashable)
+
+# Buffer size for bulk CSV reads/writes (plans can run to several MB)
+IO_BUFFER_SIZE = 1 << 20
+
 
 def setup_logging(name: str, level: int = logging.INFO) -> logging.Logger:
     """
@@ -32,6 +53,119 @@ def setup_logging(name: str, level: int = logging.INFO) -> logging.Logger:
     return logger
 
 
+logger = setup_logging(__name__)
+
+
+def find_repo_root(start: Path) -> Optional[Path]:
+    """
+    Find the working tree root containing ``start`` without running git.
+    
+    Args:
+        start: Directory to search from
+        
+    Returns:
+        Repository root, or None if no ``.git`` was found
+    """
+    start = Path(start).resolve()
+    for directory in (start, *start.parents):
+        if git_dir_for(directory) is not None:
+            return directory
+    return None
+
+
+def git_dir_for(repo_root: Path, common: bool = False) -> Optional[Path]:
+    """
+    Find the git directory of a working tree without running git.
+    
+    Linked worktrees and submodules have a ``.git`` file holding a
+    ``gitdir: <path>`` pointer instead of a directory; a linked worktree's
+    git directory in turn names the main repository's in ``commondir``.
+    
+    Args:
+        repo_root: Working tree root
+        common: Return the directory shared by all worktrees (refs, objects)
+            instead of the worktree's own (HEAD, index)
+        
+    Returns:
+        Git directory, or None if ``repo_root`` has no ``.git``
+    """
+    dot_git = Path(repo_root) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    
+    try:
+        with open(dot_git, 'r') as f:
+            pointer = f.readline().strip()
+    except OSError:
+        return None
+    if not pointer.startswith("gitdir:"):
+        return None
+    
+    git_dir = (dot_git.parent / pointer[len("gitdir:"):].strip()).resolve()
+    if common:
+        try:
+            git_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+        except OSError:
+            pass  # Submodules have no commondir
+    return git_dir
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily.
+    
+    The returned module is registered in ``sys.modules`` but only executed on
+    first attribute access, so heavy optional-path dependencies cost nothing
+    for callers that never touch them.
+    
+    Args:
+        name: Absolute module name
+        
+    Returns:
+        The (possibly not yet loaded) module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {name!r}")
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def utc_now() -> datetime:
+    """
+    Return the current time as a timezone-aware UTC datetime.
+    
+    Replaces the deprecated ``datetime.utcnow()``, which returns a naive value.
+    
+    Returns:
+        Current UTC time
+    """
+    return datetime.now(timezone.utc)
+
+
+# Per-thread buffer of random bytes handed out by generate_id()
+_ID_POOL_SIZE = 4096
+_id_entropy = threading.local()
+
+
+def _reset_id_entropy() -> None:
+    """Discard the buffered randomness so a forked child cannot repeat the parent's IDs."""
+    global _id_entropy
+    _id_entropy = threading.local()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_entropy)
+
+
 def generate_id(prefix: str = "", length: int = 8) -> str:
     """
     Generate a unique ID.
@@ -43,34 +177,68 @@ def generate_id(prefix: str = "", length: int = 8) -> str:
     Returns:
         Unique ID string
     """
-    random_part = str(uuid.uuid4()).replace('-', '')[:length]
+    nbytes = (length + 1) // 2
+    pool = _id_entropy
+    buf = getattr(pool, 'buf', b'')
+    off = getattr(pool, 'off', 0)
+    if off + nbytes > len(buf):
+        # Draw randomness in bulk instead of one urandom call per ID
+        buf = pool.buf = os.urandom(max(_ID_POOL_SIZE, nbytes))
+        off = 0
+    pool.off = off + nbytes
+    
+    random_part = buf[off:off + nbytes].hex()[:length]
     return f"{prefix}{random_part}" if prefix else random_part
 
 
-def hash_content(content: str) -> str:
+# Longest string whose digest is memoized; longer content is rarely repeated
+# and would only pin memory in the cache
+_HASH_CACHE_MAX_LEN = 1024
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_str(content: str) -> str:
+    """Hash a short string for hash_content(), memoized."""
+    return hashlib.blake2b(content.encode('utf-8', 'replace'), digest_size=8).hexdigest()
+
+
+def hash_content(content: Union[str, bytes]) -> str:
     """
-    Generate MD5 hash of content.
+    Generate a short BLAKE2b hash of content.
+    
+    The 64-bit digest is meant for cache and change-detection keys, not for
+    security. Bytes (or other buffers) are hashed as-is; strings as UTF-8.
+    Digests of short strings are memoized, since the same names and
+    descriptions tend to be hashed over and over.
     
     Args:
         content: Content to hash
         
     Returns:
-        MD5 hash string
+        16-character hex digest
     """
-    return hashlib.md5(content.encode()).hexdigest()
+    if isinstance(content, str):
+        if len(content) <= _HASH_CACHE_MAX_LEN:
+            return _hash_str(content)
+        content = content.encode('utf-8', 'replace')
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
 
 
 def ensure_directory(path: Path) -> Path:
     """
     Ensure directory exists, creating if necessary.
     
+    An existing directory costs one stat; ``mkdir`` (which walks and
+    creates the parents) only runs when it is missing.
+    
     Args:
         path: Directory path
         
     Returns:
         The path (for chaining)
     """
-    path.mkdir(parents=True, exist_ok=True)
+    if not os.path.isdir(path):
+        path.mkdir(parents=True, exist_ok=True)
     return path
 
 
@@ -86,9 +254,46 @@ def read_file_safe(path: Path, default: str = "") -> str:
         File content or default
     """
     try:
-        return path.read_text(encoding='utf-8')
+        # Unbuffered: read() sizes one read to the file instead of 8 KiB chunks
+        with open(path, 'rb', buffering=0) as f:
+            text = f.read().decode('utf-8')
     except FileNotFoundError:
         return default
+    
+    return _universal_newlines(text)
+
+
+def read_and_hash(path: Path, default: str = "") -> Tuple[str, str]:
+    """
+    Read a file like read_file_safe() and hash its content in the same pass.
+    
+    The digest is taken over the raw bytes as read, so the text is never
+    encoded again for hashing. It matches hash_content() of those bytes,
+    which differs from hash_content() of the text for files with CRLF
+    line endings.
+    
+    Args:
+        path: File path
+        default: Default content if file doesn't exist
+        
+    Returns:
+        Tuple of (file content or default, 16-character hex digest)
+    """
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            data = f.read()
+    except FileNotFoundError:
+        return default, hash_content(default)
+    
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    return _universal_newlines(data.decode('utf-8')), digest
+
+
+def _universal_newlines(text: str) -> str:
+    """Translate CRLF and lone CR line endings to LF, as text mode would."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def write_file_safe(path: Path, content: str) -> bool:
@@ -102,20 +307,181 @@ def write_file_safe(path: Path, content: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    data = content.encode('utf-8')
     try:
-        ensure_directory(path.parent)
-        path.write_text(content, encoding='utf-8')
+        try:
+            f = open(path, 'wb', buffering=0)
+        except FileNotFoundError:
+            # Only create the directories when they are actually missing
+            ensure_directory(path.parent)
+            f = open(path, 'wb', buffering=0)
+        
+        # One unbuffered write for the whole file
+        with f:
+            view = memoryview(data)
+            while view:
+                view = view[f.write(view):]
         return True
     except Exception as e:
-        logger = setup_logging(__name__)
         logger.error(f"Failed to write file {path}: {e}")
         return False
 
 
+def write_files(files: Iterable[Tuple[Path, bytes]]) -> None:
+    """
+    Write pre-serialized files with raw ``os.write`` calls.
+    
+    Each file is written without Python's buffered/text I/O layers, looping
+    until every byte is out so a short write never truncates the file.
+    
+    Args:
+        files: (path, content) pairs to write
+    """
+    for path, data in files:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize JSON-compatible data with two-space indentation.
+    
+    Uses orjson when it is installed and falls back to the stdlib otherwise.
+    Pydantic models should be dumped with ``model_dump(mode="json")`` first.
+    
+    Args:
+        data: JSON-compatible data
+        
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def write_json(path: Path, data: Any) -> None:
+    """
+    Write JSON-compatible data to a file with two-space indentation.
+    
+    Args:
+        path: File path
+        data: JSON-compatible data
+    """
+    path.write_bytes(dumps_json(data))
+
+
+def read_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        path: File path
+        
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def dumps_json_line(data: Any) -> bytes:
+    """
+    Serialize data as a single compact JSON line (newline terminated).
+    
+    Args:
+        data: JSON-compatible data
+        
+    Returns:
+        Encoded line
+    """
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON from bytes or text.
+    
+    Args:
+        data: Encoded JSON or a JSON string
+        
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def topological_order(
+    nodes: Iterable[NodeT],
+    edges: Iterable[Tuple[NodeT, NodeT]],
+    key: Optional[Callable[[NodeT], Any]] = None
+) -> Tuple[List[NodeT], List[NodeT]]:
+    """
+    Order graph nodes so that every edge ``(u, v)`` puts ``u`` before ``v``.
+    
+    Kahn's algorithm. Among the nodes whose predecessors have all been
+    emitted, the one with the smallest ``key`` goes first (ties keep input
+    order); without a key, ready nodes come out first in, first out, i.e.
+    generation by generation in input order. Parallel edges count once.
+    
+    Args:
+        nodes: Graph nodes
+        edges: Directed edges between nodes
+        key: Sort key used to pick among ready nodes
+        
+    Returns:
+        (ordered nodes, nodes caught in a cycle in input order)
+    """
+    node_list = list(nodes)
+    position = {node: i for i, node in enumerate(node_list)}
+    in_degree = [0] * len(node_list)
+    successors: List[Dict[int, None]] = [{} for _ in node_list]
+    for u, v in edges:
+        u_pos, v_pos = position[u], position[v]
+        if v_pos not in successors[u_pos]:
+            successors[u_pos][v_pos] = None
+            in_degree[v_pos] += 1
+    
+    # Heap entries are (priority, position); without a key the priority is a
+    # push counter, which turns the heap into a FIFO queue
+    counter = itertools.count()
+    
+    def priority(i: int) -> Any:
+        return next(counter) if key is None else key(node_list[i])
+    
+    ready = [(priority(i), i) for i in range(len(node_list)) if not in_degree[i]]
+    heapq.heapify(ready)
+    
+    ordered = []
+    while ready:
+        _, i = heapq.heappop(ready)
+        ordered.append(node_list[i])
+        for child in successors[i]:
+            in_degree[child] -= 1
+            if not in_degree[child]:
+                heapq.heappush(ready, (priority(child), child))
+    
+    cyclic = [node_list[i] for i in range(len(node_list)) if in_degree[i]]
+    return ordered, cyclic
+
+
+@functools.lru_cache(maxsize=4096)
 def format_duration(minutes: int) -> str:
     """
     Format duration in minutes to human-readable string.
     
+    Results are cached; durations repeat a lot in reports and logs.
+    
     Args:
         minutes: Duration in minutes
         
@@ -127,11 +493,19 @@ def format_duration(minutes: int) -> str:
     
     hours = minutes // 60
     remaining_minutes = minutes % 60
+    unit = "hour" if hours == 1 else "hours"
     
     if remaining_minutes == 0:
-        return f"{hours} hour{'s' if hours != 1 else ''}"
+        return f"{hours} {unit}"
     
-    return f"{hours} hour{'s' if hours != 1 else ''} {remaining_minutes} minutes"
+    return f"{hours} {unit} {remaining_minutes} minutes"
+
+
+# HTTPS and SSH remote URLs: host, owner and repository name
+_GIT_URL_RES = (
+    ('https', re.compile(r'https://([^/]+)/([^/]+)/([^/.]+)(?:\.git)?')),
+    ('ssh', re.compile(r'git@([^:]+):([^/]+)/([^/.]+)(?:\.git)?')),
+)
 
 
 def parse_git_url(url: str) -> Optional[dict]:
@@ -144,30 +518,10 @@ def parse_git_url(url: str) -> Optional[dict]:
     Returns:
         Dictionary with URL components or None if invalid
     """
-    import re
-    
-    # HTTPS URL pattern
-    https_pattern = r'https://([^/]+)/([^/]+)/([^/.]+)(?:\.git)?'
-    https_match = re.match(https_pattern, url)
-    
-    if https_match:
-        return {
-            'protocol': 'https',
-            'host': https_match.group(1),
-            'owner': https_match.group(2),
-            'repo': https_match.group(3)
-        }
-    
-    # SSH URL pattern
-    ssh_pattern = r'git@([^:]+):([^/]+)/([^/.]+)(?:\.git)?'
-    ssh_match = re.match(ssh_pattern, url)
-    
-    if ssh_match:
-        return {
-            'protocol': 'ssh',
-            'host': ssh_match.group(1),
-            'owner': ssh_match.group(2),
-            'repo': ssh_match.group(3)
-        }
+    for protocol, pattern in _GIT_URL_RES:
+        match = pattern.match(url)
+        if match:
+            host, owner, repo = match.groups()
+            return {'protocol': protocol, 'host': host, 'owner': owner, 'repo': repo}
     
     return None
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""Shared fixtures for the test suite."""
+
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pytest
+
+
+class GitRepo:
+    """A scratch git repository with a ``main`` branch and an initial commit."""
+    
+    def __init__(self, path: Path, files: Optional[Dict[str, str]] = None):
+        """
+        Create the repository.
+        
+        Args:
+            path: Directory to create the repository in
+            files: Files (name -> content) for the initial commit, which is
+                empty if none are given
+        """
+        self.path = path
+        path.mkdir(parents=True)
+        self.git("init", "-b", "main")
+        
+        for name, content in (files or {}).items():
+            (path / name).write_text(content)
+        if files:
+            self.git("add", *files)
+        self.git("commit", "--allow-empty", "-m", "Initial commit")
+    
+    def git(self, *args: str) -> subprocess.CompletedProcess:
+        """
+        Run a git command in the repository with a test identity.
+        
+        Args:
+            *args: git arguments
+        
+        Returns:
+            The completed process, with text output
+        """
+        return subprocess.run(
+            ["git", "-c", "user.email=test@example.com", "-c", "user.name=Test", *args],
+            cwd=self.path, check=True, capture_output=True, text=True
+        )
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Callable[..., GitRepo]:
+    """Create scratch repositories under ``tmp_path``: ``git_repo(name="repo", files=None)``."""
+    def make(name: str = "repo", files: Optional[Dict[str, str]] = None) -> GitRepo:
+        return GitRepo(tmp_path / name, files)
+    
+    return make
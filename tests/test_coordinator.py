@@ -1,70 +1,76 @@
 """Tests for the swarm coordinator."""
 
+import json
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import git
 import pytest
 
-from claude_swarm.core.coordinator import SwarmCoordinator, ProjectConfig
+from claude_swarm.core.coordinator import SwarmCoordinator, ProjectConfig, _dump_config
+
+
+class _FakeRepo:
+    """The parts of git.Repo the coordinator uses, without Mock's overhead."""
+    
+    def __init__(self, commits=(), working_tree_dir="/tmp/test-repo"):
+        self.working_tree_dir = working_tree_dir
+        self.active_branch = SimpleNamespace(name="main")
+        self._commits = list(commits)
+    
+    def iter_commits(self, *args, **kwargs):
+        return iter(self._commits)
+
+
+@pytest.fixture
+def mock_repo():
+    """Patch GitPython's Repo in the coordinator with a fake repository."""
+    with patch('claude_swarm.core.coordinator.git.Repo') as mock_repo:
+        mock_repo.return_value = _FakeRepo(commits=[object(), object(), object()])
+        yield mock_repo
 
 
 class TestSwarmCoordinator:
     """Test cases for SwarmCoordinator."""
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_init(self, mock_repo):
+    def test_init(self, mock_repo, tmp_path):
         """Test SwarmCoordinator initialization."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo.return_value = mock_repo_instance
+        coordinator = SwarmCoordinator("test-project", tmp_path)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
-            
-            assert coordinator.project_name == "test-project"
-            assert coordinator.work_dir == Path(temp_dir)
-            assert coordinator.projects_dir == Path(temp_dir) / ".claude-swarm" / "projects"
-            assert coordinator.project_dir == Path(temp_dir) / ".claude-swarm" / "projects" / "test-project"
+        assert coordinator.project_name == "test-project"
+        assert coordinator.work_dir == tmp_path
+        assert coordinator.projects_dir == tmp_path / ".claude-swarm" / "projects"
+        assert coordinator.project_dir == tmp_path / ".claude-swarm" / "projects" / "test-project"
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_init_invalid_git_repo(self, mock_repo):
+    def test_init_invalid_git_repo(self, mock_repo, tmp_path):
         """Test initialization with invalid git repository."""
         mock_repo.side_effect = git.InvalidGitRepositoryError("Not a git repo")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with pytest.raises(ValueError, match="Not in a git repository"):
-                SwarmCoordinator("test-project", Path(temp_dir))
+        with pytest.raises(ValueError, match="Not in a git repository"):
+            SwarmCoordinator("test-project", tmp_path)
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_initialize_project(self, mock_repo):
+    def test_initialize_project(self, mock_repo, tmp_path):
         """Test project initialization."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo.return_value = mock_repo_instance
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=5, description="Test project")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
-            coordinator.initialize_project(num_agents=5, description="Test project")
-            
-            # Check if directories were created
-            assert coordinator.project_dir.exists()
-            assert (coordinator.project_dir / "config").exists()
-            assert (coordinator.project_dir / "tasks").exists()
-            assert (coordinator.project_dir / "registry").exists()
-            
-            # Check if config file was created
-            config_file = coordinator.project_dir / "config" / "swarm.json"
-            assert config_file.exists()
-            
-            # Check if registries were created
-            agents_registry = coordinator.project_dir / "registry" / "agents.csv"
-            tasks_registry = coordinator.project_dir / "registry" / "tasks.csv"
-            assert agents_registry.exists()
-            assert tasks_registry.exists()
+        # Check if directories were created
+        assert coordinator.project_dir.exists()
+        assert (coordinator.project_dir / "config").exists()
+        assert (coordinator.project_dir / "tasks").exists()
+        assert (coordinator.project_dir / "registry").exists()
+        
+        # Check if config file was created
+        config_file = coordinator.project_dir / "config" / "swarm.json"
+        assert config_file.exists()
+        
+        # Check if registries were created
+        agents_registry = coordinator.project_dir / "registry" / "agents.csv"
+        tasks_registry = coordinator.project_dir / "registry" / "tasks.csv"
+        assert agents_registry.exists()
+        assert tasks_registry.exists()
     
     def test_project_config_model(self):
         """Test ProjectConfig model."""
@@ -80,79 +86,241 @@ class TestSwarmCoordinator:
         assert config.branch_prefix == "swarm-agent"
         assert config.status == "initialized"
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_get_set_active_project(self, mock_repo):
+    def test_get_set_active_project(self, mock_repo, tmp_path):
         """Test getting and setting active project."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo.return_value = mock_repo_instance
+        # Initially no active project
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        assert SwarmCoordinator.get_active_project() is None
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Initially no active project
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
-            assert SwarmCoordinator.get_active_project() is None
-            
-            # Set active project
-            coordinator.set_active_project()
-            
-            # Now should return the project name
-            # Note: This test might not work perfectly due to the way get_active_project works
-            # but it demonstrates the API
+        # Set active project
+        coordinator.set_active_project()
+        
+        # Now should return the project name
+        # Note: This test might not work perfectly due to the way get_active_project works
+        # but it demonstrates the API
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_load_config(self, mock_repo):
+    def test_load_config(self, mock_repo, tmp_path):
         """Test loading project configuration."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo.return_value = mock_repo_instance
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=8)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
-            coordinator.initialize_project(num_agents=8)
-            
-            # Load the config
-            config = coordinator._load_config()
-            
-            assert isinstance(config, ProjectConfig)
-            assert config.project_name == "test-project"
-            assert config.num_agents == 8
+        # Load the config
+        config = coordinator._load_config()
+        
+        assert isinstance(config, ProjectConfig)
+        assert config.project_name == "test-project"
+        assert config.num_agents == 8
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_load_config_not_found(self, mock_repo):
+    def test_load_config_not_found(self, mock_repo, tmp_path):
         """Test loading config when file doesn't exist."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo.return_value = mock_repo_instance
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        
+        with pytest.raises(FileNotFoundError, match="Project configuration not found"):
+            coordinator._load_config()
+    
+    def test_load_config_cached(self, mock_repo, tmp_path):
+        """Test that an unchanged config file is parsed only once."""
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=3)
+        
+        config = coordinator._load_config()
+        assert coordinator._load_config() is config
         
+        config_file = coordinator.project_dir / "config" / "swarm.json"
+        config_file.write_text(config_file.read_text().replace('"num_agents": 3', '"num_agents": 12'))
+        assert coordinator._load_config().num_agents == 12
+    
+    def test_saved_config_is_not_parsed_again(self, mock_repo, tmp_path, monkeypatch):
+        """Test that a config written by the coordinator is loaded from memory."""
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=3)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("config parsed")
+        
+        monkeypatch.setattr(ProjectConfig, "model_validate_json", fail)
+        config = coordinator._load_config()
+        assert config.num_agents == 3
+        
+        config.status = "cleaned"
+        coordinator._save_config(config)
+        assert coordinator._load_config().status == "cleaned"
+        assert '"status": "cleaned"' in (coordinator.project_dir / "config" / "swarm.json").read_text()
+    
+    def test_dump_config_matches_model(self):
+        """Test that the hand-written config serializer matches Pydantic's."""
+        config = ProjectConfig(project_name="test-project", num_agents=3, description="demo")
+        
+        assert ProjectConfig.model_validate_json(_dump_config(config)) == config
+        assert list(json.loads(_dump_config(config))) == list(json.loads(config.model_dump_json()))
+    
+    def test_get_status(self, mock_repo, tmp_path):
+        """Test getting swarm status."""
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=5)
+        
+        status = coordinator.get_status()
+        
+        assert "active_agents" in status
+        assert "total_agents" in status
+        assert "completed_tasks" in status
+        assert "total_tasks" in status
+        assert "open_blockers" in status
+        assert "recent_commits" in status
+        
+        assert status["total_agents"] == 5
+    
+    def test_get_status_counts_registry_tasks(self, mock_repo, tmp_path):
+        """Test that task counts follow edits to tasks.csv."""
+        mock_repo.return_value = _FakeRepo()
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=2)
+        
+        registry = coordinator.project_dir / "registry" / "tasks.csv"
+        with open(registry, "a") as f:
+            f.write("TASK-0001,a,general,low,,agent-1,completed,,,\n")
+            f.write("TASK-0002,b,general,low,,agent-2,pending,,,\n")
+        
+        status = coordinator.get_status()
+        assert status["total_tasks"] == 2
+        assert status["completed_tasks"] == 1
+        
+        # Agents mark tasks done in the CSV
+        registry.write_text(registry.read_text().replace(",pending,", ",completed,"))
+        status = coordinator.get_status()
+        assert status["completed_tasks"] == 2
+        assert not (coordinator.project_dir / "registry" / "swarm.db").exists()
+    
+    def test_create_worktrees(self, mock_repo, tmp_path):
+        """Test that all agents are provisioned and registered in order."""
+        # Worktrees go next to the repository, so keep both inside tmp_path
+        repo_dir = tmp_path / "repo"
+        repo_dir.mkdir()
+        
+        mock_repo.return_value = _FakeRepo(working_tree_dir=str(repo_dir))
+        
+        coordinator = SwarmCoordinator("test-project", repo_dir)
+        coordinator.initialize_project(num_agents=12)
+        coordinator.git_manager = Mock()
+        
+        def create_worktree(path, branch, base_branch, reference=None):
+            path.mkdir(parents=True)
+            return True
+        
+        coordinator.git_manager.create_worktree.side_effect = create_worktree
+        coordinator._create_worktrees(coordinator._load_config())
+        
+        assert coordinator.git_manager.create_worktree.call_count == 12
+        
+        registry = coordinator.project_dir / "registry" / "agents.csv"
+        rows = registry.read_text().splitlines()[1:]
+        assert [row.split(',')[0] for row in rows] == [f"agent-{i}" for i in range(1, 13)]
+        
+        worktree = Path(rows[0].split(',')[2])
+        assert (worktree / ".swarm" / "agent.json").exists()
+    
+    def test_count_registry_tasks(self, mock_repo, tmp_path):
+        """Test counting tasks in a CSV task registry."""
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        registry = tmp_path / "tasks.csv"
+        
+        registry.write_text("")
+        assert coordinator._count_registry_tasks(registry) == (0, 0)
+        
+        registry.write_text(
+            "task_id,description,status\n"
+            "TASK-0001,a,completed,\n"
+            "TASK-0002,b,pending,\n"
+            "TASK-0003,c,pending,"
+        )
+        assert coordinator._count_registry_tasks(registry) == (3, 1)
+    
+    def test_find_repo_root(self):
+        """Test repository discovery from the filesystem."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
+            root = Path(temp_dir).resolve()
+            nested = root / "main" / "src" / "pkg"
+            nested.mkdir(parents=True)
+            (root / "main" / ".git").mkdir()
             
-            with pytest.raises(FileNotFoundError, match="Project configuration not found"):
-                coordinator._load_config()
+            worktree = root / "worktree"
+            worktree.mkdir()
+            (worktree / ".git").write_text(f"gitdir: {root / 'main' / '.git' / 'worktrees' / 'wt'}\n")
+            
+            assert SwarmCoordinator._find_repo_root(nested) == root / "main"
+            assert SwarmCoordinator._find_repo_root(worktree) == worktree
     
-    @patch('claude_swarm.core.coordinator.git.Repo')
-    def test_get_status(self, mock_repo):
-        """Test getting swarm status."""
-        # Mock git repository
-        mock_repo_instance = Mock()
-        mock_repo_instance.working_tree_dir = "/tmp/test-repo"
-        mock_repo_instance.iter_commits.return_value = [Mock(), Mock(), Mock()]
-        mock_repo.return_value = mock_repo_instance
+    def test_generate_launch_instructions(self, mock_repo, tmp_path):
+        """Test that a single launch script serves every agent."""
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        coordinator.initialize_project(num_agents=3)
+        coordinator._generate_launch_instructions(coordinator._load_config(), "parallel")
+        
+        launch_dir = coordinator.project_dir / "launch"
+        assert sorted(p.name for p in launch_dir.iterdir()) == ["README.md", "start_agent.sh"]
+        assert "Terminal 3: ./start_agent.sh 3" in (launch_dir / "README.md").read_text()
+    
+    def test_archive_directory(self, mock_repo, tmp_path):
+        """Test archiving a directory into a tarball."""
+        import tarfile
+        
+        coordinator = SwarmCoordinator("test-project", tmp_path)
+        source = tmp_path / "coord"
+        (source / "blockers").mkdir(parents=True)
+        (source / "blockers" / "BLOCKER-1.json").write_text("{}")
+        
+        archive = coordinator._archive_directory(source, tmp_path / "archive")
         
+        assert archive.exists()
+        if archive.name.endswith(".tar.gz"):
+            with tarfile.open(archive) as tar:
+                assert "./blockers/BLOCKER-1.json" in tar.getnames()
+    
+    def test_archive_branches(self, git_repo):
+        """Test that existing agent branches are tagged in one batch."""
+        repo = git_repo()
+        repo.git("branch", "swarm-agent-test-project-1")
+        repo.git("branch", "swarm-agent-test-project-3")
+        
+        coordinator = SwarmCoordinator("test-project", repo.path)
+        coordinator.initialize_project(num_agents=3)
+        coordinator._archive_branches(coordinator._load_config(), "archive/test")
+        
+        assert repo.git("tag").stdout.split() == [
+            "archive/test-agent-1",
+            "archive/test-agent-3",
+        ]
+    
+    def test_current_branch_read_from_head(self):
+        """Test reading the checked-out branch without GitPython."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            coordinator = SwarmCoordinator("test-project", Path(temp_dir))
-            coordinator.initialize_project(num_agents=5)
+            root = Path(temp_dir)
+            (root / ".git").mkdir()
+            (root / ".git" / "HEAD").write_text("ref: refs/heads/feature/x\n")
             
-            status = coordinator.get_status()
+            coordinator = SwarmCoordinator("test-project", root)
+            assert coordinator._current_branch() == "feature/x"
             
-            assert "active_agents" in status
-            assert "total_agents" in status
-            assert "completed_tasks" in status
-            assert "total_tasks" in status
-            assert "open_blockers" in status
-            assert "recent_commits" in status
+            worktree_git = root / ".git" / "worktrees" / "wt"
+            worktree_git.mkdir(parents=True)
+            (worktree_git / "HEAD").write_text("ref: refs/heads/agent\n")
+            worktree = root / "wt"
+            worktree.mkdir()
+            (worktree / ".git").write_text("gitdir: ../.git/worktrees/wt\n")
             
-            assert status["total_agents"] == 5
\ No newline at end of file
+            assert SwarmCoordinator("test-project", worktree)._current_branch() == "agent"
+    
+    def test_active_project_lookup_skips_gitpython(self):
+        """Test that reading the active project does not load GitPython."""
+        import subprocess
+        import sys
+        
+        script = (
+            "import sys\n"
+            "from claude_swarm.core.coordinator import SwarmCoordinator\n"
+            "SwarmCoordinator.get_active_project()\n"
+            "assert 'git.repo' not in sys.modules\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = subprocess.run([sys.executable, "-c", script], cwd=temp_dir)
+            assert result.returncode == 0
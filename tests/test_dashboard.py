@@ -0,0 +1,276 @@
+"""Tests for the swarm dashboard."""
+
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from claude_swarm.evaluation import dashboard as dashboard_module
+from claude_swarm.evaluation.dashboard import SwarmDashboard, _ChangeHandler, _relative_date
+
+
+def _write_agents(dashboard: SwarmDashboard, branches) -> None:
+    """Write an agent registry with one agent per branch."""
+    registry = dashboard.project_dir / "registry"
+    registry.mkdir(parents=True)
+    lines = ["agent_id,branch_name,worktree_path,status,tasks_assigned,tasks_completed,last_commit,last_update"]
+    lines += [f"agent-{i},{branch},/tmp/agent-{i},active,0,0,," for i, branch in enumerate(branches, 1)]
+    (registry / "agents.csv").write_text("\n".join(lines) + "\n")
+
+
+class TestSwarmDashboard:
+    """Test cases for SwarmDashboard."""
+    
+    def test_get_agent_status(self, git_repo):
+        """Test commit counts and last commit times for agent branches."""
+        repo = git_repo()
+        repo.git("checkout", "-b", "swarm-agent-test-project-1")
+        repo.git("commit", "--allow-empty", "-m", "Agent work 1")
+        repo.git("commit", "--allow-empty", "-m", "Agent work 2")
+        repo.git("checkout", "main")
+        repo.git("branch", "swarm-agent-test-project-2")
+        repo.git("commit", "--allow-empty", "-m", "Main moves on")
+        
+        dashboard = SwarmDashboard("test-project", repo.path)
+        _write_agents(dashboard, [
+            "swarm-agent-test-project-1",
+            "swarm-agent-test-project-2",
+            "swarm-agent-test-project-3",
+        ])
+        
+        agents = dashboard._get_agent_status()
+        
+        assert [a['commits'] for a in agents] == [2, 0, 0]
+        assert 'ago' in agents[0]['last_commit']
+        assert agents[2]['last_commit'] == 'Never'
+        assert agents[0]['status'] == 'active'
+        assert 'worktree_path' not in agents[0]
+        
+        # Cached counts are refreshed when a branch moves
+        repo.git("checkout", "swarm-agent-test-project-2")
+        repo.git("commit", "--allow-empty", "-m", "Agent 2 work")
+        assert [a['commits'] for a in dashboard._get_agent_status()] == [2, 1, 0]
+    
+    def test_get_recent_activity(self, git_repo):
+        """Test that recent commits on agent branches are listed oldest first."""
+        repo = git_repo()
+        repo.git("checkout", "-b", "swarm-agent-test-project-1")
+        repo.git("commit", "--allow-empty", "-m", "First | piped \x1f message",
+                 "--date", "2000-01-01T00:00:00")
+        repo.git("checkout", "-b", "swarm-agent-test-project-2", "main")
+        repo.git("commit", "--allow-empty", "-m", "Second")
+        repo.git("checkout", "-b", "other-branch", "main")
+        repo.git("commit", "--allow-empty", "-m", "Not an agent")
+        
+        dashboard = SwarmDashboard("test-project", repo.path)
+        activity = dashboard._get_recent_activity()
+        
+        messages = [a['message'] for a in activity]
+        assert "Not an agent" not in messages
+        assert messages.index("First | piped \x1f message") < messages.index("Second")
+        assert {a['branch'] for a in activity if a['message'] != "Initial commit"} == {
+            "swarm-agent-test-project-1", "swarm-agent-test-project-2"
+        }
+    
+    def test_commit_graph_written_in_background(self, monkeypatch, git_repo):
+        """Test that commit-graph layers are written off the refresh path, at most once per interval."""
+        repo = git_repo()
+        chain = repo.path / ".git" / "objects" / "info" / "commit-graphs" / "commit-graph-chain"
+        
+        dashboard = SwarmDashboard("test-project", repo.path)
+        assert not chain.exists()
+        assert repo.git("config", "--local", "--list").stdout.count("commitgraph") == 0
+        
+        dashboard._update_commit_graph()
+        first = dashboard._graph_proc
+        dashboard._update_commit_graph()
+        assert dashboard._graph_proc is first
+        first.wait()
+        assert chain.exists()
+        
+        dashboard._update_commit_graph()
+        assert dashboard._graph_proc is None  # Within the interval
+        
+        monkeypatch.setattr(dashboard_module, "COMMIT_GRAPH_INTERVAL", 0)
+        repo.git("commit", "--allow-empty", "-m", "More work")
+        dashboard._update_commit_graph()
+        assert dashboard._graph_proc is not first
+        dashboard.close()
+        assert dashboard._graph_proc is None
+    
+    def test_task_status_reparsed_only_on_change(self, git_repo):
+        """Test that task counts are cached until tasks.csv changes."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        tasks_file = dashboard.project_dir / "registry" / "tasks.csv"
+        tasks_file.parent.mkdir(parents=True)
+        header = "task_id,description,category,complexity,dependencies,assigned_agent,status,start_time,end_time,commits\n"
+        tasks_file.write_text(header + "TASK-0001,Build API,backend,low,,agent-1,pending,,,\n")
+        
+        first = dashboard._get_task_status()
+        assert first['pending'] == 1
+        cached = dashboard._read_cache['tasks']
+        assert dashboard._get_task_status() == first
+        assert dashboard._read_cache['tasks'] is cached
+        
+        # Callers get copies and cannot corrupt the cached counts
+        first['pending'] = 0
+        first['by_agent']['agent-1']['assigned'] = 5
+        first['by_agent'].clear()
+        assert dashboard._get_task_status() == {
+            'total': 1, 'pending': 1, 'in_progress': 0, 'completed': 0, 'blocked': 0,
+            'by_agent': {'agent-1': {'assigned': 1, 'completed': 0}}
+        }
+        
+        tasks_file.write_text(header + "TASK-0001,Build API,backend,low,,agent-1,completed,,,\n")
+        second = dashboard._get_task_status()
+        assert second['completed'] == 1
+        assert second['by_agent']['agent-1'] == {'assigned': 1, 'completed': 1}
+    
+    def test_blockers_reloaded_when_files_change(self, git_repo):
+        """Test that blockers are re-read after a blocker file is added or removed."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        blockers_dir = dashboard.coord_dir / "blockers"
+        blockers_dir.mkdir(parents=True)
+        assert dashboard._get_blockers() == []
+        
+        blocker_file = blockers_dir / "BLOCKER-agent-1-1.json"
+        blocker_file.write_text('{"id": "BLOCKER-agent-1-1", "status": "open"}')
+        assert [b['id'] for b in dashboard._get_blockers()] == ["BLOCKER-agent-1-1"]
+        
+        blocker_file.unlink()
+        assert dashboard._get_blockers() == []
+    
+    def test_agent_table_reused_until_cells_change(self, git_repo):
+        """Test that the agent table renderable is rebuilt only when its rows change."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        agents = [{'agent_id': 'agent-1', 'branch_name': 'swarm-agent-test-project-1',
+                   'commits': 2, 'last_commit': '5 minutes ago'}]
+        task_stats = {'by_agent': {'agent-1': {'assigned': 3, 'completed': 1}}}
+        
+        table = dashboard._create_agent_table(agents, task_stats)
+        assert table.row_count == 1
+        assert dashboard._create_agent_table([dict(agents[0])], task_stats) is table
+        
+        agents[0]['commits'] = 3
+        assert dashboard._create_agent_table(agents, task_stats) is not table
+    
+    def test_change_handler_ignores_reads(self):
+        """Test that only writes to watched files trigger a refresh."""
+        changed = threading.Event()
+        handler = _ChangeHandler(changed, names=('packed-refs',))
+        
+        handler.dispatch(SimpleNamespace(event_type='opened', src_path='/repo/.git/packed-refs'))
+        handler.dispatch(SimpleNamespace(event_type='modified', src_path='/repo/.git/index'))
+        assert not changed.is_set()
+        
+        handler.dispatch(SimpleNamespace(
+            event_type='moved', src_path='/repo/.git/packed-refs.lock', dest_path='/repo/.git/packed-refs'
+        ))
+        assert changed.is_set()
+    
+    def test_active_agents_use_commit_timestamps(self, git_repo):
+        """Test that agents count as active by commit age, including very recent commits."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        now = time.time()
+        agents = [
+            {'agent_id': 'agent-1', 'commits': 1, 'last_commit': '10 seconds ago', 'last_commit_ts': now - 10},
+            {'agent_id': 'agent-2', 'commits': 1, 'last_commit': '2 hours ago', 'last_commit_ts': now - 7200},
+            {'agent_id': 'agent-3', 'commits': 0, 'last_commit': 'Never', 'last_commit_ts': None},
+        ]
+        task_stats = {'total': 0, 'completed': 0}
+        
+        assert dashboard._calculate_metrics(agents, task_stats)['active_agents'] == 1
+        
+        metrics = dashboard._calculate_metrics(agents, task_stats)
+        cached = dashboard._metrics
+        metrics['total_agents'] = 0
+        assert dashboard._calculate_metrics(list(agents), dict(task_stats))['total_agents'] == 3
+        assert dashboard._metrics is cached
+        
+        agents[1]['last_commit_ts'] = now
+        assert dashboard._calculate_metrics(agents, task_stats)['active_agents'] == 2
+    
+    def test_status_summary_skips_gitpython_and_rich(self, git_repo):
+        """Test that a status summary loads neither GitPython nor Rich."""
+        repo = git_repo()
+        code = (
+            "import sys\n"
+            "from claude_swarm.evaluation.dashboard import SwarmDashboard\n"
+            f"dashboard = SwarmDashboard('test-project', {str(repo.path)!r})\n"
+            "assert dashboard._git_common_dir() == dashboard.repo_root / '.git'\n"
+            "dashboard.get_status_summary()\n"
+            "assert 'git.repo' not in sys.modules\n"
+            "assert 'rich.console' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
+    def test_status_summary(self, git_repo):
+        """Test the summary built from the concurrently collected status."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        _write_agents(dashboard, ["swarm-agent-test-project-1", "swarm-agent-test-project-2"])
+        
+        summary = dashboard.get_status_summary()
+        
+        assert summary['agents'] == {'total': 2, 'active': 0}
+        assert summary['tasks']['total'] == 0
+        assert summary['blockers'] == 0
+        
+        summary['tasks']['total'] = 7
+        summary['metrics']['total_agents'] = 0
+        again = dashboard.get_status_summary()
+        dashboard.close()
+        assert again['tasks']['total'] == 0
+        assert again['metrics']['total_agents'] == 2
+    
+    def test_branch_heads_reuse_one_git_process(self, git_repo):
+        """Test that branch heads come from a single long-lived git cat-file process."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        
+        heads = dashboard._get_branch_heads(["main", "missing"])
+        process = dashboard._cat_file._process
+        assert set(heads) == {"main"}
+        assert heads["main"][0] == repo.git("rev-parse", "main").stdout.strip()
+        assert heads["main"][1].endswith("ago")
+        
+        repo.git("commit", "--allow-empty", "-m", "More work")
+        assert heads["main"][0] != dashboard._get_branch_heads(["main"])["main"][0]
+        assert dashboard._cat_file._process is process
+        
+        dashboard.close()
+        assert process.poll() is not None
+    
+    def test_relative_date_matches_git(self):
+        """Test relative dates against git's own wording."""
+        now = 1_700_000_000
+        assert _relative_date(now - 1, now) == "1 second ago"
+        assert _relative_date(now - 89, now) == "89 seconds ago"
+        assert _relative_date(now - 90, now) == "2 minutes ago"
+        assert _relative_date(now - 36 * 3600, now) == "2 days ago"
+        assert _relative_date(now - 400 * 86400, now) == "1 year, 1 month ago"
+    
+    def test_generate_layout_reuses_unchanged_panel(self, git_repo):
+        """Test that an unchanged frame reuses the panel and only updates the header."""
+        repo = git_repo()
+        dashboard = SwarmDashboard("test-project", repo.path)
+        _write_agents(dashboard, ["swarm-agent-test-project-1"])
+        
+        panel = dashboard._generate_layout()
+        header = panel.renderable.renderables[0]
+        header.plain = "stale"
+        
+        assert dashboard._generate_layout() is panel
+        assert header.plain.startswith("📊 CLAUDE SWARM DASHBOARD")
+        
+        (dashboard.coord_dir / "blockers").mkdir(parents=True)
+        (dashboard.coord_dir / "blockers" / "BLOCKER-agent-1-1.json").write_text(
+            '{"id": "BLOCKER-agent-1-1", "agent_id": "agent-1", "title": "Stuck", "status": "open"}'
+        )
+        assert dashboard._generate_layout() is not panel
+        dashboard.close()
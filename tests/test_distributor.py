@@ -0,0 +1,123 @@
+"""Tests for the task distributor."""
+
+import tempfile
+from pathlib import Path
+
+from claude_swarm.core.distributor import Agent, TaskDistributor, coffman_graham_order
+from claude_swarm.core.planner import Task, TaskPlanner
+
+
+def _make_distributor(temp_dir: str, num_agents: int, tasks) -> TaskDistributor:
+    """Build a distributor with in-memory tasks and agents."""
+    distributor = TaskDistributor("test-project", Path(temp_dir))
+    distributor.tasks = tasks
+    distributor.agents = [
+        Agent(
+            agent_id=f"agent-{i}",
+            branch_name=f"swarm-agent-test-project-{i}",
+            worktree_path=str(Path(temp_dir) / f"agent-{i}")
+        )
+        for i in range(1, num_agents + 1)
+    ]
+    return distributor
+
+
+class TestTaskDistributor:
+    """Test cases for TaskDistributor."""
+    
+    def test_assign_tasks(self):
+        """Test that every task is assigned and load is spread."""
+        tasks = [
+            Task(task_id=f"TASK-{i:04d}", description=f"Task {i}", estimated_time=60)
+            for i in range(1, 9)
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            distributor = _make_distributor(temp_dir, 4, tasks)
+            distributor._assign_tasks()
+            
+            assert all(t.assigned_agent for t in distributor.tasks)
+            assert [a.total_time for a in distributor.agents] == [120, 120, 120, 120]
+    
+    def test_dependent_tasks_go_to_other_agents(self):
+        """Test that a task is not given to the agent holding its dependency."""
+        tasks = [
+            Task(task_id="TASK-0001", description="Build API"),
+            Task(task_id="TASK-0002", description="Test API", dependencies=["TASK-0001"]),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            distributor = _make_distributor(temp_dir, 2, tasks)
+            distributor._assign_tasks()
+            
+            assert tasks[0].assigned_agent != tasks[1].assigned_agent
+    
+    def test_transitive_dependencies_go_to_other_agents(self):
+        """Test that indirect dependencies also keep tasks apart."""
+        tasks = [
+            Task(task_id="TASK-0001", description="Schema", estimated_time=0),
+            Task(task_id="TASK-0002", description="Models", dependencies=["TASK-0001"]),
+            Task(task_id="TASK-0003", description="API", dependencies=["TASK-0002"]),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            distributor = _make_distributor(temp_dir, 2, tasks)
+            distributor._compute_transitive_deps(tasks)
+            agent = distributor.agents[0]
+            distributor._assign_task_to_agent(tasks[0], agent)
+            
+            assert distributor._transitive_deps["TASK-0003"] == 0b011
+            assert distributor._can_assign_task(tasks[1], distributor.agents[1])
+            assert not distributor._can_assign_task(tasks[2], agent)
+    
+    def test_generate_agent_instructions(self):
+        """Test that instructions are written to the project and existing worktrees."""
+        tasks = [
+            Task(task_id="TASK-0001", description="Build API"),
+            Task(task_id="TASK-0002", description="Write docs"),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            distributor = _make_distributor(temp_dir, 2, tasks)
+            (distributor.project_dir / "tasks").mkdir(parents=True)
+            Path(distributor.agents[0].worktree_path).mkdir()
+            
+            distributor._assign_tasks()
+            distributor._generate_agent_instructions()
+            
+            instructions = (distributor.project_dir / "tasks" / "agent-1_instructions.md").read_text()
+            assert "AGENT-1" in instructions
+            assert "TASK-0001: Build API" in instructions
+            
+            swarm_dir = Path(distributor.agents[0].worktree_path) / ".swarm"
+            assert (swarm_dir / "agent_instructions.md").read_text() == instructions
+            assert (swarm_dir / "tasks.md").read_text().startswith("# Tasks for AGENT-1")
+            assert (distributor.project_dir / "tasks" / "agent-2_instructions.md").exists()
+            assert not Path(distributor.agents[1].worktree_path).exists()
+    
+    def test_coffman_graham_order_puts_chains_first(self):
+        """Test that the head of a dependency chain is scheduled before loose tasks."""
+        tasks = [
+            Task(task_id="TASK-0001", description="Docs", priority="high"),
+            Task(task_id="TASK-0002", description="Schema"),
+            Task(task_id="TASK-0003", description="Models", dependencies=["TASK-0002"]),
+            Task(task_id="TASK-0004", description="API", dependencies=["TASK-0003"]),
+        ]
+        
+        ordered = coffman_graham_order(tasks, key=lambda t: (len(t.dependencies), t.priority != "high"))
+        
+        assert [t.task_id for t in ordered] == ["TASK-0002", "TASK-0003", "TASK-0001", "TASK-0004"]
+        assert coffman_graham_order(tasks[:2], key=lambda t: t.priority != "high") == tasks[:2]
+    
+    def test_load_task_plan(self):
+        """Test loading the tasks of a saved plan."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            planner = TaskPlanner("test-project", Path(temp_dir))
+            planner._add_task("Build API", "backend")
+            planner._add_task("Write docs", "docs", dependencies=["TASK-0001"])
+            planner._save_task_plan(planner._create_task_plan())
+            
+            distributor = TaskDistributor("test-project", Path(temp_dir))
+            distributor._load_task_plan()
+            
+            assert distributor.tasks == planner.tasks
@@ -0,0 +1,81 @@
+"""Tests for the git worktree utilities."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from git.exc import GitCommandError
+
+from claude_swarm.utils.git import GitWorktreeManager
+
+
+class TestGitWorktreeManager:
+    """Test cases for GitWorktreeManager."""
+    
+    def test_list_worktrees(self, git_repo, tmp_path, monkeypatch):
+        """Test that linked and detached worktrees are listed with their fields."""
+        repo = git_repo()
+        repo.git("worktree", "add", "-b", "agent-1", str(tmp_path / "agent one"))
+        repo.git("worktree", "add", "--detach", str(tmp_path / "agent-2"))
+        
+        worktrees = GitWorktreeManager(repo.path).list_worktrees()
+        
+        assert [Path(w['path']).name for w in worktrees] == ["repo", "agent one", "agent-2"]
+        assert [w.get('branch') for w in worktrees] == ["refs/heads/main", "refs/heads/agent-1", None]
+        assert all(len(w['head']) == 40 for w in worktrees)
+        
+        # git before 2.36 rejects -z; the newline format is parsed instead
+        manager = GitWorktreeManager(repo.path)
+        worktree = manager.repo.git.worktree
+        
+        def old_worktree(*args):
+            if '-z' in args:
+                raise GitCommandError(['git', 'worktree', *args], 129)
+            return worktree(*args)
+        
+        monkeypatch.setattr(manager, "repo", SimpleNamespace(git=SimpleNamespace(worktree=old_worktree)))
+        assert manager.list_worktrees() == worktrees
+    
+    def test_get_last_commit_info(self, git_repo):
+        """Test that the last commit's fields are read from one log call."""
+        repo = git_repo()
+        repo.git("-c", "user.name=Agent One", "commit", "--allow-empty", "-m", "feat: add API")
+        
+        manager = GitWorktreeManager(repo.path)
+        info = manager.get_last_commit_info("main")
+        
+        assert info['message'] == "feat: add API"
+        assert info['author'] == "Agent One"
+        assert info['time'].endswith("ago")
+        assert len(info['hash']) >= 7
+        assert manager.get_last_commit_info("missing") is None
+    
+    def test_branch_exists_tracks_new_and_deleted_branches(self, git_repo, tmp_path):
+        """Test that the cached ref list is refreshed when branches change."""
+        repo = git_repo()
+        repo.git("pack-refs", "--all")
+        
+        manager = GitWorktreeManager(repo.path)
+        assert manager.branch_exists("main")
+        assert not manager.branch_exists("main", remote=True)
+        assert not manager.branch_exists("agent-1")
+        
+        assert manager.create_worktree(tmp_path / "agent-1", "agent-1")
+        assert manager.branch_exists("agent-1")
+        
+        assert manager.remove_worktree(tmp_path / "agent-1")
+        assert manager.delete_branch("agent-1", force=True)
+        assert not manager.branch_exists("agent-1")
+    
+    def test_get_branch_changes_keeps_unusual_names(self, git_repo):
+        """Test that changed paths with spaces and non-ASCII characters are returned verbatim."""
+        repo = git_repo()
+        repo.git("checkout", "-b", "agent-1")
+        (repo.path / "notes café.md").write_text("notes\n")
+        (repo.path / "app.py").write_text("app\n")
+        repo.git("add", ".")
+        repo.git("commit", "-m", "Add files")
+        
+        manager = GitWorktreeManager(repo.path)
+        
+        assert manager.get_branch_changes("agent-1") == ["app.py", "notes café.md"]
+        assert manager.get_branch_changes("main") == []
@@ -0,0 +1,66 @@
+"""Tests for the shared helpers."""
+
+import os
+import shutil
+
+from claude_swarm.utils.helpers import (
+    ensure_directory, git_dir_for, topological_order, write_file_safe, write_files
+)
+
+
+class TestHelpers:
+    """Test cases for the helper functions."""
+    
+    def test_ensure_directory_recreates_removed_directory(self, tmp_path):
+        """Test that a directory removed after being ensured is created again."""
+        path = tmp_path / "a" / "b"
+        
+        assert ensure_directory(path) == path
+        shutil.rmtree(tmp_path / "a")
+        ensure_directory(path)
+        
+        assert path.is_dir()
+    
+    def test_write_file_safe_creates_parents(self, tmp_path):
+        """Test that missing parent directories are created on write."""
+        path = tmp_path / "nested" / "file.txt"
+        
+        assert write_file_safe(path, "content")
+        assert path.read_text() == "content"
+    
+    def test_write_files_finishes_short_writes(self, tmp_path, monkeypatch):
+        """Test that a file is completed when os.write writes only part of it."""
+        real_write = os.write
+        monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:3]))
+        path = tmp_path / "file.txt"
+        path.write_bytes(b"old content that is longer")
+        
+        write_files([(path, b"new content")])
+        
+        assert path.read_bytes() == b"new content"
+    
+    def test_git_dir_for_follows_worktree_pointers(self, tmp_path):
+        """Test that linked worktrees resolve to their own and the common git directory."""
+        main_git = tmp_path / "main" / ".git"
+        worktree_git = main_git / "worktrees" / "wt"
+        worktree_git.mkdir(parents=True)
+        (worktree_git / "commondir").write_text("../..\n")
+        
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git}\n")
+        
+        assert git_dir_for(tmp_path / "main") == main_git
+        assert git_dir_for(worktree) == worktree_git.resolve()
+        assert git_dir_for(worktree, common=True) == main_git.resolve()
+        assert git_dir_for(tmp_path) is None
+    
+    def test_topological_order(self):
+        """Test FIFO and keyed Kahn ordering and the nodes left in a cycle."""
+        edges = [("a", "c"), ("b", "c"), ("a", "c"), ("c", "d")]
+        
+        assert topological_order("dcba", edges) == (["b", "a", "c", "d"], [])
+        assert topological_order("abcd", edges, key={"a": 1, "b": 0, "c": 0, "d": 0}.get) == (
+            ["b", "a", "c", "d"], []
+        )
+        assert topological_order("abc", [("a", "b"), ("b", "a")]) == (["c"], ["a", "b"])
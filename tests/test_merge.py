@@ -0,0 +1,301 @@
+"""Tests for the smart merger."""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from claude_swarm.merge import strategies
+from claude_swarm.merge.strategies import SmartMerger
+
+
+# Every test repository starts with a README on main
+_README = {"README.md": "# Project\n"}
+
+
+def _commit_file(repo, branch: str, name: str) -> None:
+    """Commit a change to ``name`` on a new branch off main."""
+    repo.git("checkout", "-b", branch, "main")
+    (repo.path / name).write_text(f"{branch}\n")
+    repo.git("add", name)
+    repo.git("commit", "-m", f"Change {name} on {branch}")
+    repo.git("checkout", "main")
+
+
+class TestSmartMerger:
+    """Test cases for SmartMerger."""
+    
+    def test_predict_conflicts(self, git_repo):
+        """Test that files changed on several branches are reported in branch order."""
+        repo = git_repo(files=_README)
+        branches = [f"swarm-agent-test-project-{i}" for i in range(1, 5)]
+        for branch in branches[:3]:
+            _commit_file(repo, branch, "shared.py")
+        _commit_file(repo, branches[3], "own.py")
+        
+        merger = SmartMerger("test-project", repo.path)
+        conflicts = merger._predict_conflicts(branches + ["missing-branch"])
+        
+        assert conflicts == [{
+            'file': "shared.py",
+            'branches': branches[:3],
+            'severity': 'high'
+        }]
+    
+    def test_predict_conflicts_ignores_edits_that_merge_cleanly(self, git_repo):
+        """Test that branches editing different parts of a file are not reported."""
+        repo = git_repo(files=_README)
+        lines = [f"line {i}\n" for i in range(20)]
+        (repo.path / "app.py").write_text("".join(lines))
+        repo.git("add", "app.py")
+        repo.git("commit", "-m", "Add app")
+        
+        edits = {"top": 1, "bottom": 18, "also-top": 1}
+        for branch, line in edits.items():
+            repo.git("checkout", "-b", branch, "main")
+            changed = list(lines)
+            changed[line] = f"{branch}\n"
+            (repo.path / "app.py").write_text("".join(changed))
+            repo.git("commit", "-am", f"Edit app on {branch}")
+            repo.git("checkout", "main")
+        
+        merger = SmartMerger("test-project", repo.path)
+        
+        assert merger._predict_conflicts(["top", "bottom"]) == []
+        assert merger._predict_conflicts(list(edits)) == [{
+            'file': "app.py",
+            'branches': ["top", "also-top"],
+            'severity': 'medium'
+        }]
+    
+    def test_predict_conflicts_merges_each_branch_once(self, git_repo, monkeypatch):
+        """Test that branches are trial-merged in turn rather than pair by pair."""
+        repo = git_repo(files=_README)
+        lines = [f"line {i}\n" for i in range(40)]
+        (repo.path / "app.py").write_text("".join(lines))
+        repo.git("add", "app.py")
+        repo.git("commit", "-m", "Add app")
+        
+        branches = [f"edit-{i}" for i in range(8)]
+        for i, branch in enumerate(branches):
+            repo.git("checkout", "-b", branch, "main")
+            changed = list(lines)
+            changed[i * 5] = f"{branch}\n"
+            (repo.path / "app.py").write_text("".join(changed))
+            repo.git("commit", "-am", f"Edit app on {branch}")
+            repo.git("checkout", "main")
+        
+        merger = SmartMerger("test-project", repo.path)
+        trials = []
+        trial_merge = merger._trial_merge
+        monkeypatch.setattr(merger, "_trial_merge", lambda *args: trials.append(args) or trial_merge(*args))
+        
+        assert merger._predict_conflicts(branches) == []
+        assert len(trials) == len(branches) - 1
+    
+    def test_agent_branches_listed_once(self, git_repo):
+        """Test that remote agent branches are cached until refreshed."""
+        repo = git_repo(files=_README)
+        head = repo.git("rev-parse", "HEAD").stdout.strip()
+        repo.git("update-ref", "refs/remotes/origin/swarm-agent-test-project-1", head)
+        repo.git("update-ref", "refs/remotes/origin/other-branch", head)
+        
+        merger = SmartMerger("test-project", repo.path)
+        assert merger._get_agent_branches() == ["swarm-agent-test-project-1"]
+        
+        repo.git("update-ref", "refs/remotes/origin/swarm-agent-test-project-2", head)
+        assert merger._get_agent_branches() == ["swarm-agent-test-project-1"]
+        
+        merger.refresh()
+        assert merger._get_agent_branches() == [
+            "swarm-agent-test-project-1", "swarm-agent-test-project-2"
+        ]
+    
+    def test_analyze_dependencies_merges_dependencies_first(self, git_repo):
+        """Test that a branch is merged after the branches its tasks depend on."""
+        repo = git_repo(files=_README)
+        head = repo.git("rev-parse", "HEAD").stdout.strip()
+        for i in (1, 2, 3):
+            repo.git("update-ref", f"refs/remotes/origin/swarm-agent-test-project-{i}", head)
+        
+        merger = SmartMerger("test-project", repo.path)
+        registry = merger.project_dir / "registry"
+        registry.mkdir(parents=True)
+        (registry / "tasks.csv").write_text(
+            "task_id,description,assigned_agent,dependencies\n"
+            "TASK-0001,API,agent-1,TASK-0002\n"
+            "TASK-0002,Schema,agent-3,\n"
+            "TASK-0003,Docs,agent-2,TASK-0001\n"
+        )
+        
+        assert merger._analyze_dependencies() == [
+            "swarm-agent-test-project-3",
+            "swarm-agent-test-project-1",
+            "swarm-agent-test-project-2",
+        ]
+    
+    def test_execute_merge_predicts_conflicts_in_merge_order(self, git_repo, monkeypatch):
+        """Test that conflicts are predicted in dependency order, not refname order."""
+        repo = git_repo(files=_README)
+        head = repo.git("rev-parse", "HEAD").stdout.strip()
+        for i in (1, 2):
+            repo.git("update-ref", f"refs/remotes/origin/swarm-agent-test-project-{i}", head)
+        
+        merger = SmartMerger("test-project", repo.path)
+        registry = merger.project_dir / "registry"
+        registry.mkdir(parents=True)
+        (registry / "tasks.csv").write_text(
+            "task_id,description,assigned_agent,dependencies\n"
+            "TASK-0001,API,agent-1,TASK-0002\n"
+            "TASK-0002,Schema,agent-2,\n"
+        )
+        
+        calls = {}
+        monkeypatch.setattr(merger, "_predict_conflicts", lambda b: calls.update(predict=b) or [])
+        monkeypatch.setattr(merger, "_merge_branches", lambda b, c, v: calls.update(merge=b) or len(b))
+        monkeypatch.setattr(merger, "_create_merge_branch", lambda: "merge-branch")
+        monkeypatch.setattr(merger, "_run_tests", lambda: True)
+        monkeypatch.setattr(merger, "_generate_merge_report", lambda: None)
+        
+        assert merger.execute_merge()['success']
+        assert calls["predict"] == calls["merge"] == [
+            "swarm-agent-test-project-2",
+            "swarm-agent-test-project-1",
+        ]
+    
+    def test_merge_order_cached_until_registry_changes(self, monkeypatch, tmp_path):
+        """Test that an unchanged task registry is not parsed again."""
+        registry = tmp_path / "tasks.csv"
+        registry.write_text(
+            "task_id,assigned_agent,dependencies\n"
+            "TASK-0001,agent-1,TASK-0002\n"
+            "TASK-0002,agent-2,\n"
+        )
+        assert strategies._agent_merge_order(registry) == ["agent-2", "agent-1"]
+        
+        sorts = []
+        sort = strategies.topological_order
+        monkeypatch.setattr(strategies, "topological_order", lambda *args: sorts.append(args) or sort(*args))
+        assert strategies._agent_merge_order(registry) == ["agent-2", "agent-1"]
+        assert sorts == []
+        
+        registry.write_text(
+            "task_id,assigned_agent,dependencies\n"
+            "TASK-0001,agent-1,\n"
+        )
+        stat = registry.stat()
+        os.utime(registry, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert strategies._agent_merge_order(registry) == ["agent-1"]
+        assert len(sorts) == 1
+    
+    def test_merge_branch_resolves_docs_and_aborts_on_code(self, git_repo):
+        """Test that doc conflicts take the incoming side and code conflicts abort."""
+        repo = git_repo(files=_README)
+        (repo.path / "app.py").write_text("base\n")
+        repo.git("add", "app.py")
+        repo.git("commit", "-m", "Add app")
+        for branch in ("docs", "code"):
+            _commit_file(repo, branch, "README.md" if branch == "docs" else "app.py")
+        (repo.path / "README.md").write_text("main\n")
+        (repo.path / "app.py").write_text("main\n")
+        repo.git("commit", "-am", "Change on main")
+        repo.git("config", "user.email", "test@example.com")
+        repo.git("config", "user.name", "Test")
+        
+        merger = SmartMerger("test-project", repo.path)
+        assert merger._merge_branch("docs")
+        assert (repo.path / "README.md").read_text() == "docs\n"
+        
+        assert not merger._merge_branch("code")
+        assert not merger._in_merge()
+        assert (repo.path / "app.py").read_text() == "main\n"
+        assert repo.git("status", "--porcelain").stdout == ""
+        assert [c['resolved'] for c in merger.conflicts] == [True, False]
+    
+    def test_generate_merge_report(self, git_repo):
+        """Test that the report summarizes branches, conflicts and the log."""
+        repo = git_repo(files=_README)
+        head = repo.git("rev-parse", "HEAD").stdout.strip()
+        repo.git("update-ref", "refs/remotes/origin/swarm-agent-test-project-1", head)
+        
+        merger = SmartMerger("test-project", repo.path)
+        merger.project_dir.mkdir(parents=True)
+        merger.conflicts = [{'branch': "swarm-agent-test-project-1", 'files': ["a.md", "b.py"], 'resolved': False}]
+        merger._generate_merge_report()
+        
+        report = next((merger.project_dir / "reports").glob("merge_report_*.md")).read_text()
+        assert "- Total branches to merge: 1\n" in report
+        assert "- Auto-resolved conflicts: 0\n" in report
+        assert "### swarm-agent-test-project-1\n**Files with conflicts:**\n- a.md\n- b.py\n**Resolved**: No\n" in report
+        assert report.endswith("\n## Merge Log\n```\n\n```\n")
+    
+    def test_merge_log_is_bounded(self, monkeypatch, git_repo):
+        """Test that only the most recent log lines are kept."""
+        repo = git_repo(files=_README)
+        monkeypatch.setattr(strategies, "MERGE_LOG_LIMIT", 3)
+        
+        merger = SmartMerger("test-project", repo.path)
+        for i in range(5):
+            merger._log(f"step {i}")
+        
+        assert [line.split("] ", 2)[-1] for line in merger.merge_log] == ["step 2", "step 3", "step 4"]
+        assert merger.merge_log[0].startswith(f"[{merger._log_stamp}] [INFO] ")
+    
+    def test_merge_branches_speculatively_until_a_conflict(self, git_repo):
+        """Test that clean merges are built in memory and conflicts use the working tree."""
+        repo = git_repo(files=_README)
+        repo.git("config", "user.email", "test@example.com")
+        repo.git("config", "user.name", "Test")
+        _commit_file(repo, "api", "api.py")
+        _commit_file(repo, "docs", "README.md")
+        _commit_file(repo, "models", "models.py")
+        _commit_file(repo, "more-docs", "README.md")
+        repo.git("checkout", "-b", "merge")
+        
+        merger = SmartMerger("test-project", repo.path)
+        merged = merger._merge_branches(["api", "docs", "more-docs", "models", "api"], [])
+        
+        assert merged == 5
+        log = repo.git("log", "--first-parent", "--format=%s", "main..merge").stdout.split("\n")
+        assert log[:4] == [
+            "feat: merge models", "feat: merge more-docs", "feat: merge docs", "feat: merge api"
+        ]
+        assert (repo.path / "README.md").read_text() == "more-docs\n"
+        assert (repo.path / "models.py").read_text() == "models\n"
+        assert repo.git("status", "--porcelain").stdout == ""
+        assert not merger._in_merge()
+    
+    def test_execute_merge_async(self, git_repo):
+        """Test that merges of several projects can be awaited together."""
+        mergers = [SmartMerger(name, git_repo(name, files=_README).path) for name in ("one", "two")]
+        
+        async def gather():
+            return await asyncio.gather(*(m.execute_merge_async() for m in mergers))
+        
+        results = asyncio.run(gather())
+        
+        assert [r['error'] for r in results] == ['No agent branches found to merge'] * 2
+    
+    def test_execute_merge_async_serializes_one_working_tree(self, git_repo, monkeypatch):
+        """Test that merges of projects sharing a repository never overlap."""
+        repo = git_repo(files=_README)
+        mergers = [SmartMerger(name, repo.path) for name in ("one", "two", "three")]
+        running = []
+        overlaps = []
+        
+        def execute_merge(self, strategy="smart", verbose=False):
+            overlaps.append(bool(running))
+            running.append(self.project_name)
+            time.sleep(0.05)
+            running.remove(self.project_name)
+            return {'success': True}
+        
+        monkeypatch.setattr(SmartMerger, "execute_merge", execute_merge)
+        # Enough workers for the merges to overlap if nothing serialized them
+        monkeypatch.setattr(strategies, "_MERGE_POOL", ThreadPoolExecutor(max_workers=3))
+        
+        async def gather():
+            return await asyncio.gather(*(m.execute_merge_async() for m in mergers))
+        
+        assert [r['success'] for r in asyncio.run(gather())] == [True] * 3
+        assert overlaps == [False] * 3
@@ -1,31 +1,33 @@
 """Tests for the task planner."""
 
-import json
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from claude_swarm.core.planner import TaskPlanner, Task
+from claude_swarm.core.planner import TaskPlanner, Task, topological_sort
+
+_JSON_REQUIREMENTS = """[
+    {"description": "Create user model", "category": "backend", "complexity": "medium"},
+    {"description": "Add authentication endpoints", "category": "api", "complexity": "high"}
+]"""
+
+
+@pytest.fixture
+def planner(tmp_path):
+    """Create a planner working in a fresh temporary directory."""
+    return TaskPlanner("test-project", tmp_path)
 
 
 class TestTaskPlanner:
     """Test cases for TaskPlanner."""
     
-    def test_init(self):
+    def test_init(self, planner):
         """Test TaskPlanner initialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            assert planner.project_name == "test-project"
-            assert planner.tasks == []
-            assert planner.task_id_counter == 1
+        assert planner.project_name == "test-project"
+        assert planner.tasks == []
+        assert planner.task_id_counter == 1
     
-    def test_parse_markdown_requirements(self):
+    def test_parse_markdown_requirements(self, planner):
         """Test parsing markdown requirements."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            
-            markdown_content = """
+        markdown_content = """
 # Project Requirements
 
 ## User Management
@@ -39,88 +41,63 @@ class TestTaskPlanner:
 
 TODO: Add rate limiting
 """
-            
-            planner._parse_markdown_requirements(markdown_content)
-            
-            # Should have created tasks
-            assert len(planner.tasks) == 5  # 3 user management + 2 api docs + 1 TODO
-            
-            # Check task categories
-            categories = [task.category for task in planner.tasks]
-            assert "user_management" in categories
-            assert "api_documentation" in categories
-            
-            # Check TODO task has high priority
-            todo_tasks = [task for task in planner.tasks if task.priority == "high"]
-            assert len(todo_tasks) == 1
+        
+        planner._parse_markdown_requirements(markdown_content)
+        
+        # Should have created tasks
+        assert len(planner.tasks) == 5  # 3 user management + 2 api docs + 1 TODO
+        
+        # Check task categories
+        categories = [task.category for task in planner.tasks]
+        assert "user_management" in categories
+        assert "api_documentation" in categories
+        
+        # Check TODO task has high priority
+        todo_tasks = [task for task in planner.tasks if task.priority == "high"]
+        assert len(todo_tasks) == 1
     
-    def test_parse_json_requirements(self):
+    def test_parse_json_requirements(self, planner):
         """Test parsing JSON requirements."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            
-            json_content = json.dumps([
-                {
-                    "description": "Create user model",
-                    "category": "backend",
-                    "complexity": "medium"
-                },
-                {
-                    "description": "Add authentication endpoints",
-                    "category": "api",
-                    "complexity": "high"
-                }
-            ])
-            
-            planner._parse_json_requirements(json_content)
-            
-            assert len(planner.tasks) == 2
-            assert planner.tasks[0].description == "Create user model"
-            assert planner.tasks[0].category == "backend"
-            assert planner.tasks[0].complexity == "medium"
+        planner._parse_json_requirements(_JSON_REQUIREMENTS)
+        
+        assert len(planner.tasks) == 2
+        assert planner.tasks[0].description == "Create user model"
+        assert planner.tasks[0].category == "backend"
+        assert planner.tasks[0].complexity == "medium"
     
-    def test_estimate_complexity(self):
+    def test_estimate_complexity(self, planner):
         """Test complexity estimation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            
-            # High complexity
-            assert planner._estimate_complexity("Refactor the entire authentication system") == "high"
-            assert planner._estimate_complexity("Design distributed architecture") == "high"
-            
-            # Low complexity
-            assert planner._estimate_complexity("Fix typo in README") == "low"
-            assert planner._estimate_complexity("Update documentation") == "low"
-            
-            # Medium complexity (default)
-            assert planner._estimate_complexity("Implement user profile page") == "medium"
+        # High complexity
+        assert planner._estimate_complexity("Refactor the entire authentication system") == "high"
+        assert planner._estimate_complexity("Design distributed architecture") == "high"
+        
+        # Low complexity
+        assert planner._estimate_complexity("Fix typo in README") == "low"
+        assert planner._estimate_complexity("Update documentation") == "low"
+        
+        # Medium complexity (default)
+        assert planner._estimate_complexity("Implement user profile page") == "medium"
     
-    def test_estimate_time(self):
+    def test_estimate_time(self, planner):
         """Test time estimation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            
-            assert planner._estimate_time("low") == 30
-            assert planner._estimate_time("medium") == 90
-            assert planner._estimate_time("high") == 180
+        assert planner._estimate_time("low") == 30
+        assert planner._estimate_time("medium") == 90
+        assert planner._estimate_time("high") == 180
     
-    def test_extract_required_skills(self):
+    def test_extract_required_skills(self, planner):
         """Test skill extraction."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            
-            # API-related task
-            skills = planner._extract_required_skills("Create REST API endpoints for user management")
-            assert "api" in skills
-            assert "backend" in skills
-            
-            # Frontend task
-            skills = planner._extract_required_skills("Design React components for UI")
-            assert "frontend" in skills
-            
-            # Database task
-            skills = planner._extract_required_skills("Create database schema and migrations")
-            assert "database" in skills
+        # API-related task
+        skills = planner._extract_required_skills("Create REST API endpoints for user management")
+        assert "api" in skills
+        assert "backend" in skills
+        
+        # Frontend task
+        skills = planner._extract_required_skills("Design React components for UI")
+        assert "frontend" in skills
+        
+        # Database task
+        skills = planner._extract_required_skills("Create database schema and migrations")
+        assert "database" in skills
     
     def test_task_model_validation(self):
         """Test Task model validation."""
@@ -143,12 +120,65 @@ TODO: Add rate limiting
                 priority="normal"
             )
     
-    def test_analyze_requirements_integration(self):
+    def test_analyze_dependencies_from_descriptions(self, planner):
+        """Test that tasks mentioned after 'after'/'depends on' become dependencies."""
+        planner._add_task("Build api", "backend")
+        planner._add_task("Write docs", "docs")
+        planner._add_task("Deploy after build api and write docs", "devops")
+        planner._add_task("Polish UI", "frontend")
+        
+        planner._analyze_dependencies()
+        
+        assert planner.tasks[2].dependencies == ["TASK-0001", "TASK-0002"]
+        assert planner.tasks[0].dependencies == []
+        assert planner.tasks[3].dependencies == []
+    
+    def test_optimize_task_order_respects_dependencies(self, planner):
+        """Test that tasks are ordered after their dependencies."""
+        planner.tasks = [
+            Task(task_id="TASK-0001", description="Deploy", dependencies=["TASK-0003", "TASK-0002"]),
+            Task(task_id="TASK-0002", description="Test", dependencies=["TASK-0003"]),
+            Task(task_id="TASK-0003", description="Build", dependencies=["TASK-9999"]),
+            Task(task_id="TASK-0004", description="Docs", priority="low"),
+        ]
+        
+        planner._optimize_task_order()
+        
+        assert [t.task_id for t in planner.tasks] == [
+            "TASK-0004", "TASK-0003", "TASK-0002", "TASK-0001"
+        ]
+    
+    def test_topological_sort_keeps_cyclic_tasks(self):
+        """Test that tasks in a dependency cycle are still returned."""
+        tasks = [
+            Task(task_id="TASK-0001", description="A", dependencies=["TASK-0002"]),
+            Task(task_id="TASK-0002", description="B", dependencies=["TASK-0001"]),
+            Task(task_id="TASK-0003", description="C"),
+        ]
+        
+        ordered = topological_sort(tasks, key=lambda t: len(t.dependencies))
+        
+        assert [t.task_id for t in ordered] == ["TASK-0003", "TASK-0001", "TASK-0002"]
+    
+    def test_task_plan_csv_quotes_descriptions(self, planner):
+        """Test that descriptions containing commas survive the CSV export."""
+        import csv
+        
+        planner._add_task("Add login, logout and signup", "auth")
+        planner._save_task_plan(planner._create_task_plan())
+        
+        csv_file = planner.project_dir / "tasks" / "task_plan.csv"
+        with open(csv_file, newline='') as f:
+            rows = list(csv.DictReader(f))
+        
+        assert rows[0]['description'] == "Add login, logout and signup"
+        assert rows[0]['category'] == "auth"
+    
+    def test_analyze_requirements_integration(self, tmp_path):
         """Test the complete analyze_requirements workflow."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a temporary requirements file
-            req_file = Path(temp_dir) / "requirements.md"
-            req_file.write_text("""
+        # Create a temporary requirements file
+        req_file = tmp_path / "requirements.md"
+        req_file.write_text("""
 # E-Commerce API
 
 ## User Management
@@ -159,17 +189,17 @@ TODO: Add rate limiting
 - CRUD operations for products
 - Product search
 """)
-            
-            planner = TaskPlanner("test-project", Path(temp_dir))
-            task_plan = planner.analyze_requirements(req_file)
-            
-            # Check task plan
-            assert task_plan.project_name == "test-project"
-            assert task_plan.total_tasks > 0
-            assert len(task_plan.tasks) == task_plan.total_tasks
-            
-            # Check summary
-            summary = planner.get_summary()
-            assert "total_tasks" in summary
-            assert "total_time" in summary
-            assert "complexity_breakdown" in summary
\ No newline at end of file
+        
+        planner = TaskPlanner("test-project", tmp_path)
+        task_plan = planner.analyze_requirements(req_file)
+        
+        # Check task plan
+        assert task_plan.project_name == "test-project"
+        assert task_plan.total_tasks > 0
+        assert len(task_plan.tasks) == task_plan.total_tasks
+        
+        # Check summary
+        summary = planner.get_summary()
+        assert "total_tasks" in summary
+        assert "total_time" in summary
+        assert "complexity_breakdown" in summary
\ No newline at end of file
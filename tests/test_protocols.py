@@ -0,0 +1,294 @@
+"""Tests for the communication protocols."""
+
+import asyncio
+import tempfile
+from pathlib import Path
+
+from claude_swarm.communication.protocols import (
+    AgentCommunicator,
+    Blocker,
+    CommunicationCoordinator,
+    Message,
+)
+
+
+class TestCommunicationCoordinator:
+    """Test cases for CommunicationCoordinator."""
+    
+    def test_post_and_resolve_blocker(self):
+        """Test posting a blocker and resolving it."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            
+            blocker_id = coordinator.post_blocker(
+                "agent-1", "TASK-0001", "Missing schema", "Schema not defined", "1 task blocked"
+            )
+            
+            open_blockers = coordinator.get_blockers('open')
+            assert [b.id for b in open_blockers] == [blocker_id]
+            assert coordinator.get_blockers('resolved') == []
+            
+            assert coordinator.resolve_blocker(blocker_id, "Schema added")
+            
+            assert coordinator.get_blockers('open') == []
+            resolved = coordinator.get_blockers('resolved')
+            assert len(resolved) == 1
+            assert resolved[0].resolution == "Schema added"
+    
+    def test_resolved_blockers_are_archived(self):
+        """Test resolved blockers move out of the blockers directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            blockers_dir = coordinator.coord_dir / "blockers"
+            
+            resolved_id = coordinator.post_blocker("agent-1", "TASK-0001", "Old", "Old", "None")
+            open_id = coordinator.post_blocker("agent-2", "TASK-0002", "New", "New", "None")
+            coordinator.resolve_blocker(resolved_id, "Fixed")
+            
+            assert not (blockers_dir / f"{resolved_id}.json").exists()
+            assert (blockers_dir / "archive.ndjson").exists()
+            assert [b.id for b in coordinator.get_blockers('open')] == [open_id]
+            assert [b.id for b in coordinator.get_blockers('resolved')] == [resolved_id]
+            assert "# Old" in coordinator.render_blocker_markdown(resolved_id)
+            assert not coordinator.resolve_blocker(resolved_id, "Again")
+    
+    def test_messages_filtered_by_agent_and_status(self):
+        """Test message retrieval and read tracking."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            
+            msg_id = coordinator.send_message("agent-1", "agent-2", "Hello", "Body")
+            coordinator.send_message("agent-1", "agent-3", "Other", "Body")
+            
+            messages = coordinator.get_messages("agent-2")
+            assert [m.id for m in messages] == [msg_id]
+            
+            assert coordinator.mark_message_read(msg_id)
+            assert coordinator.get_messages("agent-2") == []
+            assert [m.id for m in coordinator.get_messages("agent-2", "read")] == [msg_id]
+    
+    def test_unchanged_files_served_from_cache(self, monkeypatch):
+        """Test that repeated scans do not re-open unchanged files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            coordinator.share_resource("agent-1", "logger", "src/log.py", "Logger", "log()")
+            
+            assert len(coordinator.get_shared_resources()) == 1
+            
+            def fail_read(*args, **kwargs):
+                raise AssertionError("file should have been cached")
+            
+            monkeypatch.setattr(Path, "read_bytes", fail_read)
+            monkeypatch.setattr(Path, "read_text", fail_read)
+            resources = coordinator.get_shared_resources()
+            monkeypatch.undo()
+            
+            assert [r.name for r in resources] == ["logger"]
+    
+    def test_cached_entities_returned_as_copies(self):
+        """Test that mutating a returned model does not change later reads."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            coordinator.post_blocker("agent-1", "TASK-0001", "Title", "Desc", "None")
+            coordinator.send_message("agent-1", "agent-2", "Hello", "Body")
+            coordinator.share_resource("agent-1", "logger", "src/log.py", "Logger", "log()")
+            
+            coordinator.get_blockers()[0].title = "X"
+            coordinator.get_messages("agent-2")[0].subject = "X"
+            coordinator.get_shared_resources()[0].used_by.append("agent-2")
+            
+            assert coordinator.get_blockers()[0].title == "Title"
+            assert coordinator.get_messages("agent-2")[0].subject == "Hello"
+            assert coordinator.get_shared_resources()[0].used_by == []
+    
+    def test_index_seeded_from_existing_files(self):
+        """Test that entity files written before the index existed are kept."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            first = coordinator.send_message("agent-1", "agent-2", "First", "Body")
+            
+            index_file = coordinator.coord_dir / "messages.db"
+            index_file.unlink()
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            assert index_file.exists()
+            assert [m.id for m in coordinator.get_messages("agent-2")] == [first]
+            
+            second = coordinator.send_message("agent-3", "agent-2", "Second", "Body")
+            assert {m.id for m in coordinator.get_messages("agent-2")} == {first, second}
+    
+    def test_unindexed_messages_added_to_index(self):
+        """Test that message files arriving after the index was built are picked up."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            first = coordinator.send_message("agent-1", "agent-2", "First", "Body")
+            assert [m.id for m in coordinator.get_messages("agent-2")] == [first]
+            
+            # Written by a client that does not know about the sqlite index
+            pulled = Message(id="MSG-1-agent-3-agent-2", from_agent="agent-3",
+                             to_agent="agent-2", subject="Pulled", body="Body")
+            (coordinator.coord_dir / "messages" / f"{pulled.id}.json").write_text(
+                pulled.model_dump_json()
+            )
+            
+            assert {m.id for m in coordinator.get_messages("agent-2")} == {first, pulled.id}
+            assert coordinator.mark_message_read(pulled.id)
+            assert [m.id for m in coordinator.get_messages("agent-2")] == [first]
+    
+    def test_unindexed_files_added_to_index(self):
+        """Test that blocker files arriving without an index record are picked up."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            first = coordinator.post_blocker("agent-1", "TASK-0001", "First", "Desc", "None")
+            resolved = coordinator.post_blocker("agent-3", "TASK-0002", "Old", "Desc", "None")
+            stale = (coordinator.coord_dir / "blockers" / f"{resolved}.json").read_bytes()
+            coordinator.resolve_blocker(resolved, "Fixed")
+            assert [b.id for b in coordinator.get_blockers()] == [first]
+            
+            # e.g. pulled through git from another agent's worktree
+            pulled = Blocker(
+                id="BLOCKER-agent-2-999", agent_id="agent-2", task_id="TASK-0003",
+                title="Pulled", description="Desc", impact="None"
+            )
+            blockers_dir = coordinator.coord_dir / "blockers"
+            (blockers_dir / f"{pulled.id}.json").write_text(pulled.model_dump_json())
+            # A resolved blocker whose file was left behind stays resolved
+            (blockers_dir / f"{resolved}.json").write_bytes(stale)
+            
+            assert {b.id for b in coordinator.get_blockers()} == {first, pulled.id}
+            assert b'"Pulled"' in (blockers_dir / "index.ndjson").read_bytes()
+            
+            fresh = CommunicationCoordinator("test-project", Path(temp_dir))
+            assert {b.id for b in fresh.get_blockers()} == {first, pulled.id}
+    
+    def test_async_getters(self):
+        """Test the asyncio variants of the channel getters."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            coordinator.post_blocker("agent-1", "TASK-0001", "Title", "Description", "Impact")
+            coordinator.send_message("agent-1", "agent-2", "Hello", "Body")
+            
+            async def gather():
+                return await asyncio.gather(
+                    coordinator.get_blockers_async(),
+                    coordinator.get_messages_async("agent-2")
+                )
+            
+            blockers, messages = asyncio.run(gather())
+            assert len(blockers) == 1
+            assert len(messages) == 1
+    
+    def test_markdown_rendered_on_demand(self):
+        """Test that markdown copies are opt-in and can be rendered later."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir), write_markdown=False)
+            blocker_id = coordinator.post_blocker("agent-1", "TASK-0001", "Title", "Description", "Impact")
+            
+            assert not (coordinator.coord_dir / "blockers" / f"{blocker_id}.md").exists()
+            
+            markdown = coordinator.render_blocker_markdown(blocker_id)
+            assert markdown.startswith("# Title\n\n**Agent**: agent-1\n")
+            assert coordinator.render_blocker_markdown("BLOCKER-missing") is None
+            
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir), write_markdown=True)
+            coordinator.share_resource("agent-1", "logger", "src/log.py", "Logger", "log()")
+            md_file = coordinator.coord_dir / "shared" / "SHARED-logger.md"
+            assert md_file.read_text() == coordinator.render_resource_markdown("logger")
+    
+    def test_legacy_datetime_fields_converted(self):
+        """Test that files with ISO datetimes load into nanosecond fields."""
+        blocker = Blocker.model_validate({
+            'id': "BLOCKER-agent-1-1",
+            'agent_id': "agent-1",
+            'task_id': "TASK-0001",
+            'title': "Title",
+            'description': "Description",
+            'impact': "Impact",
+            'created_at': "2024-01-01 00:00:00",
+            'resolved_at': None
+        })
+        
+        assert blocker.created_at_ns == 1704067200 * 10**9
+        assert blocker.created_at.year == 2024
+        assert blocker.resolved_at is None
+    
+    def test_coordination_summary(self):
+        """Test the coordination summary counts."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            blocker_id = coordinator.post_blocker("agent-1", "TASK-0001", "First", "Description", "Impact")
+            coordinator.post_blocker("agent-2", "TASK-0002", "Second", "Description", "Impact")
+            coordinator.resolve_blocker(blocker_id, "Done")
+            coordinator.share_resource("agent-1", "logger", "src/log.py", "Logger", "log()")
+            
+            summary = coordinator.get_coordination_summary()
+            
+            assert summary['blockers']['open'] == 1
+            assert summary['blockers']['resolved'] == 1
+            assert summary['blockers']['list'][0]['title'] == "Second"
+            assert summary['shared_resources'][0]['name'] == "logger"
+
+    
+    def test_cached_messages_skip_stat(self, monkeypatch):
+        """Test that unchanged messages are served without re-loading their files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            coordinator.send_message("agent-1", "agent-2", "Hello", "Body")
+            assert len(coordinator.get_messages("agent-2")) == 1
+            
+            def fail_load(*args, **kwargs):
+                raise AssertionError("message should have been cached")
+            
+            monkeypatch.setattr(CommunicationCoordinator, "_load_entity", fail_load)
+            messages = coordinator.get_messages("agent-2")
+            monkeypatch.undo()
+            
+            assert [m.subject for m in messages] == ["Hello"]
+    
+    def test_directory_scan_loads_in_parallel(self):
+        """Test the directory-scan fallback on a batch large enough for the pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            for i in range(20):
+                coordinator.share_resource("agent-1", f"util{i}", f"src/util{i}.py", "Util", "use()")
+            
+            (coordinator.coord_dir / "shared" / "index.ndjson").unlink()
+            (coordinator.coord_dir / "shared" / "SHARED-broken.json").write_text("{")
+            
+            resources = coordinator.get_shared_resources()
+            assert sorted(r.name for r in resources) == sorted(f"util{i}" for i in range(20))
+    
+    def test_mark_read_appends_delta(self):
+        """Test that reading a message leaves its file alone and survives a re-index."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            msg_id = coordinator.send_message("agent-1", "agent-2", "Hello", "Body")
+            msg_file = coordinator.coord_dir / "messages" / f"{msg_id}.json"
+            original = msg_file.read_bytes()
+            
+            assert coordinator.mark_message_read(msg_id)
+            assert not coordinator.mark_message_read("MSG-missing")
+            assert msg_file.read_bytes() == original
+            
+            read = coordinator.get_messages("agent-2", "read")
+            assert [m.id for m in read] == [msg_id]
+            assert read[0].read_at is not None
+            
+            (coordinator.coord_dir / "messages.db").unlink()
+            coordinator = CommunicationCoordinator("test-project", Path(temp_dir))
+            assert coordinator.get_messages("agent-2") == []
+            assert [m.read_at_ns for m in coordinator.get_messages("agent-2", "read")] == [read[0].read_at_ns]
+
+
+class TestAgentCommunicator:
+    """Test cases for AgentCommunicator."""
+    
+    def test_agents_share_coordinator(self):
+        """Test that agents of one project share a coordinator."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sender = AgentCommunicator("agent-1", "test-project", Path(temp_dir))
+            receiver = AgentCommunicator("agent-2", "test-project", temp_dir)
+            
+            assert sender.coordinator is receiver.coordinator
+            
+            sender.send_message("agent-2", "Hello", "Body")
+            assert [m.subject for m in receiver.check_messages()] == ["Hello"]